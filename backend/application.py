@@ -0,0 +1,1192 @@
+from anyio import to_thread
+from contextlib import asynccontextmanager
+from fastapi import APIRouter, BackgroundTasks, Depends, FastAPI, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, PlainTextResponse, StreamingResponse
+from fastapi.staticfiles import StaticFiles
+from pydantic import BaseModel, EmailStr, Field, ValidationError, field_validator
+from pymongo import MongoClient
+from bson import ObjectId
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional
+from datetime import datetime, timedelta
+import base64
+import codecs
+import csv
+import hashlib
+import heapq
+import io
+import json
+import os
+import threading
+import time
+from dotenv import load_dotenv
+from compression import CompressionMiddleware
+from events import EventBroker
+from metrics import Metrics, MetricsMiddleware
+from profiling import ProfiledRepository, ProfiledRoute, ProfilingMiddleware
+from repositories import BucketedMongoRepository, DuplicateRecordError, MongoRepository, SQLiteRepository, STORAGE_ERRORS
+
+load_dotenv()
+
+# The HRMS Lite API. main.py (local), main_prod.py (Render) and api/index.py (Vercel)
+# each build their app with create_app; everything they share lives here. Each app keeps its
+# settings, repository, employee cache and live feed in an AppState on app.state, which the
+# routes read through the request.
+
+def env_flag(name: str) -> bool:
+    return os.getenv(name, "").lower() in ("1", "true", "yes")
+
+def env_list(name: str, default: list) -> list:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+@dataclass
+class Settings:
+    # Database: MongoDB by default, or the bundled SQLite file with storage_backend="sqlite"
+    storage_backend: str = "mongo"
+    mongodb_uri: str = "mongodb://localhost:27017/"
+    mongodb_max_pool_size: int = 100
+    # Builds the client from mongodb_uri and pool options; the tests pass an in-memory stand-in (mongomock.MongoClient)
+    mongo_client: Callable[..., MongoClient] = MongoClient
+    # With MongoDB, attendance is stored one document per mark ("rows") or per employee and month ("monthly")
+    attendance_layout: str = "rows"
+    sqlite_path: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "db.sqlite3")
+    db_threadpool_size: int = 40
+    employee_cache_size: int = 10000
+    employee_cache_ttl: float = 300
+    employee_cache_change_stream: bool = False
+    list_edge_cache_seconds: int = 0
+    # List ETags count the writes this process sees, which is every write only for a single process or
+    # with events_change_stream. Otherwise they also roll over every this many seconds, bounding how long
+    # a poll can get a 304 after another worker's write; 0 trusts the write counts alone
+    list_etag_max_stale_seconds: float = 5
+    purge_batch_size: int = 1000
+    # List endpoints skip response_model validation and encode with orjson
+    fast_json_responses: bool = False
+    # Response compression, in order of preference; encodings whose package is missing are skipped
+    compression_encodings: List[str] = field(default_factory=lambda: ["zstd", "br", "gzip"])
+    compression_minimum_size: int = 1000
+    compression_level: int = 6
+    # Prometheus metrics at GET /metrics, including MongoDB command and pool checkout timings
+    metrics_enabled: bool = False
+    # Live change feed at GET /api/events. With events_change_stream, a MongoDB change stream publishes
+    # every worker's writes; otherwise each worker publishes the writes it handles
+    events_queue_size: int = 1000
+    events_history_size: int = 1000
+    events_heartbeat_seconds: float = 15
+    events_change_stream: bool = False
+    # GET /api/sync holds back changes younger than this, so a write that commits after a later-numbered
+    # one (from another worker) is not skipped
+    sync_settle_seconds: float = 1.0
+    # Requests sent with an X-Profile header holding profile_token, or this fraction of all requests,
+    # get a Server-Timing breakdown; with profile_dir set, a cProfile trace is also written there
+    profiling_enabled: bool = False
+    profile_token: Optional[str] = None
+    profile_sample_rate: float = 0.0
+    profile_dir: Optional[str] = None
+    environment: str = "development"
+    # Serve this React build from "/" alongside the API
+    frontend_build_path: Optional[str] = None
+    cors_origins: List[str] = field(default_factory=lambda: [
+        "https://hrms-lite-drab.vercel.app",
+        "https://hrms-lite-git-main-r1sh4bh81s-projects.vercel.app",
+        "https://hrms-lite-9cb9.vercel.app",
+        "http://localhost:3000",
+    ])
+
+    @classmethod
+    def from_env(cls, **overrides) -> "Settings":
+        defaults = cls()
+        values = {
+            "storage_backend": os.getenv("STORAGE_BACKEND", defaults.storage_backend),
+            "mongodb_uri": os.getenv("MONGODB_URI", defaults.mongodb_uri),
+            "mongodb_max_pool_size": int(os.getenv("MONGODB_MAX_POOL_SIZE", defaults.mongodb_max_pool_size)),
+            "attendance_layout": os.getenv("ATTENDANCE_LAYOUT", defaults.attendance_layout),
+            "sqlite_path": os.getenv("SQLITE_PATH", defaults.sqlite_path),
+            "db_threadpool_size": int(os.getenv("DB_THREADPOOL_SIZE", defaults.db_threadpool_size)),
+            "employee_cache_size": int(os.getenv("EMPLOYEE_CACHE_SIZE", defaults.employee_cache_size)),
+            "employee_cache_ttl": float(os.getenv("EMPLOYEE_CACHE_TTL", defaults.employee_cache_ttl)),
+            "employee_cache_change_stream": env_flag("EMPLOYEE_CACHE_CHANGE_STREAM"),
+            "list_edge_cache_seconds": int(os.getenv("LIST_EDGE_CACHE_SECONDS", defaults.list_edge_cache_seconds)),
+            "list_etag_max_stale_seconds": float(os.getenv("LIST_ETAG_MAX_STALE_SECONDS", defaults.list_etag_max_stale_seconds)),
+            "purge_batch_size": int(os.getenv("PURGE_BATCH_SIZE", defaults.purge_batch_size)),
+            "fast_json_responses": env_flag("FAST_JSON_RESPONSES"),
+            "compression_encodings": env_list("COMPRESSION_ENCODINGS", defaults.compression_encodings),
+            "compression_minimum_size": int(os.getenv("COMPRESSION_MINIMUM_SIZE", defaults.compression_minimum_size)),
+            "compression_level": int(os.getenv("COMPRESSION_LEVEL", defaults.compression_level)),
+            "metrics_enabled": env_flag("METRICS_ENABLED"),
+            "events_queue_size": int(os.getenv("EVENTS_QUEUE_SIZE", defaults.events_queue_size)),
+            "events_history_size": int(os.getenv("EVENTS_HISTORY_SIZE", defaults.events_history_size)),
+            "events_heartbeat_seconds": float(os.getenv("EVENTS_HEARTBEAT_SECONDS", defaults.events_heartbeat_seconds)),
+            "events_change_stream": env_flag("EVENTS_CHANGE_STREAM"),
+            "sync_settle_seconds": float(os.getenv("SYNC_SETTLE_SECONDS", defaults.sync_settle_seconds)),
+            "profiling_enabled": env_flag("PROFILING_ENABLED"),
+            "profile_token": os.getenv("PROFILE_TOKEN", defaults.profile_token),
+            "profile_sample_rate": float(os.getenv("PROFILE_SAMPLE_RATE", defaults.profile_sample_rate)),
+            "profile_dir": os.getenv("PROFILE_DIR", defaults.profile_dir),
+            "environment": os.getenv("NODE_ENV", defaults.environment),
+        }
+        values.update(overrides)
+        return cls(**values)
+
+# Route handlers that touch the database are plain `def`, so FastAPI runs their
+# blocking pymongo calls in its worker thread pool instead of on the event loop
+def configure_threadpool(settings: Settings):
+    to_thread.current_default_thread_limiter().total_tokens = settings.db_threadpool_size
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    state = app.state.hrms
+    configure_threadpool(state.settings)
+    state.repository.connect()
+    if state.repository.supports_change_streams:
+        if state.settings.employee_cache_change_stream:
+            threading.Thread(target=watch_employee_changes, args=(state,), daemon=True).start()
+        if state.settings.events_change_stream:
+            threading.Thread(target=watch_live_events, args=(state,), daemon=True).start()
+    elif state.settings.employee_cache_change_stream or state.settings.events_change_stream:
+        print(f"The {state.settings.storage_backend} backend has no change streams; each worker sees only its own writes")
+    yield
+
+# Route functions are timed separately from their validation and encoding when a request is profiled
+router = APIRouter(route_class=ProfiledRoute)
+
+def connect_repository(settings: Settings):
+    if settings.storage_backend == "sqlite":
+        return SQLiteRepository(settings.sqlite_path)
+    listeners = metrics.event_listeners() if settings.metrics_enabled else []
+    client = settings.mongo_client(settings.mongodb_uri, maxPoolSize=settings.mongodb_max_pool_size, event_listeners=listeners)
+    if settings.attendance_layout == "monthly":
+        return BucketedMongoRepository(client["hrms_lite"])
+    return MongoRepository(client["hrms_lite"])
+
+# One set of metrics per process, filled by MetricsMiddleware and the MongoClient listeners
+# when settings.metrics_enabled; apps built by create_app all report into it
+metrics = Metrics()
+
+# Pydantic models
+class EmployeeCreate(BaseModel):
+    employeeId: str = Field(..., min_length=1)
+    fullName: str = Field(..., min_length=1)
+    email: EmailStr
+    department: str = Field(..., min_length=1)
+
+class EmployeeResponse(BaseModel):
+    id: str
+    employeeId: str
+    fullName: str
+    email: str
+    department: str
+    createdAt: datetime
+
+class EmployeeImportError(BaseModel):
+    line: int
+    employeeId: Optional[str] = None
+    detail: str
+
+class EmployeeImportResponse(BaseModel):
+    created: int
+    failed: int
+    errors: List[EmployeeImportError]
+
+class AttendanceCreate(BaseModel):
+    employeeId: str
+    # Stored as given, so it must be a real YYYY-MM-DD day: rollups and buckets key on its prefix
+    date: str = Field(..., pattern=r"^\d{4}-\d{2}-\d{2}$")
+    status: str = Field(..., pattern="^(Present|Absent)$")
+
+    @field_validator("date")
+    @classmethod
+    def check_calendar_day(cls, value: str) -> str:
+        datetime.strptime(value, "%Y-%m-%d")
+        return value
+
+class AttendanceResponse(BaseModel):
+    id: str
+    employeeId: str
+    employeeName: Optional[str]
+    date: str
+    status: str
+    createdAt: datetime
+
+class AttendanceBulkResult(BaseModel):
+    employeeId: str
+    date: str
+    result: str
+    id: Optional[str] = None
+
+class AttendanceBulkResponse(BaseModel):
+    created: int
+    duplicates: int
+    unknownEmployees: int
+    results: List[AttendanceBulkResult]
+
+class AttendanceCounts(BaseModel):
+    present: int
+    absent: int
+    total: int
+    attendanceRate: float
+
+class EmployeeAttendanceSummary(AttendanceCounts):
+    employeeId: str
+    employeeName: Optional[str]
+    department: Optional[str]
+
+class DepartmentAttendanceSummary(AttendanceCounts):
+    department: str
+
+class DailyAttendanceSummary(AttendanceCounts):
+    date: str
+
+class AttendanceSummaryResponse(BaseModel):
+    employees: List[EmployeeAttendanceSummary]
+    departments: List[DepartmentAttendanceSummary]
+    days: List[DailyAttendanceSummary]
+
+class EmployeeChanges(BaseModel):
+    upserted: List[EmployeeResponse]
+    deleted: List[str]
+
+class AttendanceChanges(BaseModel):
+    upserted: List[AttendanceResponse]
+    deleted: List[str]
+
+class SyncResponse(BaseModel):
+    employees: EmployeeChanges
+    attendance: AttendanceChanges
+    next: str
+    hasMore: bool
+
+# Helper function to convert ObjectId to string
+def employee_helper(employee) -> dict:
+    return {
+        "id": str(employee["_id"]),
+        "employeeId": employee["employeeId"],
+        "fullName": employee["fullName"],
+        "email": employee["email"],
+        "department": employee["department"],
+        "createdAt": employee["createdAt"]
+    }
+
+def attendance_helper(attendance) -> dict:
+    return {
+        "id": str(attendance["_id"]),
+        "employeeId": attendance["employeeId"],
+        "employeeName": attendance.get("employeeName"),
+        "date": attendance["date"],
+        "status": attendance["status"],
+        "createdAt": attendance["createdAt"]
+    }
+
+def duplicate_employee_detail(field: str) -> str:
+    return "Email already exists" if field == "email" else "Employee ID already exists"
+
+# Employee directory cache: employees are read on every attendance write and listing
+# but rarely change, so lookups by employeeId are served from a bounded LRU with a TTL
+class EmployeeCache:
+    def __init__(self, repository, max_size: int, ttl: float):
+        self.repository = repository
+        self.max_size = max_size
+        self.ttl = ttl
+        self.entries = OrderedDict()
+        self.employee_ids = {}
+        self.lock = threading.Lock()
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.change_stream = False
+
+    # Only employees that exist are cached, so creating one never needs an invalidation
+    def get_many(self, employee_ids) -> dict:
+        found = {}
+        missing = []
+        now = time.monotonic()
+        with self.lock:
+            for employee_id in employee_ids:
+                entry = self.entries.get(employee_id)
+                if entry and entry[0] > now:
+                    self.entries.move_to_end(employee_id)
+                    found[employee_id] = entry[1]
+                else:
+                    missing.append(employee_id)
+            self.hits += len(found)
+            self.misses += len(missing)
+            generation = self.generation
+
+        if missing:
+            employees = self.repository.lookup_employees(missing)
+            with self.lock:
+                # Skip storing if an invalidation raced with the fetch
+                store = generation == self.generation
+                for employee in employees:
+                    found[employee["employeeId"]] = employee
+                    if store:
+                        self.store(employee, now + self.ttl)
+        return found
+
+    def get(self, employee_id: str) -> Optional[dict]:
+        return self.get_many([employee_id]).get(employee_id)
+
+    def store(self, employee: dict, expires: float):
+        self.entries[employee["employeeId"]] = (expires, employee)
+        self.entries.move_to_end(employee["employeeId"])
+        self.employee_ids[employee["_id"]] = employee["employeeId"]
+        while len(self.entries) > self.max_size:
+            _, (_, evicted) = self.entries.popitem(last=False)
+            self.employee_ids.pop(evicted["_id"], None)
+
+    def invalidate(self, employee_id: str):
+        with self.lock:
+            self.generation += 1
+            self.invalidations += 1
+            entry = self.entries.pop(employee_id, None)
+            if entry:
+                self.employee_ids.pop(entry[1]["_id"], None)
+
+    def invalidate_object_id(self, object_id):
+        with self.lock:
+            employee_id = self.employee_ids.get(object_id)
+        if employee_id:
+            self.invalidate(employee_id)
+
+    def clear(self):
+        with self.lock:
+            self.generation += 1
+            self.invalidations += 1
+            self.entries.clear()
+            self.employee_ids.clear()
+
+    def apply_change(self, change: dict):
+        operation = change["operationType"]
+        if operation == "insert":
+            self.invalidate(change["fullDocument"]["employeeId"])
+        elif operation in ("update", "replace", "delete"):
+            self.invalidate_object_id(change["documentKey"]["_id"])
+        else:
+            self.clear()
+
+    def stats(self) -> dict:
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self.entries),
+                "maxSize": self.max_size,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hitRate": self.hits / lookups if lookups else 0.0,
+                "invalidations": self.invalidations,
+                "changeStream": self.change_stream
+            }
+
+# What one app serves from. The repository connects on first use in each process (indexes are
+# created by `python migrate.py`, not on every cold start), and its calls are timed as db while
+# a request is profiled
+class AppState:
+    def __init__(self, settings: Settings):
+        self.settings = settings
+        self.repository = ProfiledRepository(lambda: connect_repository(settings))
+        self.employee_cache = EmployeeCache(self.repository, settings.employee_cache_size, settings.employee_cache_ttl)
+        self.live_events = EventBroker(settings.events_queue_size, settings.events_history_size)
+        # List ETags (see conditional_get)
+        self.instance_id = str(ObjectId())
+        self.collection_versions = {"employees": 0, "attendance": 0}
+        self.versions_lock = threading.Lock()
+
+# A coroutine, so that FastAPI does not send it to the thread pool like a plain def dependency
+async def app_state(request: Request) -> AppState:
+    return request.app.state.hrms
+
+# The command-line tools (migrate.py, rollups.py, generate_data.py, ...) work through this state,
+# configured from the environment; every app built by create_app has its own
+default_state = AppState(Settings.from_env())
+settings = default_state.settings
+repository = default_state.repository
+
+# Invalidate on writes made by other workers; without change stream support
+# (e.g. a standalone server) entries simply expire after the TTL
+def watch_employee_changes(state: AppState):
+    try:
+        with state.repository.watch_employees() as stream:
+            state.employee_cache.change_stream = True
+            for change in stream:
+                state.employee_cache.apply_change(change)
+                bump_version(state, "employees")
+    except Exception as e:
+        print(f"Employee change stream unavailable, relying on cache TTL: {e}")
+    state.employee_cache.change_stream = False
+    state.employee_cache.clear()
+
+# Writes are published by the handler that made them, unless a change stream is publishing everyone's
+def publish_change(state: AppState, kind: str, rows: list):
+    if not state.live_events.change_stream:
+        state.live_events.publish(kind, rows)
+
+# Change stream inserts carry the whole document, deletes only its _id. Employee deletes are read from
+# their tombstones, so they carry the employee ID like the ones delete_employee publishes
+def change_event(change) -> tuple:
+    if change["ns"]["coll"] == "tombstones":
+        tombstone = change["fullDocument"]
+        return "employee.deleted", {"id": tombstone["recordId"], "employeeId": tombstone["employeeId"]}
+    kind, helper = {"employees": ("employee", employee_helper), "attendance": ("attendance", attendance_helper)}[change["ns"]["coll"]]
+    if change["operationType"] == "delete":
+        return f"{kind}.deleted", {"id": str(change["documentKey"]["_id"])}
+    return f"{kind}.created", helper(change["fullDocument"])
+
+def watch_live_events(state: AppState):
+    try:
+        with state.repository.watch_changes() as stream:
+            state.live_events.change_stream = True
+            for change in stream:
+                kind, row = change_event(change)
+                # Every worker's writes arrive here, so list ETags see them too
+                bump_version(state, "employees" if kind.startswith("employee") else "attendance")
+                state.live_events.publish(kind, [row])
+    except Exception as e:
+        print(f"Change stream unavailable, publishing this worker's writes only: {e}")
+    state.live_events.change_stream = False
+
+# Fill in each record's current employee name, falling back to the name stored with it
+def join_employee_names(state: AppState, records: list) -> list:
+    employees = state.employee_cache.get_many({record["employeeId"] for record in records})
+    for record in records:
+        employee = employees.get(record["employeeId"])
+        if employee:
+            record["employeeName"] = employee["fullName"]
+    return records
+
+# Keyset pagination: cursors are the opaque, encoded sort key of the last row on a page
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+def encode_cursor(key: list) -> str:
+    return base64.urlsafe_b64encode(json.dumps(key).encode()).decode()
+
+def decode_cursor(cursor: str, size: int) -> list:
+    try:
+        key = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except ValueError:
+        key = None
+    if not isinstance(key, list) or len(key) != size or not all(isinstance(k, str) for k in key):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return key
+
+def page_size(limit: Optional[int], cursor: Optional[str]) -> Optional[int]:
+    if limit is None and cursor is None:
+        return None
+    return limit or DEFAULT_PAGE_SIZE
+
+def trim_page(docs: list, limit: int, response: Response, key) -> list:
+    if len(docs) > limit:
+        del docs[limit:]
+        response.headers["X-Next-Cursor"] = encode_cursor(key(docs[-1]))
+    return docs
+
+# Conditional GET: list responses carry an ETag built from per-collection versions
+# that every write in this process bumps, so an unchanged poll gets a 304 without a query.
+# Versions are per process: with several workers, a write handled elsewhere only reaches them
+# through the live event change stream, and without it tags expire after list_etag_max_stale_seconds
+def bump_version(state: AppState, *collections):
+    with state.versions_lock:
+        for name in collections:
+            state.collection_versions[name] += 1
+
+def list_etag(state: AppState, request: Request, collections: tuple) -> str:
+    versions = "-".join(str(state.collection_versions[name]) for name in collections)
+    max_stale = state.settings.list_etag_max_stale_seconds
+    if max_stale and not state.live_events.change_stream:
+        versions += f"-{int(time.time() // max_stale)}"
+    query = hashlib.sha1(repr(sorted(request.query_params.multi_items())).encode()).hexdigest()[:16]
+    return f'"{state.instance_id}-{versions}-{query}"'
+
+def conditional_get(state: AppState, request: Request, response: Response, *collections) -> Optional[Response]:
+    etag = list_etag(state, request, collections)
+    # Browsers revalidate every time; the Vercel edge may hold responses for a few seconds
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if state.settings.list_edge_cache_seconds:
+        headers["Vercel-CDN-Cache-Control"] = f"max-age={state.settings.list_edge_cache_seconds}"
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        if "*" in tags or etag in tags:
+            return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
+
+# Fast path for large listings: the helpers already build exactly the response rows, so
+# re-validating each one against the response model only costs time. Returning a response
+# directly skips that, and orjson encodes datetimes as the same ISO strings. Sparse rows
+# would not pass the response model, so they always take this path
+def list_response(state: AppState, rows: list, response: Response, sparse: bool = False):
+    if not (sparse or state.settings.fast_json_responses):
+        return rows
+    return ORJSONResponse(rows, headers=dict(response.headers))
+
+# Sparse fieldsets: `fields=employeeId,fullName` returns just those keys, in model order,
+# and only they (plus what paging and the name join need) are read from storage
+def parse_fields(fields: Optional[str], model) -> Optional[list]:
+    if fields is None:
+        return None
+    requested = {name.strip() for name in fields.split(",") if name.strip()}
+    unknown = sorted(requested - set(model.model_fields))
+    if unknown or not requested:
+        raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(unknown)}" if unknown else "No fields requested")
+    return [name for name in model.model_fields if name in requested]
+
+def stored_fields(fields: list, required: list) -> list:
+    names = ["_id" if name == "id" else name for name in fields]
+    for name in required:
+        if name not in names:
+            names.append(name)
+    return names
+
+def sparse_rows(documents: list, fields: list) -> list:
+    return [{name: str(doc["_id"]) if name == "id" else doc.get(name) for name in fields} for doc in documents]
+
+# Attendance filters, pushed down to the storage backend's (employeeId, date) index
+def attendance_filters(employeeId, department, status, date_from, date_to) -> dict:
+    return {"employeeId": employeeId, "department": department, "status": status, "date_from": date_from, "date_to": date_to}
+
+# Attendance export: rows are read from the cursor and joined with employee names a batch at a time
+EXPORT_BATCH_SIZE = 1000
+EXPORT_FIELDS = ["id", "employeeId", "employeeName", "date", "status", "createdAt"]
+
+def export_batches(records):
+    batch = []
+    for record in records:
+        batch.append(record)
+        if len(batch) == EXPORT_BATCH_SIZE:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+def stream_attendance_export(state: AppState, records, format: str):
+    if format == "csv":
+        yield ",".join(EXPORT_FIELDS) + "\r\n"
+    for batch in export_batches(records):
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for record in join_employee_names(state, batch):
+            row = attendance_helper(record)
+            row["createdAt"] = row["createdAt"].isoformat()
+            if format == "csv":
+                writer.writerow([row[field] for field in EXPORT_FIELDS])
+            else:
+                buffer.write(json.dumps(row) + "\n")
+        yield buffer.getvalue()
+
+# Employee routes
+@router.get("/api/employees", response_model=List[EmployeeResponse])
+def get_employees(
+    request: Request,
+    response: Response,
+    department: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+    state: AppState = Depends(app_state)
+):
+    repository = state.repository
+    fields = parse_fields(fields, EmployeeResponse)
+    after = None
+    if cursor:
+        try:
+            after = repository.parse_id(decode_cursor(cursor, 1)[0])
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    not_modified = conditional_get(state, request, response, "employees")
+    if not_modified:
+        return not_modified
+
+    size = page_size(limit, cursor)
+    stored = fields and stored_fields(fields, ["_id"] if size is not None else [])
+    if size is None:
+        employees = repository.find_employees(department, fields=stored)
+    else:
+        employees = repository.find_employees(department, after, size + 1, fields=stored)
+        trim_page(employees, size, response, lambda emp: [str(emp["_id"])])
+    if fields:
+        return list_response(state, sparse_rows(employees, fields), response, sparse=True)
+    return list_response(state, [employee_helper(emp) for emp in employees], response)
+
+@router.post("/api/employees", response_model=EmployeeResponse)
+def create_employee(employee: EmployeeCreate, state: AppState = Depends(app_state)):
+    # The unique employeeId and email indexes reject duplicates atomically
+    employee_dict = employee.model_dump()
+    employee_dict["createdAt"] = datetime.utcnow()
+    try:
+        state.repository.insert_employee(employee_dict)
+    except DuplicateRecordError as e:
+        raise HTTPException(status_code=400, detail=duplicate_employee_detail(e.field))
+    bump_version(state, "employees")
+    created = employee_helper(employee_dict)
+    publish_change(state, "employee.created", [created])
+    
+    return created
+
+# Attendance cleanup: a deleted employee's rows are removed after the response is sent,
+# a bounded batch at a time through the (employeeId, date) index
+def purge_attendance(state: AppState, employee_id: str, department: Optional[str], deleted_at: datetime,
+                     max_batches: Optional[int] = None) -> int:
+    removed = 0
+    batches = 0
+    while max_batches is None or batches < max_batches:
+        batch = state.repository.purge_attendance_batch(employee_id, deleted_at, state.settings.purge_batch_size)
+        if not batch:
+            break
+        # Without a department (long-orphaned rows) only the monthly rollup can be corrected here
+        if department:
+            update_rollups(state.repository, batch, {employee_id: department}, step=-1)
+        removed += len(batch)
+        batches += 1
+        bump_version(state, "attendance")
+
+    if department:
+        state.repository.delete_empty_rollups(employee_id, department)
+    return removed
+
+@router.delete("/api/employees/{employee_id}")
+def delete_employee(employee_id: str, background_tasks: BackgroundTasks, state: AppState = Depends(app_state)):
+    try:
+        employee_key = state.repository.parse_id(employee_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid employee ID format")
+    
+    deleted = state.repository.delete_employee(employee_key)
+    
+    if deleted is None:
+        raise HTTPException(status_code=404, detail="Employee not found")
+    state.employee_cache.invalidate(deleted["employeeId"])
+    bump_version(state, "employees")
+    # Clients drop the employee's attendance along with them; the rows are purged below
+    publish_change(state, "employee.deleted", [{"id": employee_id, "employeeId": deleted["employeeId"]}])
+    background_tasks.add_task(purge_attendance, state, deleted["employeeId"], deleted["department"], datetime.utcnow())
+    
+    return {"message": "Employee deleted successfully"}
+
+# Employee import: the upload is parsed record by record and inserted in chunks,
+# so memory use does not grow with the size of the file
+IMPORT_CHUNK_SIZE = 1000
+MAX_IMPORT_ERRORS = 1000
+
+async def request_lines(request: Request):
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    try:
+        async for chunk in request.stream():
+            pending += decoder.decode(chunk)
+            *lines, pending = pending.split("\n")
+            for line in lines:
+                yield line.rstrip("\r")
+        pending += decoder.decode(b"", final=True)
+    except UnicodeDecodeError:
+        raise HTTPException(status_code=400, detail="Upload must be UTF-8 encoded")
+    if pending:
+        yield pending.rstrip("\r")
+
+# Hands a csv.reader the lines of the record being read. A quoted field can span lines, so when the reader
+# runs out mid-record, the record's lines are offered again along with the next one
+class RecordLines:
+    def __init__(self):
+        self.lines = deque()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if not self.lines:
+            raise IncompleteRecord
+        return self.lines.popleft()
+
+class IncompleteRecord(Exception):
+    pass
+
+async def import_rows(request: Request, format: str):
+    header = None
+    line_number = 0
+    record_lines = RecordLines()
+    reader = csv.reader(record_lines)
+    record, record_start = [], None
+    async for line in request_lines(request):
+        line_number += 1
+        if not record and not line.strip():
+            continue
+        if format == "csv":
+            record.append(line + "\n")
+            record_start = record_start or line_number
+            record_lines.lines.extend(record)
+            try:
+                values = next(reader)
+            except IncompleteRecord:
+                record_lines.lines.clear()
+                continue
+            start, record, record_start = record_start, [], None
+            if header is None:
+                header = [value.strip() for value in values]
+            elif len(values) != len(header):
+                yield start, None, "Wrong number of columns"
+            else:
+                yield start, dict(zip(header, values)), None
+        else:
+            try:
+                row = json.loads(line)
+            except ValueError:
+                yield line_number, None, "Invalid JSON"
+                continue
+            if isinstance(row, dict):
+                yield line_number, row, None
+            else:
+                yield line_number, None, "Expected a JSON object"
+    if record:
+        yield record_start, None, "Unclosed quoted field"
+
+def add_import_error(summary: dict, line: int, employeeId: Optional[str], detail: str):
+    summary["failed"] += 1
+    if len(summary["errors"]) < MAX_IMPORT_ERRORS:
+        summary["errors"].append({"line": line, "employeeId": employeeId, "detail": detail})
+
+def insert_employee_chunk(state: AppState, chunk: list, summary: dict):
+    created_at = datetime.utcnow()
+    documents = []
+    for _, employee in chunk:
+        employee_dict = employee.model_dump()
+        employee_dict["createdAt"] = created_at
+        documents.append(employee_dict)
+    try:
+        created, duplicates = state.repository.insert_employees(documents)
+    finally:
+        bump_version(state, "employees")
+    summary["created"] += created
+    for index, field in duplicates:
+        line, employee = chunk[index]
+        add_import_error(summary, line, employee.employeeId, duplicate_employee_detail(field))
+    rejected = {index for index, _ in duplicates}
+    publish_change(state, "employee.created", [employee_helper(doc) for index, doc in enumerate(documents) if index not in rejected])
+
+@router.post("/api/employees/import", response_model=EmployeeImportResponse)
+async def import_employees(request: Request, format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+                           state: AppState = Depends(app_state)):
+    summary = {"created": 0, "failed": 0, "errors": []}
+    chunk = []
+    async for line, row, detail in import_rows(request, format):
+        if row is not None:
+            try:
+                chunk.append((line, EmployeeCreate(**row)))
+            except ValidationError as e:
+                error = e.errors()[0]
+                detail = f"{'.'.join(str(loc) for loc in error['loc'])}: {error['msg']}"
+        if detail is not None:
+            employeeId = row.get("employeeId") if row else None
+            add_import_error(summary, line, employeeId if isinstance(employeeId, str) else None, detail)
+        if len(chunk) == IMPORT_CHUNK_SIZE:
+            await run_in_threadpool(insert_employee_chunk, state, chunk, summary)
+            chunk = []
+    if chunk:
+        await run_in_threadpool(insert_employee_chunk, state, chunk, summary)
+    # Duplicates are only found when their chunk is inserted, after later lines' validation errors
+    summary["errors"].sort(key=lambda error: error["line"])
+    return summary
+
+# Attendance routes
+@router.get("/api/attendance", response_model=List[AttendanceResponse])
+def get_attendance(
+    request: Request,
+    response: Response,
+    employeeId: Optional[str] = None,
+    department: Optional[str] = None,
+    status: Optional[str] = Query(None, pattern="^(Present|Absent)$"),
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+    state: AppState = Depends(app_state)
+):
+    fields = parse_fields(fields, AttendanceResponse)
+    # Listings include employee names, so they change with either collection
+    not_modified = conditional_get(state, request, response, "attendance", "employees")
+    if not_modified:
+        return not_modified
+
+    filters = attendance_filters(employeeId, department, status, date_from, date_to)
+    after = decode_cursor(cursor, 2) if cursor else None
+
+    size = page_size(limit, cursor)
+    # Paging keys on (employeeId, date), and current names are looked up by employeeId
+    required = ["employeeId", "date"] if size is not None else []
+    if fields and "employeeName" in fields:
+        required.append("employeeId")
+    stored = fields and stored_fields(fields, required)
+    if size is None:
+        attendance = list(state.repository.find_attendance(filters, fields=stored))
+    else:
+        attendance = list(state.repository.find_attendance(filters, after, size + 1, fields=stored))
+        trim_page(attendance, size, response, lambda att: [att["employeeId"], att["date"]])
+    if fields:
+        if "employeeName" in fields:
+            join_employee_names(state, attendance)
+        return list_response(state, sparse_rows(attendance, fields), response, sparse=True)
+    join_employee_names(state, attendance)
+    
+    return list_response(state, [attendance_helper(att) for att in attendance], response)
+
+@router.get("/api/attendance/export")
+def export_attendance(
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+    employeeId: Optional[str] = None,
+    department: Optional[str] = None,
+    status: Optional[str] = Query(None, pattern="^(Present|Absent)$"),
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+    state: AppState = Depends(app_state)
+):
+    filters = attendance_filters(employeeId, department, status, date_from, date_to)
+    records = state.repository.find_attendance(filters, ordered=True, batch_size=EXPORT_BATCH_SIZE)
+    media_type = "text/csv" if format == "csv" else "application/x-ndjson"
+    return StreamingResponse(
+        stream_attendance_export(state, records, format),
+        media_type=media_type,
+        headers={"Content-Disposition": f"attachment; filename=attendance.{format}"}
+    )
+
+# Attendance summary: present/absent counts are grouped in the database in a single pass
+def attendance_counts(present: int, absent: int) -> dict:
+    total = present + absent
+    return {
+        "present": present,
+        "absent": absent,
+        "total": total,
+        "attendanceRate": present / total if total else 0.0
+    }
+
+# Attendance rollups: per-employee monthly and per-department daily counts, kept current with upserts.
+# They are written after (not atomically with) the raw rows; rollups.py rebuilds them and checks for drift.
+def rollup_updates(records: list, departments: dict, step: int = 1) -> tuple:
+    monthly = {}
+    daily = {}
+    for record in records:
+        field = "present" if record["status"] == "Present" else "absent"
+        monthly.setdefault((record["employeeId"], record["date"][:7]), {"present": 0, "absent": 0})[field] += step
+        daily.setdefault((departments[record["employeeId"]], record["date"]), {"present": 0, "absent": 0})[field] += step
+    return monthly, daily
+
+def update_rollups(repository, records: list, departments: dict, step: int = 1):
+    if not records:
+        return
+    monthly, daily = rollup_updates(records, departments, step)
+    try:
+        repository.apply_rollup_counts(monthly, daily)
+    except STORAGE_ERRORS as e:
+        # The raw rows are already stored; a rebuild brings the rollups back in line
+        print(f"Attendance rollup update failed, run rollups.py check: {e}")
+
+def parse_date(value: str) -> datetime:
+    try:
+        return datetime.strptime(value, "%Y-%m-%d")
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Dates must be formatted as YYYY-MM-DD")
+
+def split_months(date_from: Optional[str], date_to: Optional[str]) -> tuple:
+    # Calendar months wholly inside the range are read from the monthly rollup;
+    # the partial months at either edge are counted from raw rows
+    start = parse_date(date_from) if date_from else None
+    end = parse_date(date_to) if date_to else None
+    first = None
+    if start:
+        first = start if start.day == 1 else (start.replace(day=28) + timedelta(days=4)).replace(day=1)
+    stop = None
+    if end:
+        following = end + timedelta(days=1)
+        stop = following if following.day == 1 else end.replace(day=1)
+    if first and stop and first >= stop:
+        return None, [(date_from, date_to)]
+
+    months = {}
+    edges = []
+    if first:
+        months["$gte"] = first.strftime("%Y-%m")
+        if start < first:
+            edges.append((date_from, (first - timedelta(days=1)).strftime("%Y-%m-%d")))
+    if stop:
+        months["$lt"] = stop.strftime("%Y-%m")
+        if stop <= end:
+            edges.append((stop.strftime("%Y-%m-%d"), date_to))
+    return months, edges
+
+def rollup_summary(repository, employeeId, department, date_from, date_to) -> tuple:
+    months, edges = split_months(date_from, date_to)
+    employee_counts = {}
+    if months is not None:
+        filters = attendance_filters(employeeId, department, None, None, None)
+        for row in repository.monthly_rollup_counts(filters, months):
+            employee_counts[row["_id"]] = [row["present"], row["absent"]]
+    for edge_from, edge_to in edges:
+        filters = attendance_filters(employeeId, department, None, edge_from, edge_to)
+        for row in repository.count_attendance(filters, "employeeId"):
+            counts = employee_counts.setdefault(row["_id"], [0, 0])
+            counts[0] += row["present"]
+            counts[1] += row["absent"]
+    employee_rows = [
+        {"_id": employee_id, "present": present, "absent": absent}
+        for employee_id, (present, absent) in sorted(employee_counts.items())
+    ]
+
+    # Department daily rollups cannot be narrowed to one employee, whose days are cheap to read raw
+    if employeeId:
+        days = repository.count_attendance(attendance_filters(employeeId, None, None, date_from, date_to), "date")
+    else:
+        days = repository.daily_rollup_counts(department, date_from, date_to)
+    return employee_rows, days
+
+def raw_summary(repository, employeeId, department, date_from, date_to) -> tuple:
+    return repository.summarize_attendance(attendance_filters(employeeId, department, None, date_from, date_to))
+
+@router.get("/api/attendance/summary", response_model=AttendanceSummaryResponse)
+def get_attendance_summary(
+    employeeId: Optional[str] = None,
+    department: Optional[str] = None,
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+    source: str = Query("rollup", pattern="^(rollup|raw)$"),
+    state: AppState = Depends(app_state)
+):
+    # Both sources take the bounds as strings; they are checked here so that neither gets a malformed one
+    for bound in (date_from, date_to):
+        if bound:
+            parse_date(bound)
+    summary = rollup_summary if source == "rollup" else raw_summary
+    employee_counts, day_counts = summary(state.repository, employeeId, department, date_from, date_to)
+
+    employees = state.employee_cache.get_many(row["_id"] for row in employee_counts)
+    employee_rows = []
+    departments = {}
+    for row in employee_counts:
+        employee = employees.get(row["_id"], {})
+        employee_rows.append({
+            "employeeId": row["_id"],
+            "employeeName": employee.get("fullName"),
+            "department": employee.get("department"),
+            **attendance_counts(row["present"], row["absent"])
+        })
+        # Rows left behind by deleted employees have no department to count towards
+        if employee:
+            totals = departments.setdefault(employee["department"], [0, 0])
+            totals[0] += row["present"]
+            totals[1] += row["absent"]
+
+    return {
+        "employees": employee_rows,
+        "departments": [
+            {"department": name, **attendance_counts(present, absent)}
+            for name, (present, absent) in sorted(departments.items())
+        ],
+        "days": [{"date": row["_id"], **attendance_counts(row["present"], row["absent"])} for row in day_counts]
+    }
+
+@router.post("/api/attendance", response_model=AttendanceResponse)
+def create_attendance(attendance: AttendanceCreate, state: AppState = Depends(app_state)):
+    # Check if employee exists
+    employee = state.employee_cache.get(attendance.employeeId)
+    if not employee:
+        raise HTTPException(status_code=404, detail="Employee not found")
+    
+    attendance_dict = attendance.model_dump()
+    attendance_dict["employeeName"] = employee["fullName"]
+    attendance_dict["createdAt"] = datetime.utcnow()
+    
+    # The unique (employeeId, date) index rejects a second mark for the same day
+    try:
+        state.repository.insert_attendance(attendance_dict)
+    except DuplicateRecordError:
+        raise HTTPException(status_code=400, detail="Attendance already marked for this employee on this date")
+    bump_version(state, "attendance")
+    update_rollups(state.repository, [attendance_dict], {employee["employeeId"]: employee["department"]})
+    created = attendance_helper(attendance_dict)
+    publish_change(state, "attendance.created", [created])
+    
+    return created
+
+MAX_BULK_ATTENDANCE = 5000
+
+@router.post("/api/attendance/bulk", response_model=AttendanceBulkResponse)
+def create_attendance_bulk(records: List[AttendanceCreate], state: AppState = Depends(app_state)):
+    if len(records) > MAX_BULK_ATTENDANCE:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_BULK_ATTENDANCE} records per request")
+
+    # Resolve every referenced employee with at most one query
+    employees = state.employee_cache.get_many({record.employeeId for record in records})
+    names = {employee_id: employee["fullName"] for employee_id, employee in employees.items()}
+    departments = {employee_id: employee["department"] for employee_id, employee in employees.items()}
+
+    created_at = datetime.utcnow()
+    results = []
+    documents = []
+    for record in records:
+        result = {"employeeId": record.employeeId, "date": record.date, "result": "employee_not_found"}
+        if record.employeeId in names:
+            attendance_dict = record.model_dump()
+            attendance_dict["employeeName"] = names[record.employeeId]
+            attendance_dict["createdAt"] = created_at
+            documents.append((result, attendance_dict))
+            result["result"] = "created"
+        results.append(result)
+
+    # The unique (employeeId, date) index rejects duplicates, including repeats within this request
+    if documents:
+        try:
+            duplicates = set(state.repository.insert_attendance_many([doc for _, doc in documents]))
+        finally:
+            bump_version(state, "attendance")
+        for index, (result, doc) in enumerate(documents):
+            if index in duplicates:
+                result["result"] = "duplicate"
+            else:
+                result["id"] = str(doc["_id"])
+        created = [doc for result, doc in documents if result["result"] == "created"]
+        update_rollups(state.repository, created, departments)
+        publish_change(state, "attendance.created", [attendance_helper(doc) for doc in created])
+
+    return {
+        "created": sum(1 for r in results if r["result"] == "created"),
+        "duplicates": sum(1 for r in results if r["result"] == "duplicate"),
+        "unknownEmployees": sum(1 for r in results if r["result"] == "employee_not_found"),
+        "results": results
+    }
+
+# Delta sync: rows and tombstones in the order of the shared sequence they were written with.
+# The token is the last sequence value a consumer has applied
+MAX_SYNC_PAGE = 5000
+
+def sync_token(seq: int) -> str:
+    return encode_cursor([str(seq)])
+
+def parse_sync_token(since: Optional[str]) -> int:
+    if not since:
+        return 0
+    value = decode_cursor(since, 1)[0]
+    if not value.isdigit():
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return int(value)
+
+@router.get("/api/sync", response_model=SyncResponse)
+def sync_changes(since: Optional[str] = None, limit: int = Query(1000, ge=1, le=MAX_SYNC_PAGE),
+                 state: AppState = Depends(app_state)):
+    repository = state.repository
+    after = parse_sync_token(since)
+    # Each source's first limit + 1 changes cover the first limit + 1 overall
+    changes = heapq.merge(
+        (("employees", doc, doc["updatedAt"]) for doc in repository.find_changed("employees", after, limit + 1)),
+        (("attendance", doc, doc["updatedAt"]) for doc in repository.find_changed("attendance", after, limit + 1)),
+        (("deleted", doc, doc["deletedAt"]) for doc in repository.find_tombstones(after, limit + 1)),
+        key=lambda change: change[1]["seq"]
+    )
+    settled = datetime.utcnow() - timedelta(seconds=state.settings.sync_settle_seconds)
+    upserted = {"employees": [], "attendance": []}
+    deleted = {"employees": [], "attendance": []}
+    last = after
+    taken = 0
+    has_more = False
+    for kind, doc, changed_at in changes:
+        if taken == limit:
+            has_more = True
+            break
+        if changed_at > settled:
+            break
+        if kind == "deleted":
+            deleted[doc["collection"]].append(doc["recordId"])
+        else:
+            upserted[kind].append(doc)
+        last = doc["seq"]
+        taken += 1
+
+    return {
+        "employees": {"upserted": [employee_helper(doc) for doc in upserted["employees"]], "deleted": deleted["employees"]},
+        "attendance": {
+            "upserted": [attendance_helper(doc) for doc in join_employee_names(state, upserted["attendance"])],
+            "deleted": deleted["attendance"]
+        },
+        "next": sync_token(last),
+        "hasMore": has_more
+    }
+
+@router.get("/api/events")
+async def live_event_stream(request: Request, state: AppState = Depends(app_state)):
+    # no-transform keeps the compression middleware (and proxies) from buffering the stream
+    return StreamingResponse(
+        state.live_events.stream(request.headers.get("last-event-id"), state.settings.events_heartbeat_seconds),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache, no-transform", "X-Accel-Buffering": "no"}
+    )
+
+@router.get("/api/cache/stats")
+def cache_stats(state: AppState = Depends(app_state)):
+    return {"employees": state.employee_cache.stats()}
+
+async def health_check(state: AppState = Depends(app_state)):
+    return {"status": "healthy", "environment": state.settings.environment}
+
+async def metrics_endpoint():
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+async def root():
+    return {"message": "HRMS Lite API is running", "version": "1.0.0"}
+
+# Builds an app with its own state: apps from separate calls (with different settings, say) share
+# nothing but the process-wide metrics
+def create_app(app_settings: Optional[Settings] = None) -> FastAPI:
+    settings = app_settings or Settings.from_env()
+
+    app = FastAPI(
+        title="HRMS Lite API",
+        description="Human Resource Management System Lite",
+        version="1.0.0",
+        lifespan=lifespan
+    )
+    app.state.hrms = AppState(settings)
+
+    # CORS middleware
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=settings.cors_origins,
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+        expose_headers=["X-Next-Cursor", "ETag"],
+    )
+    if settings.compression_encodings:
+        app.add_middleware(
+            CompressionMiddleware,
+            encodings=settings.compression_encodings,
+            minimum_size=settings.compression_minimum_size,
+            level=settings.compression_level,
+        )
+    if settings.profiling_enabled:
+        app.add_middleware(
+            ProfilingMiddleware,
+            sample_rate=settings.profile_sample_rate,
+            profile_dir=settings.profile_dir,
+            token=settings.profile_token,
+        )
+    # Added last so it is outermost and times the whole response, compression included
+    if settings.metrics_enabled:
+        app.add_middleware(MetricsMiddleware, metrics=metrics)
+
+    app.include_router(router)
+    app.get("/api/health")(health_check)
+    if settings.metrics_enabled:
+        app.get("/metrics", include_in_schema=False)(metrics_endpoint)
+    # Serve React build files
+    if settings.frontend_build_path and os.path.isdir(settings.frontend_build_path):
+        app.mount("/", StaticFiles(directory=settings.frontend_build_path, html=True), name="static")
+    else:
+        app.get("/")(root)
+    return app
@@ -0,0 +1,245 @@
+import argparse
+import asyncio
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+
+import httpx
+import mongomock
+
+import application
+
+# Drives the app in-process through httpx's ASGI transport, so requests go through the middleware, routing,
+# validation and the storage backend but not a socket. Each endpoint gets a fixed number of requests from
+# a pool of concurrent clients, and its throughput and latency percentiles are reported as JSON. Save a run
+# with --output and pass it to a later run as --baseline to see what changed between commits.
+
+START = date(2024, 1, 1)
+
+def employee_document(employee_id: str, now: datetime) -> dict:
+    return {
+        "employeeId": employee_id,
+        "fullName": f"Employee {employee_id}",
+        "email": f"{employee_id.lower()}@company.com",
+        "department": f"Dept {sum(map(ord, employee_id)) % 10}",
+        "createdAt": now
+    }
+
+def seed(state, employees: int, days: int):
+    state.repository.clear()
+    state.employee_cache.clear()
+    now = datetime.utcnow()
+    people = [employee_document(f"EMP{i:05d}", now) for i in range(employees)]
+    state.repository.insert_employees(people)
+    departments = {person["employeeId"]: person["department"] for person in people}
+    for day in range(days):
+        rows = [
+            {
+                "employeeId": person["employeeId"],
+                "employeeName": person["fullName"],
+                "date": (START + timedelta(days=day)).isoformat(),
+                "status": "Present" if (i + day) % 7 else "Absent",
+                "createdAt": now
+            }
+            for i, person in enumerate(people)
+        ]
+        state.repository.insert_attendance_many(rows)
+        application.update_rollups(state.repository, rows, departments)
+
+# Each scenario builds its requests up front, as (method, url, keyword arguments for httpx), so that writes
+# never collide with each other and any setup they need is not timed
+def scenarios(state, employees: int, days: int) -> dict:
+    def later_day(offset: int) -> str:
+        return (START + timedelta(days=days + offset)).isoformat()
+
+    def delete_employees(count):
+        now = datetime.utcnow()
+        people = [employee_document(f"DEL{i:06d}", now) for i in range(count)]
+        state.repository.insert_employees(people)
+        return [("DELETE", f"/api/employees/{person['_id']}", {}) for person in people]
+
+    month_from, month_to = START.isoformat(), (START + timedelta(days=max(days - 1, 0))).isoformat()
+    return {
+        "employees.list": lambda count: [("GET", "/api/employees", {})] * count,
+        "employees.page": lambda count: [
+            ("GET", "/api/employees", {"params": {"department": f"Dept {i % 10}", "limit": 100}}) for i in range(count)
+        ],
+        "employees.create": lambda count: [
+            ("POST", "/api/employees", {"json": {
+                "employeeId": f"NEW{i:06d}",
+                "fullName": f"New Hire {i}",
+                "email": f"new.hire{i}@company.com",
+                "department": f"Dept {i % 10}"
+            }})
+            for i in range(count)
+        ],
+        "employees.delete": delete_employees,
+        "attendance.list": lambda count: [("GET", "/api/attendance", {})] * count,
+        "attendance.page": lambda count: [
+            ("GET", "/api/attendance", {"params": {"employeeId": f"EMP{i % employees:05d}", "limit": 100}})
+            for i in range(count)
+        ],
+        "attendance.summary": lambda count: [
+            ("GET", "/api/attendance/summary", {"params": {"date_from": month_from, "date_to": month_to}})
+        ] * count,
+        "attendance.export": lambda count: [("GET", "/api/attendance/export", {"params": {"format": "ndjson"}})] * count,
+        "attendance.create": lambda count: [
+            ("POST", "/api/attendance", {"json": {
+                "employeeId": f"EMP{i % employees:05d}", "date": later_day(i // employees), "status": "Present"
+            }})
+            for i in range(count)
+        ],
+        "attendance.bulk": lambda count: [
+            ("POST", "/api/attendance/bulk", {"json": [
+                {"employeeId": f"EMP{e:05d}", "date": later_day(1000 + i), "status": "Absent"}
+                for e in range(min(employees, 100))
+            ]})
+            for i in range(count)
+        ],
+        "sync": lambda count: [("GET", "/api/sync", {"params": {"limit": 1000}})] * count,
+    }
+
+def percentile(timings: list, pct: int) -> float:
+    if len(timings) < 2:
+        return timings[0]
+    return statistics.quantiles(timings, n=100, method="inclusive")[pct - 1]
+
+async def run_scenario(http, requests: list, concurrency: int) -> dict:
+    timings, sizes, errors = [], [], []
+    pending = iter(requests)
+
+    async def client():
+        for method, url, kwargs in pending:
+            started = time.perf_counter()
+            response = await http.request(method, url, **kwargs)
+            timings.append(time.perf_counter() - started)
+            sizes.append(len(response.content))
+            if response.status_code >= 400:
+                errors.append(response.status_code)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    return {
+        "requests": len(timings),
+        "errors": len(errors),
+        "throughput": round(len(timings) / elapsed, 1),
+        "p50Ms": round(percentile(timings, 50) * 1000, 2),
+        "p95Ms": round(percentile(timings, 95) * 1000, 2),
+        "p99Ms": round(percentile(timings, 99) * 1000, 2),
+        "meanBytes": round(statistics.fmean(sizes)),
+    }
+
+async def run_all(app, selected: dict, requests: int, warmup: int, concurrency: int) -> dict:
+    # ASGITransport does not run the lifespan, which sizes the thread pool the database calls run in
+    application.configure_threadpool(app.state.hrms.settings)
+    results = {}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark", timeout=None) as http:
+        for name, build in selected.items():
+            batch = build(warmup + requests)
+            if warmup:
+                await run_scenario(http, batch[:warmup], concurrency)
+            results[name] = await run_scenario(http, batch[warmup:], concurrency)
+            print(f"{name:<20} {results[name]['throughput']:9.1f} req/s   p50 {results[name]['p50Ms']:8.2f} ms   "
+                  f"p95 {results[name]['p95Ms']:8.2f} ms   p99 {results[name]['p99Ms']:8.2f} ms", file=sys.stderr)
+    return results
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "describe", "--always", "--dirty"], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__))
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+# Regressions are judged on p50: over a few hundred requests the tail moves by tens of percent between
+# identical runs, with garbage collection and thread scheduling. Changes under a millisecond are ignored
+def compare(results: dict, baseline: dict, max_regression: float) -> list:
+    regressions = []
+    print(f"\nvs {baseline['meta'].get('commit') or 'baseline'}:", file=sys.stderr)
+    for name, result in results.items():
+        before = baseline["endpoints"].get(name)
+        if not before:
+            continue
+        change = (result["p50Ms"] - before["p50Ms"]) / before["p50Ms"] * 100 if before["p50Ms"] else 0.0
+        print(f"{name:<20} p50 {before['p50Ms']:8.2f} -> {result['p50Ms']:8.2f} ms ({change:+6.1f}%)   "
+              f"p95 {before['p95Ms']:8.2f} -> {result['p95Ms']:8.2f} ms   "
+              f"{before['throughput']:9.1f} -> {result['throughput']:9.1f} req/s", file=sys.stderr)
+        if change > max_regression and result["p50Ms"] - before["p50Ms"] >= 1:
+            regressions.append(name)
+    return regressions
+
+def main_benchmark():
+    parser = argparse.ArgumentParser(description="Benchmark every API endpoint in-process and report latency percentiles")
+    parser.add_argument("--backend", choices=["sqlite", "mongomock"], default="sqlite",
+                        help="Storage to run against: a scratch SQLite file, or the in-memory MongoDB stand-in "
+                             "(which scans whole collections, so keep the sizes small)")
+    parser.add_argument("--employees", type=int, default=200)
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--requests", type=int, default=200, help="Timed requests per endpoint")
+    parser.add_argument("--warmup", type=int, default=10, help="Untimed requests per endpoint before timing")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--endpoints", help="Comma-separated scenario names to run (default: all)")
+    parser.add_argument("--output", help="Write the JSON report to this file instead of stdout")
+    parser.add_argument("--baseline", help="A previous JSON report to compare latencies with")
+    parser.add_argument("--max-regression", type=float, default=20.0,
+                        help="With --baseline, exit non-zero when an endpoint's p50 is this many percent slower")
+    args = parser.parse_args()
+
+    scratch = tempfile.mkdtemp()
+    try:
+        app = application.create_app(application.Settings.from_env(
+            storage_backend="mongo" if args.backend == "mongomock" else "sqlite",
+            mongo_client=mongomock.MongoClient,
+            sqlite_path=os.path.join(scratch, "hrms.sqlite3"),
+            sync_settle_seconds=0,
+        ))
+        state = app.state.hrms
+        available = scenarios(state, args.employees, args.days)
+        names = [name.strip() for name in args.endpoints.split(",")] if args.endpoints else list(available)
+        unknown = [name for name in names if name not in available]
+        if unknown:
+            parser.error(f"unknown endpoints {', '.join(unknown)}; choose from {', '.join(available)}")
+
+        state.repository.create_indexes()
+        seed(state, args.employees, args.days)
+        results = asyncio.run(run_all(app, {name: available[name] for name in names}, args.requests, args.warmup, args.concurrency))
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+
+    report = {
+        "meta": {
+            "commit": git_commit(),
+            "timestamp": datetime.utcnow().isoformat(timespec="seconds") + "Z",
+            "python": platform.python_version(),
+            "backend": args.backend,
+            "employees": args.employees,
+            "attendanceRows": args.employees * args.days,
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+        },
+        "endpoints": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.max_regression)
+        if regressions:
+            sys.exit(f"p50 regressed by more than {args.max_regression:g}%: {', '.join(regressions)}")
+
+if __name__ == "__main__":
+    main_benchmark()
@@ -0,0 +1,104 @@
+import argparse
+import time
+from datetime import date, datetime, timedelta
+
+import mongomock
+from bson import BSON
+from pymongo import MongoClient
+
+from repositories import BucketedMongoRepository, MongoRepository
+
+# Loads the same attendance into the row and monthly bucket layouts, then compares their storage and
+# index footprint and the reads behind a monthly report. Against a real server (--uri) the sizes come
+# from collStats; mongomock has no storage engine, so it reports encoded document bytes and index entries
+
+def employee_documents(employees: int) -> list:
+    return [
+        {"employeeId": f"EMP{i:05d}", "fullName": f"Employee {i}", "email": f"employee{i}@company.com",
+         "department": f"Dept {i % 10}", "createdAt": datetime(2023, 12, 1)}
+        for i in range(employees)
+    ]
+
+def attendance_documents(employees: int, day: date) -> list:
+    return [
+        {"employeeId": f"EMP{i:05d}", "employeeName": f"Employee {i}", "date": day.isoformat(),
+         "status": "Present" if (i + day.toordinal()) % 9 else "Absent",
+         "createdAt": datetime(day.year, day.month, day.day, 9)}
+        for i in range(employees)
+    ]
+
+def collection_footprint(db, name: str, real: bool) -> dict:
+    if real:
+        stats = db.command("collStats", name)
+        return {"documents": stats["count"], "data": stats["size"], "storage": stats["storageSize"], "indexes": stats["totalIndexSize"]}
+    documents = list(db[name].find())
+    return {
+        "documents": len(documents),
+        "data": sum(len(BSON.encode(document)) for document in documents),
+        "index entries": len(documents) * len(db[name].index_information())
+    }
+
+def run_layout(repository, employees: int, days: list, real: bool) -> tuple:
+    timings = {}
+    repository.insert_employees(employee_documents(employees))
+
+    started = time.perf_counter()
+    for day in days:
+        assert repository.insert_attendance_many(attendance_documents(employees, day)) == []
+    timings["load"] = time.perf_counter() - started
+
+    # A month report: each employee's days in the month, then the department's raw counts
+    month = days[len(days) // 2].isoformat()[:7]
+    month_filters = {"date_from": f"{month}-01", "date_to": f"{month}-31"}
+    started = time.perf_counter()
+    for i in range(0, employees, max(1, employees // 20)):
+        rows = list(repository.find_attendance({"employeeId": f"EMP{i:05d}", **month_filters}))
+        assert rows and all(row["date"].startswith(month) for row in rows)
+    timings["employee months"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    by_employee, _ = repository.summarize_attendance({"department": "Dept 3", **month_filters})
+    timings["department summary"] = time.perf_counter() - started
+    assert len(by_employee) == len(range(3, employees, 10))
+
+    started = time.perf_counter()
+    counted = sum(row["present"] + row["absent"] for row in repository.count_attendance({}, "employeeId"))
+    timings["full count"] = time.perf_counter() - started
+    assert counted == employees * len(days)
+
+    name = "attendance_buckets" if isinstance(repository, BucketedMongoRepository) else "attendance"
+    return timings, collection_footprint(repository.db, name, real)
+
+def main_benchmark():
+    parser = argparse.ArgumentParser(description="Compare the row and monthly bucket attendance layouts")
+    # mongomock checks unique indexes by scanning, so row loads grow quadratically; use --uri for real sizes
+    parser.add_argument("--employees", type=int, default=50)
+    parser.add_argument("--months", type=int, default=3)
+    parser.add_argument("--uri", help="MongoDB URI to benchmark against (defaults to an in-memory mongomock)")
+    args = parser.parse_args()
+
+    client = MongoClient(args.uri) if args.uri else mongomock.MongoClient()
+    start = date(2024, 1, 1)
+    days = [
+        start + timedelta(days=offset) for offset in range((date(2024 + args.months // 12, args.months % 12 + 1, 1) - start).days)
+        if (start + timedelta(days=offset)).weekday() < 5
+    ]
+    layouts = (
+        ("rows", MongoRepository(client["hrms_lite_layout_rows"])),
+        ("monthly", BucketedMongoRepository(client["hrms_lite_layout_monthly"])),
+    )
+
+    print(f"{args.employees} employees x {len(days)} working days on {'mongodb' if args.uri else 'mongomock'}")
+    for label, repository in layouts:
+        repository.create_indexes()
+        repository.clear()
+        timings, footprint = run_layout(repository, args.employees, days, bool(args.uri))
+        print(f"{label:<8} " + "   ".join(f"{step} {seconds * 1000:8.1f} ms" for step, seconds in timings.items()))
+        print(f"{'':<8} " + "   ".join(f"{key} {value:,}" for key, value in footprint.items()))
+
+    if args.uri:
+        for _, repository in layouts:
+            client.drop_database(repository.db.name)
+
+if __name__ == "__main__":
+    main_benchmark()
@@ -0,0 +1,141 @@
+import argparse
+import time
+from datetime import date, datetime, timedelta
+from functools import partial
+
+import mongomock
+from pymongo import MongoClient
+
+import application
+from application import attendance_helper
+
+def seed(db, employees, days):
+    db.employees.drop()
+    db.attendance.drop()
+    db.employees.create_index("employeeId", unique=True)
+    db.attendance.create_index([("employeeId", 1), ("date", 1)], unique=True)
+
+    now = datetime.utcnow()
+    db.employees.insert_many([
+        {
+            "employeeId": f"EMP{i:05d}",
+            "fullName": f"Employee {i}",
+            "email": f"employee{i}@company.com",
+            "department": f"Dept {i % 10}",
+            "createdAt": now
+        }
+        for i in range(employees)
+    ])
+
+    start = date(2024, 1, 1)
+    for day in range(days):
+        day_str = (start + timedelta(days=day)).isoformat()
+        db.attendance.insert_many([
+            {
+                "employeeId": f"EMP{i:05d}",
+                "date": day_str,
+                "status": "Present" if (i + day) % 7 else "Absent",
+                "createdAt": now
+            }
+            for i in range(employees)
+        ])
+
+# Adds a fixed delay per database call so the in-memory stand-in behaves like a networked server
+class RoundTripDelay:
+    def __init__(self, target, delay):
+        self._target = target
+        self._delay = delay
+
+    def __getattr__(self, name):
+        attr = getattr(self._target, name)
+        if isinstance(attr, (mongomock.Database, mongomock.Collection)):
+            return RoundTripDelay(attr, self._delay)
+        if callable(attr) and name in ("find", "find_one", "aggregate", "distinct", "insert_one", "insert_many"):
+            def delayed(*args, **kwargs):
+                time.sleep(self._delay)
+                return attr(*args, **kwargs)
+            return delayed
+        return attr
+
+# Previous implementation: one employee lookup per attendance record
+def list_attendance_per_record(db):
+    attendance = list(db.attendance.find())
+    for record in attendance:
+        employee = db.employees.find_one({"employeeId": record["employeeId"]})
+        if employee:
+            record["employeeName"] = employee["fullName"]
+    return [attendance_helper(att) for att in attendance]
+
+# Server-side join, used before the employee cache
+attendance_with_employee_pipeline = [
+    {"$lookup": {
+        "from": "employees",
+        "localField": "employeeId",
+        "foreignField": "employeeId",
+        "as": "employee"
+    }},
+    {"$addFields": {
+        "employeeName": {"$ifNull": [{"$arrayElemAt": ["$employee.fullName", 0]}, "$employeeName"]}
+    }},
+    {"$project": {"employee": 0}}
+]
+
+def list_attendance_lookup(db):
+    attendance = list(db.attendance.aggregate(attendance_with_employee_pipeline))
+    return [attendance_helper(att) for att in attendance]
+
+# Current implementation: names come from the employee cache, misses fetched with one $in query
+def list_attendance_cached(state, db):
+    attendance = list(db.attendance.find())
+    return [attendance_helper(att) for att in application.join_employee_names(state, attendance)]
+
+def best_of(fn, db, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        rows = fn(db)
+        timings.append(time.perf_counter() - started)
+    return min(timings), rows
+
+def main_benchmark():
+    parser = argparse.ArgumentParser(description="Benchmark GET /api/attendance employee name join")
+    parser.add_argument("--employees", type=int, default=200)
+    parser.add_argument("--days", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--uri", help="MongoDB URI to benchmark against (defaults to an in-memory mongomock)")
+    parser.add_argument("--rtt-ms", type=float, default=0.5,
+                        help="Simulated round-trip time per query when using mongomock")
+    args = parser.parse_args()
+
+    client = MongoClient(args.uri) if args.uri else mongomock.MongoClient()
+    db = client["hrms_lite_benchmark"]
+
+    print(f"Seeding {args.employees} employees x {args.days} days...")
+    seed(db, args.employees, args.days)
+    if not args.uri and args.rtt_ms:
+        db = RoundTripDelay(db, args.rtt_ms / 1000)
+
+    # The app's employee cache reads the benchmark's employees
+    state = application.AppState(application.Settings.from_env(storage_backend="mongo", mongo_client=lambda *args, **kwargs: client))
+    state.repository.connect().employees = db.employees
+
+    old_time, old_rows = best_of(list_attendance_per_record, db, args.repeat)
+    lookup_time, lookup_rows = best_of(list_attendance_lookup, db, args.repeat)
+    cold_time, _ = best_of(partial(list_attendance_cached, state), db, 1)
+    cached_time, cached_rows = best_of(partial(list_attendance_cached, state), db, args.repeat)
+
+    expected = {r["id"]: r["employeeName"] for r in old_rows}
+    assert {r["id"]: r["employeeName"] for r in lookup_rows} == expected
+    assert {r["id"]: r["employeeName"] for r in cached_rows} == expected
+
+    print(f"Rows: {len(old_rows)}")
+    print(f"Per-record find_one:   {old_time * 1000:.1f} ms ({len(old_rows) + 1} queries)")
+    print(f"$lookup aggregation:   {lookup_time * 1000:.1f} ms (1 query)")
+    print(f"Employee cache (cold): {cold_time * 1000:.1f} ms (2 queries)")
+    print(f"Employee cache (warm): {cached_time * 1000:.1f} ms (1 query)")
+
+    if args.uri:
+        client.drop_database("hrms_lite_benchmark")
+
+if __name__ == "__main__":
+    main_benchmark()
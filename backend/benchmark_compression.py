@@ -0,0 +1,78 @@
+import argparse
+import asyncio
+import time
+from datetime import datetime
+
+import orjson
+
+from compression import CompressionMiddleware, ENCODERS
+
+# Runs listing-shaped JSON bodies through the compression middleware in-process and reports
+# the bytes that would go on the wire and the CPU spent producing them
+
+def listing_body(rows):
+    created_at = datetime(2024, 1, 1, 9, 30)
+    return orjson.dumps([
+        {
+            "id": f"65a1f0c2e4b0{i:012x}",
+            "employeeId": f"EMP{i:05d}",
+            "fullName": f"Employee {i}",
+            "email": f"employee{i}@company.com",
+            "department": f"Dept {i % 10}",
+            "createdAt": created_at
+        }
+        for i in range(rows)
+    ])
+
+def body_app(chunks, content_type):
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", content_type)]})
+        for i, chunk in enumerate(chunks):
+            await send({"type": "http.response.body", "body": chunk, "more_body": i < len(chunks) - 1})
+    return app
+
+async def wire_bytes(middleware, encoding):
+    sent = []
+
+    async def send(message):
+        if message["type"] == "http.response.body":
+            sent.append(len(message["body"]))
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    scope = {"type": "http", "method": "GET", "path": "/", "headers": [(b"accept-encoding", encoding.encode())]}
+    await middleware(scope, receive, send)
+    return sum(sent)
+
+def measure(chunks, content_type, encoding, level, repeat):
+    middleware = CompressionMiddleware(body_app(chunks, content_type), encodings=[encoding], minimum_size=0, level=level)
+    timings = []
+    for _ in range(repeat):
+        started = time.process_time()
+        size = asyncio.run(wire_bytes(middleware, encoding))
+        timings.append(time.process_time() - started)
+    return size, min(timings)
+
+def main_benchmark():
+    parser = argparse.ArgumentParser(description="Benchmark response compression: bytes on the wire and CPU per response size")
+    parser.add_argument("--sizes", default="10,100,1000,10000", help="Listing sizes in rows")
+    parser.add_argument("--level", type=int, default=6)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    encodings = list(ENCODERS)
+    print(f"Encodings available: {', '.join(encodings)}; level {args.level}; CPU time is the best of {args.repeat}")
+    for rows in (int(size) for size in args.sizes.split(",")):
+        body = listing_body(rows)
+        # The same bytes as a single body and as an NDJSON-style stream of 1,000-byte chunks
+        for label, chunks in (("single", [body]), ("streamed", [body[i:i + 1000] for i in range(0, len(body), 1000)])):
+            baseline, baseline_cpu = measure(chunks, b"application/json", "identity", args.level, args.repeat)
+            results = [f"identity {baseline / 1024:8.1f} KiB"]
+            for encoding in encodings:
+                size, cpu = measure(chunks, b"application/json", encoding, args.level, args.repeat)
+                results.append(f"{encoding} {size / 1024:7.1f} KiB ({baseline / size:4.1f}x, {max(cpu - baseline_cpu, 0) * 1000:6.2f} ms CPU)")
+            print(f"{rows:>6} rows {label:<9} " + "   ".join(results))
+
+if __name__ == "__main__":
+    main_benchmark()
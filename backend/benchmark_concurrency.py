@@ -0,0 +1,106 @@
+import argparse
+import asyncio
+import multiprocessing
+import socket
+import statistics
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+import httpx
+import uvicorn
+from fastapi import FastAPI, Request, Response
+
+from benchmark_attendance_listing import RoundTripDelay
+import application
+
+app = application.create_app()
+state = app.state.hrms
+
+# Previous behaviour: the same handler called directly from an `async def` route,
+# so every pymongo round-trip blocks the event loop
+blocking_app = FastAPI(lifespan=application.lifespan)
+blocking_app.state.hrms = state
+
+@blocking_app.get("/api/employees")
+async def get_employees_on_loop(request: Request, response: Response):
+    return application.get_employees(request, response, department=None, limit=None, cursor=None, state=state)
+
+def seed(employees):
+    state.repository.clear()
+    state.repository.insert_employees([
+        {
+            "employeeId": f"EMP{i:05d}",
+            "fullName": f"Employee {i}",
+            "email": f"employee{i}@company.com",
+            "department": f"Dept {i % 10}",
+            "createdAt": datetime.utcnow()
+        }
+        for i in range(employees)
+    ])
+
+def percentile(timings, pct):
+    return statistics.quantiles(timings, n=100)[pct - 1]
+
+def run_server(blocking, port, employees, rtt):
+    seed(employees)
+    state.repository.connect().employees = RoundTripDelay(state.repository.employees, rtt)
+    uvicorn.run(blocking_app if blocking else app, host="127.0.0.1", port=port, log_level="warning")
+
+# Serve the app from a separate process so that clients see a blocked event loop as queueing
+@contextmanager
+def serve(blocking, employees, rtt):
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    server = multiprocessing.Process(target=run_server, args=(blocking, port, employees, rtt), daemon=True)
+    server.start()
+    while True:
+        try:
+            socket.create_connection(("127.0.0.1", port)).close()
+            break
+        except ConnectionRefusedError:
+            time.sleep(0.05)
+    try:
+        yield f"http://127.0.0.1:{port}"
+    finally:
+        server.terminate()
+        server.join()
+
+async def run_clients(base_url, clients, requests_per_client):
+    timings = []
+    limits = httpx.Limits(max_connections=clients)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=None) as http:
+        async def client():
+            for _ in range(requests_per_client):
+                started = time.perf_counter()
+                response = await http.get("/api/employees")
+                timings.append(time.perf_counter() - started)
+                assert response.status_code == 200
+
+        started = time.perf_counter()
+        await asyncio.gather(*(client() for _ in range(clients)))
+        elapsed = time.perf_counter() - started
+    return timings, elapsed
+
+def report(label, timings, elapsed):
+    print(f"{label:<22} p50 {percentile(timings, 50) * 1000:8.1f} ms   "
+          f"p99 {percentile(timings, 99) * 1000:8.1f} ms   "
+          f"{len(timings) / elapsed:8.1f} req/s")
+
+def main_benchmark():
+    parser = argparse.ArgumentParser(description="Benchmark concurrent GET /api/employees against a slow database")
+    parser.add_argument("--clients", type=int, default=200)
+    parser.add_argument("--requests", type=int, default=5, help="Requests per client")
+    parser.add_argument("--employees", type=int, default=20)
+    parser.add_argument("--rtt-ms", type=float, default=20.0, help="Simulated database round-trip time")
+    args = parser.parse_args()
+
+    print(f"{args.clients} clients x {args.requests} requests, {args.rtt_ms} ms per database round-trip, "
+          f"{state.settings.db_threadpool_size} worker threads")
+    for label, blocking in (("async def (blocking)", True), ("def (thread pool)", False)):
+        with serve(blocking, args.employees, args.rtt_ms / 1000) as base_url:
+            report(label, *asyncio.run(run_clients(base_url, args.clients, args.requests)))
+
+if __name__ == "__main__":
+    main_benchmark()
@@ -0,0 +1,149 @@
+import argparse
+import asyncio
+import json
+import os
+import shutil
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import httpx
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Connects many clients to GET /api/events on a single uvicorn worker, marks attendance through the
+# API, and reports how long each write takes to reach every client. Without --url it starts its own
+# worker against a scratch SQLite database. For comparison it also reports what the polling it
+# replaces would have cost: every client re-fetching the attendance listing after each write.
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+def start_server(port: int):
+    scratch = tempfile.mkdtemp()
+    env = {**os.environ, "STORAGE_BACKEND": "sqlite", "SQLITE_PATH": os.path.join(scratch, "hrms.sqlite3")}
+    subprocess.run([sys.executable, "migrate.py"], cwd=BACKEND_DIR, env=env, check=True, stdout=subprocess.DEVNULL)
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--port", str(port), "--log-level", "warning", "--backlog", "4096"],
+        cwd=BACKEND_DIR, env=env
+    )
+    return server, scratch
+
+def rss_mb(pid: int) -> float:
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return float("nan")
+
+async def wait_until_up(http):
+    for _ in range(100):
+        try:
+            if (await http.get("/api/health")).status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        await asyncio.sleep(0.1)
+    raise RuntimeError("server did not start")
+
+class Listener:
+    def __init__(self):
+        self.arrivals = []
+        self.ready = asyncio.Event()
+
+    async def run(self, host: str, port: int):
+        reader, writer = await asyncio.open_connection(host, port)
+        writer.write(f"GET /api/events HTTP/1.1\r\nHost: {host}\r\nAccept: text/event-stream\r\n\r\n".encode())
+        await writer.drain()
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    return
+                if line.startswith(b"retry:"):
+                    self.ready.set()
+                elif line.startswith(b"event: attendance.created"):
+                    self.arrivals.append(time.perf_counter())
+        finally:
+            writer.close()
+
+async def measure(base_url: str, clients: int, events: int, pid):
+    host, port = base_url.split("//")[1].split(":")
+    async with httpx.AsyncClient(base_url=base_url, timeout=30) as http:
+        await wait_until_up(http)
+        await http.post("/api/employees", json={
+            "employeeId": "FANOUT", "fullName": "Fan Out", "email": "fan.out@company.com", "department": "Benchmarks"
+        })
+        idle_rss = rss_mb(pid) if pid else float("nan")
+
+        listeners = [Listener() for _ in range(clients)]
+        tasks = []
+        for listener in listeners:
+            tasks.append(asyncio.create_task(listener.run(host, int(port))))
+            await asyncio.sleep(0)
+        await asyncio.wait_for(asyncio.gather(*(listener.ready.wait() for listener in listeners)), 60)
+        connected_rss = rss_mb(pid) if pid else float("nan")
+
+        posted = []
+        for day in range(events):
+            posted.append(time.perf_counter())
+            date = f"2031-{1 + day // 28:02d}-{1 + day % 28:02d}"
+            response = await http.post("/api/attendance", json={"employeeId": "FANOUT", "date": date, "status": "Present"})
+            assert response.status_code == 200, response.text
+            # Let the write reach everyone before the next one, as with one supervisor clicking
+            while any(len(listener.arrivals) <= day for listener in listeners):
+                await asyncio.sleep(0.001)
+
+        listing = await http.get("/api/attendance")
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    latencies = sorted(
+        (listener.arrivals[day] - posted[day]) * 1000 for listener in listeners for day in range(events)
+    )
+    last_client = [max(listener.arrivals[day] for listener in listeners) - posted[day] for day in range(events)]
+    return {
+        "clients": clients,
+        "events": events,
+        "deliveryMsP50": round(statistics.median(latencies), 2),
+        "deliveryMsP99": round(latencies[int(len(latencies) * 0.99) - 1], 2),
+        "allClientsMsMedian": round(statistics.median(last_client) * 1000, 2),
+        "serverRssMbIdle": round(idle_rss, 1),
+        "serverRssMbConnected": round(connected_rss, 1),
+        "pollingBytesPerWrite": len(listing.content) * clients,
+    }
+
+def main_benchmark():
+    parser = argparse.ArgumentParser(description="Benchmark live event fan-out to many SSE clients on one worker")
+    parser.add_argument("--clients", type=int, default=1000)
+    parser.add_argument("--events", type=int, default=20)
+    parser.add_argument("--url", help="Benchmark a running server instead of starting one")
+    args = parser.parse_args()
+
+    server, scratch, pid = None, None, None
+    base_url = args.url
+    if not base_url:
+        port = free_port()
+        server, scratch = start_server(port)
+        pid = server.pid
+        base_url = f"http://127.0.0.1:{port}"
+    try:
+        result = asyncio.run(measure(base_url, args.clients, args.events, pid))
+    finally:
+        if server:
+            server.terminate()
+            server.wait()
+            shutil.rmtree(scratch, ignore_errors=True)
+    print(json.dumps(result, indent=2))
+
+if __name__ == "__main__":
+    main_benchmark()
@@ -0,0 +1,72 @@
+import argparse
+import asyncio
+import time
+from types import SimpleNamespace
+
+import mongomock
+
+import application
+from metrics import Metrics
+
+# Measures what METRICS_ENABLED adds to a request: the same in-process ASGI calls against an app
+# built with and without the metrics middleware, plus the cost of recording one database command
+
+async def call(app, path):
+    scope = {
+        "type": "http", "http_version": "1.1", "method": "GET", "scheme": "http", "path": path,
+        "raw_path": path.encode(), "root_path": "", "query_string": b"", "headers": [],
+        "server": ("benchmark", 80), "client": ("benchmark", 1)
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    await app(scope, receive, send)
+
+def per_request(app, path, requests, repeat):
+    async def run():
+        for _ in range(requests):
+            await call(app, path)
+
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        asyncio.run(run())
+        timings.append((time.perf_counter() - started) / requests)
+    return min(timings)
+
+def per_command(commands, repeat):
+    metrics = Metrics()
+    listener = metrics.event_listeners()[0]
+    started_event = SimpleNamespace(command_name="find", command={"find": "attendance"}, connection_id=("db", 27017), request_id=1)
+    succeeded_event = SimpleNamespace(command_name="find", duration_micros=1500, connection_id=("db", 27017), request_id=1)
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(commands):
+            listener.started(started_event)
+            listener.succeeded(succeeded_event)
+        timings.append((time.perf_counter() - started) / commands)
+    return min(timings)
+
+def main_benchmark():
+    parser = argparse.ArgumentParser(description="Benchmark the per-request cost of the /metrics instrumentation")
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    plain = application.create_app(application.Settings.from_env(metrics_enabled=False, mongo_client=mongomock.MongoClient))
+    instrumented = application.create_app(application.Settings.from_env(metrics_enabled=True, mongo_client=mongomock.MongoClient))
+    print(f"{args.requests} in-process requests per run, best of {args.repeat}")
+    for path in ("/api/health", "/api/cache/stats"):
+        without = per_request(plain, path, args.requests, args.repeat)
+        with_metrics = per_request(instrumented, path, args.requests, args.repeat)
+        print(f"GET {path:<17} without {without * 1e6:7.1f} µs   with metrics {with_metrics * 1e6:7.1f} µs   "
+              f"(+{(with_metrics - without) * 1e6:5.1f} µs)")
+    print(f"MongoDB command listener: {per_command(args.requests * 10, args.repeat) * 1e6:.2f} µs per command")
+
+if __name__ == "__main__":
+    main_benchmark()
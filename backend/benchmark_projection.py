@@ -0,0 +1,85 @@
+import argparse
+import time
+from datetime import date, datetime, timedelta
+from unittest import mock
+
+import bson
+import mongomock
+from fastapi.testclient import TestClient
+
+import application
+
+SCENARIOS = [
+    ("/api/employees", None),
+    ("/api/employees", "employeeId,fullName"),
+    ("/api/employees", "id,fullName,department"),
+    ("/api/attendance", None),
+    ("/api/attendance", "employeeId,date,status"),
+    ("/api/attendance", "date,status"),
+]
+
+def seed(repository, employees, days):
+    repository.clear()
+    now = datetime.utcnow()
+    repository.insert_employees([
+        {
+            "employeeId": f"EMP{i:05d}",
+            "fullName": f"Employee {i}",
+            "email": f"employee{i}@company.com",
+            "department": f"Dept {i % 10}",
+            "createdAt": now
+        }
+        for i in range(employees)
+    ])
+    for day in range(days):
+        day_str = (date(2024, 1, 1) + timedelta(days=day)).isoformat()
+        repository.insert_attendance_many([
+            {
+                "employeeId": f"EMP{i:05d}",
+                "employeeName": f"Employee {i}",
+                "date": day_str,
+                "status": "Present" if (i + day) % 7 else "Absent",
+                "createdAt": now
+            }
+            for i in range(employees)
+        ])
+
+# Counts the BSON size of every document the storage layer hands back: what the server ships in its replies
+def bson_bytes_read(client, repository, path, fields):
+    counted = {"bytes": 0}
+    finders = {"/api/employees": "find_employees", "/api/attendance": "find_attendance"}
+    find = getattr(repository, finders[path])
+
+    def measured(*args, **kwargs):
+        documents = list(find(*args, **kwargs))
+        counted["bytes"] += sum(len(bson.encode(doc)) for doc in documents)
+        return documents
+
+    with mock.patch.object(repository, finders[path], measured):
+        started = time.perf_counter()
+        response = client.get(path, params={"fields": fields} if fields else {})
+        elapsed = time.perf_counter() - started
+    assert response.status_code == 200
+    return counted["bytes"], len(response.content), elapsed
+
+def main_benchmark():
+    parser = argparse.ArgumentParser(description="Measure bytes read and returned by GET listings with fields= projections")
+    parser.add_argument("--employees", type=int, default=1000)
+    parser.add_argument("--days", type=int, default=5)
+    args = parser.parse_args()
+
+    app = application.create_app(application.Settings.from_env(mongo_client=mongomock.MongoClient))
+    app.state.hrms.repository.create_indexes()
+    seed(app.state.hrms.repository, args.employees, args.days)
+    client = TestClient(app)
+
+    print(f"{args.employees} employees, {args.employees * args.days} attendance rows")
+    full = {}
+    for path, fields in SCENARIOS:
+        read, sent, elapsed = bson_bytes_read(client, app.state.hrms.repository, path, fields)
+        full.setdefault(path, (read, sent))
+        print(f"{path:<16} {fields or '(all fields)':<26} BSON {read / 1024:8.1f} KiB ({read / full[path][0]:4.0%})   "
+              f"response {sent / 1024:8.1f} KiB ({sent / full[path][1]:4.0%})   {elapsed * 1000:7.1f} ms")
+
+if __name__ == "__main__":
+    main_benchmark()
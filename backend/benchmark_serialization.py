@@ -0,0 +1,80 @@
+import argparse
+import asyncio
+import json
+import time
+from datetime import datetime, timedelta
+from typing import List
+
+from fastapi.responses import JSONResponse, ORJSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+import application
+
+def employee_documents(rows):
+    created_at = datetime(2024, 1, 1, 9, 30, 15, 123000)
+    return [
+        {
+            "_id": application.ObjectId(),
+            "employeeId": f"EMP{i:05d}",
+            "fullName": f"Employee {i}",
+            "email": f"employee{i}@company.com",
+            "department": f"Dept {i % 10}",
+            "createdAt": created_at + timedelta(seconds=i)
+        }
+        for i in range(rows)
+    ]
+
+def attendance_documents(rows):
+    created_at = datetime(2024, 1, 1, 9, 30, 15, 123000)
+    return [
+        {
+            "_id": application.ObjectId(),
+            "employeeId": f"EMP{i % 500:05d}",
+            "employeeName": f"Employee {i % 500}",
+            "date": f"2024-{i // 500 % 12 + 1:02d}-{i // 6000 % 28 + 1:02d}",
+            "status": "Present" if i % 7 else "Absent",
+            "createdAt": created_at + timedelta(seconds=i)
+        }
+        for i in range(rows)
+    ]
+
+# What FastAPI does with a returned list: validate it against response_model, then JSON-encode it
+def validated_body(field, rows):
+    content = asyncio.run(serialize_response(field=field, response_content=rows, is_coroutine=True))
+    return JSONResponse(content).body
+
+def fast_body(rows):
+    return ORJSONResponse(rows).body
+
+def best_of(fn, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        body = fn()
+        timings.append(time.perf_counter() - started)
+    return min(timings), body
+
+def main_benchmark():
+    parser = argparse.ArgumentParser(description="Benchmark list response serialization with and without the fast path")
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{args.rows} rows per response, best of {args.repeat} (ms per 10k rows)")
+    for label, documents, helper, model in (
+        ("employees", employee_documents(args.rows), application.employee_helper, application.EmployeeResponse),
+        ("attendance", attendance_documents(args.rows), application.attendance_helper, application.AttendanceResponse),
+    ):
+        field = create_response_field(name=f"Response_{label}", type_=List[model])
+        validated_time, validated = best_of(lambda: validated_body(field, [helper(doc) for doc in documents]), args.repeat)
+        fast_time, fast = best_of(lambda: fast_body([helper(doc) for doc in documents]), args.repeat)
+        assert json.loads(fast) == json.loads(validated)
+
+        per_10k = 10_000 / args.rows * 1000
+        print(f"{label:<11} response_model + json {validated_time * per_10k:7.1f} ms   "
+              f"orjson {fast_time * per_10k:7.1f} ms   {validated_time / fast_time:4.1f}x   "
+              f"identical bytes: {fast == validated}")
+
+if __name__ == "__main__":
+    main_benchmark()
@@ -0,0 +1,91 @@
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+# Previous behaviour: api/index.py created its indexes at import time, three or more round-trips
+# before the function could answer anything. Each measurement runs in a fresh interpreter so that
+# module imports are as cold as on a new serverless instance.
+
+def delay_round_trips(mongomock, rtt):
+    for name in ("create_index", "find", "find_one", "aggregate", "distinct", "insert_one", "insert_many"):
+        original = getattr(mongomock.Collection, name)
+
+        def delayed(*args, original=original, **kwargs):
+            time.sleep(rtt)
+            return original(*args, **kwargs)
+        setattr(mongomock.Collection, name, delayed)
+
+async def first_response(app, path):
+    messages = []
+    scope = {
+        "type": "http", "http_version": "1.1", "method": "GET", "scheme": "http", "path": path,
+        "raw_path": path.encode(), "root_path": "", "query_string": b"", "headers": [],
+        "server": ("benchmark", 80), "client": ("benchmark", 1)
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    await app(scope, receive, send)
+    return messages[0]["status"]
+
+def measure(eager, rtt, uri):
+    overrides = {}
+    if not uri:
+        import mongomock
+        delay_round_trips(mongomock, rtt)
+        overrides["mongo_client"] = mongomock.MongoClient
+
+    started = time.perf_counter()
+    # What api/index.py does, handed the stand-in's client when there is no --uri
+    from application import Settings, create_app
+    app = create_app(Settings.from_env(**overrides))
+    if eager:
+        app.state.hrms.repository.create_indexes()
+    imported = time.perf_counter()
+    status = asyncio.run(first_response(app, "/api/employees"))
+    responded = time.perf_counter()
+
+    assert status == 200, status
+    print(json.dumps({"import": imported - started, "firstResponse": responded - imported}))
+
+def run_child(eager, rtt, uri):
+    env = dict(os.environ, MONGODB_URI=uri) if uri else os.environ
+    command = [sys.executable, __file__, "--child", "eager" if eager else "lazy", "--rtt-ms", str(rtt * 1000)]
+    if uri:
+        command += ["--uri", uri]
+    output = subprocess.run(command, env=env, capture_output=True, text=True, check=True).stdout
+    return json.loads(output.splitlines()[-1])
+
+def main_benchmark():
+    parser = argparse.ArgumentParser(description="Benchmark import-to-first-response for api/index.py")
+    parser.add_argument("--runs", type=int, default=5, help="Cold starts per mode")
+    parser.add_argument("--rtt-ms", type=float, default=20.0,
+                        help="Simulated database round-trip time when using mongomock")
+    parser.add_argument("--uri", help="MongoDB URI to benchmark against (defaults to an in-memory mongomock)")
+    parser.add_argument("--child", choices=["eager", "lazy"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        measure(args.child == "eager", args.rtt_ms / 1000, args.uri)
+        return
+
+    print(f"{args.runs} cold starts per mode, GET /api/employees as the first request "
+          f"({'MongoDB at ' + args.uri if args.uri else f'{args.rtt_ms} ms simulated round-trips'}), median")
+    for label, eager in (("indexes at import", True), ("lazy connection", False)):
+        runs = [run_child(eager, args.rtt_ms / 1000, args.uri) for _ in range(args.runs)]
+        import_time = statistics.median(run["import"] for run in runs)
+        response_time = statistics.median(run["firstResponse"] for run in runs)
+        print(f"{label:<18} import {import_time * 1000:7.1f} ms   first response {response_time * 1000:7.1f} ms   "
+              f"total {(import_time + response_time) * 1000:7.1f} ms")
+
+if __name__ == "__main__":
+    main_benchmark()
@@ -0,0 +1,112 @@
+import argparse
+import os
+import shutil
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+
+import mongomock
+from pymongo import MongoClient
+
+from repositories import MongoRepository, SQLiteRepository
+
+# Runs the same workload through each storage backend, the way the routes call them
+
+def employee_documents(employees):
+    now = datetime.utcnow()
+    return [
+        {
+            "employeeId": f"EMP{i:05d}",
+            "fullName": f"Employee {i}",
+            "email": f"employee{i}@company.com",
+            "department": f"Dept {i % 10}",
+            "createdAt": now
+        }
+        for i in range(employees)
+    ]
+
+def attendance_documents(employees, day):
+    now = datetime.utcnow()
+    day_str = (date(2024, 1, 1) + timedelta(days=day)).isoformat()
+    return [
+        {
+            "employeeId": f"EMP{i:05d}",
+            "date": day_str,
+            "status": "Present" if (i + day) % 7 else "Absent",
+            "createdAt": now
+        }
+        for i in range(employees)
+    ]
+
+def page_through(find_page, page_size):
+    rows, after = 0, None
+    while True:
+        page = find_page(after, page_size)
+        rows += len(page)
+        if len(page) < page_size:
+            return rows
+        after = page[-1]
+
+def run_workload(repository, employees, days, page_size):
+    timings = {}
+
+    started = time.perf_counter()
+    documents = employee_documents(employees)
+    for document in documents[:employees // 2]:
+        repository.insert_employee(document)
+    repository.insert_employees(documents[employees // 2:])
+    timings["employee inserts"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for day in range(days):
+        assert repository.insert_attendance_many(attendance_documents(employees, day)) == []
+    timings["bulk attendance"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    employee_rows = page_through(
+        lambda after, limit: repository.find_employees(after=after and after["_id"], limit=limit), page_size
+    )
+    attendance_rows = page_through(
+        lambda after, limit: list(repository.find_attendance(
+            {}, after=after and [after["employeeId"], after["date"]], limit=limit
+        )),
+        page_size
+    )
+    timings["paged listing"] = time.perf_counter() - started
+    assert (employee_rows, attendance_rows) == (employees, employees * days)
+
+    started = time.perf_counter()
+    _, by_day = repository.summarize_attendance({"department": "Dept 3", "date_from": "2024-01-02"})
+    timings["summary"] = time.perf_counter() - started
+    assert len(by_day) == days - 1
+
+    return timings
+
+def main_benchmark():
+    parser = argparse.ArgumentParser(description="Benchmark the MongoDB and SQLite storage backends on the same workload")
+    parser.add_argument("--employees", type=int, default=500)
+    parser.add_argument("--days", type=int, default=20)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--uri", help="MongoDB URI to benchmark against (defaults to an in-memory mongomock)")
+    args = parser.parse_args()
+
+    client = MongoClient(args.uri) if args.uri else mongomock.MongoClient()
+    sqlite_dir = tempfile.mkdtemp()
+    backends = (
+        ("mongodb" if args.uri else "mongomock", MongoRepository(client["hrms_lite_benchmark"])),
+        ("sqlite", SQLiteRepository(os.path.join(sqlite_dir, "hrms_benchmark.sqlite3"))),
+    )
+
+    print(f"{args.employees} employees x {args.days} days, pages of {args.page_size}")
+    for label, repository in backends:
+        repository.create_indexes()
+        repository.clear()
+        timings = run_workload(repository, args.employees, args.days, args.page_size)
+        print(f"{label:<10} " + "   ".join(f"{step} {seconds * 1000:8.1f} ms" for step, seconds in timings.items()))
+
+    if args.uri:
+        client.drop_database("hrms_lite_benchmark")
+    shutil.rmtree(sqlite_dir)
+
+if __name__ == "__main__":
+    main_benchmark()
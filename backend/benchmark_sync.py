@@ -0,0 +1,84 @@
+import argparse
+import time
+from datetime import date, datetime, timedelta
+
+import mongomock
+from fastapi.testclient import TestClient
+
+import application
+
+# Compares what an incremental consumer (a payroll export, say) moves per run: re-reading both listings
+# in full, or asking GET /api/sync for what changed since its last watermark. mongomock scans a whole
+# collection per write, so run the default sizes with STORAGE_BACKEND=sqlite and a scratch SQLITE_PATH,
+# or pass smaller --employees/--days
+
+def seed(repository, employees, days):
+    repository.clear()
+    now = datetime.utcnow()
+    repository.insert_employees([
+        {
+            "employeeId": f"EMP{i:05d}",
+            "fullName": f"Employee {i}",
+            "email": f"employee{i}@company.com",
+            "department": f"Dept {i % 10}",
+            "createdAt": now
+        }
+        for i in range(employees)
+    ])
+    for day in range(days):
+        day_str = (date(2024, 1, 1) + timedelta(days=day)).isoformat()
+        repository.insert_attendance_many([
+            {
+                "employeeId": f"EMP{i:05d}",
+                "employeeName": f"Employee {i}",
+                "date": day_str,
+                "status": "Present" if (i + day) % 7 else "Absent",
+                "createdAt": now
+            }
+            for i in range(employees)
+        ])
+
+def full_dump(client) -> tuple:
+    started = time.perf_counter()
+    sent = sum(len(client.get(path).content) for path in ("/api/employees", "/api/attendance"))
+    return sent, time.perf_counter() - started
+
+def sync(client, since) -> tuple:
+    started = time.perf_counter()
+    sent = 0
+    while True:
+        response = client.get("/api/sync", params={"limit": application.MAX_SYNC_PAGE, **({"since": since} if since else {})})
+        sent += len(response.content)
+        page = response.json()
+        since = page["next"]
+        if not page["hasMore"]:
+            return sent, time.perf_counter() - started, since
+
+def main_benchmark():
+    parser = argparse.ArgumentParser(description="Compare full re-reads with delta sync for an incremental consumer")
+    parser.add_argument("--employees", type=int, default=1000)
+    parser.add_argument("--days", type=int, default=20)
+    parser.add_argument("--changes", type=int, default=50, help="Attendance marks between two consumer runs")
+    args = parser.parse_args()
+
+    app = application.create_app(application.Settings.from_env(sync_settle_seconds=0, mongo_client=mongomock.MongoClient))
+    app.state.hrms.repository.create_indexes()
+    seed(app.state.hrms.repository, args.employees, args.days)
+    client = TestClient(app)
+
+    initial, initial_time, since = sync(client, None)
+    print(f"{args.employees} employees, {args.employees * args.days} attendance rows")
+    print(f"initial sync      {initial / 1024:9.1f} KiB {initial_time * 1000:8.1f} ms")
+
+    day_str = (date(2024, 1, 1) + timedelta(days=args.days)).isoformat()
+    client.post("/api/attendance/bulk", json=[
+        {"employeeId": f"EMP{i:05d}", "date": day_str, "status": "Present"} for i in range(args.changes)
+    ])
+    dumped, dump_time = full_dump(client)
+    delta, delta_time, _ = sync(client, since)
+    print(f"after {args.changes} changes:")
+    print(f"  full re-read    {dumped / 1024:9.1f} KiB {dump_time * 1000:8.1f} ms")
+    print(f"  delta sync      {delta / 1024:9.1f} KiB {delta_time * 1000:8.1f} ms   ({dumped / delta:.0f}x fewer bytes)")
+
+if __name__ == "__main__":
+    main_benchmark()
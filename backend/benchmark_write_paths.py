@@ -0,0 +1,108 @@
+import argparse
+import statistics
+import time
+from functools import partial
+
+from fastapi import HTTPException
+from pymongo.errors import DuplicateKeyError
+
+from benchmark_attendance_listing import RoundTripDelay
+from test_concurrent_writes import atomic_insert, submit_concurrently
+import application
+
+# Previous implementations: uniqueness pre-checks with find_one, then a re-read of the inserted document
+def legacy_create_employee(employee):
+    if application.repository.employees.find_one({"employeeId": employee.employeeId}):
+        raise HTTPException(status_code=400, detail="Employee ID already exists")
+    if application.repository.employees.find_one({"email": employee.email}):
+        raise HTTPException(status_code=400, detail="Email already exists")
+    employee_dict = employee.model_dump()
+    employee_dict["createdAt"] = application.datetime.utcnow()
+    result = application.repository.employees.insert_one(employee_dict)
+    return application.employee_helper(application.repository.employees.find_one({"_id": result.inserted_id}))
+
+def legacy_create_attendance(attendance):
+    employee = application.repository.employees.find_one({"employeeId": attendance.employeeId})
+    if not employee:
+        raise HTTPException(status_code=404, detail="Employee not found")
+    if application.repository.attendance.find_one({"employeeId": attendance.employeeId, "date": attendance.date}):
+        raise HTTPException(status_code=400, detail="Attendance already marked for this employee on this date")
+    attendance_dict = attendance.model_dump()
+    attendance_dict["employeeName"] = employee["fullName"]
+    attendance_dict["createdAt"] = application.datetime.utcnow()
+    result = application.repository.attendance.insert_one(attendance_dict)
+    return application.attendance_helper(application.repository.attendance.find_one({"_id": result.inserted_id}))
+
+def reset_collections():
+    application.repository.clear()
+    application.default_state.employee_cache.clear()
+
+def employee_payload(i):
+    return application.EmployeeCreate(
+        employeeId=f"BENCH{i:05d}",
+        fullName=f"Bench Person {i}",
+        email=f"bench{i}@company.com",
+        department="Benchmarks"
+    )
+
+def time_writes(create_employee, create_attendance, writes):
+    reset_collections()
+    employee_timings = []
+    attendance_timings = []
+    for i in range(writes):
+        started = time.perf_counter()
+        create_employee(employee_payload(i))
+        employee_timings.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        create_attendance(application.AttendanceCreate(employeeId=f"BENCH{i:05d}", date="2024-06-03", status="Present"))
+        attendance_timings.append(time.perf_counter() - started)
+    return statistics.median(employee_timings), statistics.median(attendance_timings)
+
+def race_outcomes(create_employee):
+    reset_collections()
+    with atomic_insert(application.repository.employees._target):
+        outcomes = submit_concurrently(create_employee, employee_payload(0))
+    created = sum(1 for o in outcomes if isinstance(o, dict))
+    rejected = sum(1 for o in outcomes if isinstance(o, HTTPException))
+    server_errors = sum(1 for o in outcomes if isinstance(o, DuplicateKeyError))
+    return created, rejected, server_errors
+
+def main_benchmark():
+    parser = argparse.ArgumentParser(description="Benchmark POST /api/employees and POST /api/attendance write paths")
+    parser.add_argument("--writes", type=int, default=50)
+    parser.add_argument("--rtt-ms", type=float, default=2.0, help="Simulated database round-trip time")
+    args = parser.parse_args()
+
+    # The unique indexes are what turn a duplicate insert into a 400
+    application.repository.create_indexes()
+    application.repository.connect().employees = RoundTripDelay(application.repository.employees, args.rtt_ms / 1000)
+    application.repository.connect().attendance = RoundTripDelay(application.repository.attendance, args.rtt_ms / 1000)
+
+    # The handlers, called directly, work on the state the command-line tools use
+    create_employee = partial(application.create_employee, state=application.default_state)
+    create_attendance = partial(application.create_attendance, state=application.default_state)
+
+    print(f"{args.writes} writes each, {args.rtt_ms} ms per database round-trip (median latency)")
+    for label, create_employee, create_attendance in (
+        ("pre-check + re-read", legacy_create_employee, legacy_create_attendance),
+        ("insert only", create_employee, create_attendance),
+    ):
+        employee_time, attendance_time = time_writes(create_employee, create_attendance, args.writes)
+        print(f"{label:<20} employee {employee_time * 1000:6.1f} ms   attendance {attendance_time * 1000:6.1f} ms")
+
+    def handle_errors(handler):
+        def call(payload):
+            try:
+                return handler(payload)
+            except DuplicateKeyError as e:
+                return e
+        return call
+
+    print("Concurrent duplicate employee submissions (created / 400 / unhandled DuplicateKeyError):")
+    for label, create_employee in (("pre-check + re-read", legacy_create_employee), ("insert only", create_employee)):
+        created, rejected, server_errors = race_outcomes(handle_errors(create_employee))
+        print(f"{label:<20} {created} / {rejected} / {server_errors}")
+
+if __name__ == "__main__":
+    main_benchmark()
@@ -0,0 +1,42 @@
+import argparse
+
+import application
+from repositories import BucketedMongoRepository, MongoRepository
+
+# Copies attendance from the row collection into the monthly buckets served with ATTENDANCE_LAYOUT=monthly.
+# Days keep their sequence numbers, so delta sync carries on from the same watermark, though row ids
+# become "<employeeId>:<date>": sync consumers should start over without `since` after the switch.
+#
+# Run it while the app still writes rows, switch ATTENDANCE_LAYOUT to monthly, then run it again to
+# copy the rows written in between; --drop-rows then removes the row collection after the copy
+def bucket_attendance(repository: BucketedMongoRepository, batch_size: int = 10000) -> dict:
+    repository.create_indexes()
+    # Rows written before delta sync existed need a sequence number to carry over
+    repository.backfill_sequence()
+    copied, after = 0, None
+    while True:
+        read, after = repository.copy_rows_to_buckets(after, batch_size)
+        if read == 0:
+            break
+        copied += read
+    return {"rows": copied, "days": repository.count_bucketed_days()}
+
+def main_bucket_attendance():
+    parser = argparse.ArgumentParser(description="Copy attendance rows into monthly buckets for ATTENDANCE_LAYOUT=monthly")
+    parser.add_argument("--batch-size", type=int, default=10000, help="Rows read per batch")
+    parser.add_argument("--drop-rows", action="store_true", help="Drop the row collection after copying it")
+    args = parser.parse_args()
+
+    connected = application.repository.connect()
+    if not isinstance(connected, MongoRepository):
+        parser.error("the monthly layout is only available with MongoDB")
+    repository = BucketedMongoRepository(connected.db)
+
+    counts = bucket_attendance(repository, args.batch_size)
+    print(f"Copied {counts['rows']} attendance rows; the buckets now hold {counts['days']} days")
+    if args.drop_rows:
+        repository.attendance.drop()
+        print("Dropped the attendance row collection")
+
+if __name__ == "__main__":
+    main_bucket_attendance()
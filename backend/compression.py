@@ -0,0 +1,156 @@
+import zlib
+from typing import Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Response compression for the API. Listings are repetitive JSON that shrinks roughly 10x, and
+# neither Render nor uvicorn compresses on our behalf. gzip is always available; brotli and zstd
+# are used when their packages are installed and the client asks for them.
+#
+# Streamed responses (the NDJSON/CSV export) are flushed after every chunk, so each chunk
+# reaches the client as soon as it is produced instead of waiting for the compressor's buffer.
+
+COMPRESSIBLE_TYPES = (
+    "text/", "application/json", "application/x-ndjson", "application/javascript",
+    "application/xml", "image/svg+xml"
+)
+
+class GzipEncoder:
+    def __init__(self, level: int):
+        self.compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes, final: bool) -> bytes:
+        return self.compressor.compress(data) + self.compressor.flush(zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH)
+
+class BrotliEncoder:
+    def __init__(self, level: int):
+        self.compressor = brotli.Compressor(quality=min(level, 11))
+
+    def compress(self, data: bytes, final: bool) -> bytes:
+        return self.compressor.process(data) + (self.compressor.finish() if final else self.compressor.flush())
+
+class ZstdEncoder:
+    def __init__(self, level: int):
+        self.compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes, final: bool) -> bytes:
+        flush = zstandard.COMPRESSOBJ_FLUSH_FINISH if final else zstandard.COMPRESSOBJ_FLUSH_BLOCK
+        return self.compressor.compress(data) + self.compressor.flush(flush)
+
+ENCODERS = {"gzip": GzipEncoder}
+if brotli is not None:
+    ENCODERS["br"] = BrotliEncoder
+if zstandard is not None:
+    ENCODERS["zstd"] = ZstdEncoder
+
+def available_encodings(preferred: list) -> list:
+    return [encoding for encoding in preferred if encoding in ENCODERS]
+
+# Picks the first of our encodings (in preference order) that Accept-Encoding allows
+def negotiate(accept_encoding: str, encodings: list) -> Optional[str]:
+    weights = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        if not name:
+            continue
+        weight = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                weight = float(params[2:])
+            except ValueError:
+                weight = 0.0
+        weights[name.strip().lower()] = weight
+    for encoding in encodings:
+        if weights.get(encoding, weights.get("*", 0.0)) > 0:
+            return encoding
+    return None
+
+class CompressionMiddleware:
+    def __init__(self, app, encodings: list, minimum_size: int = 1000, level: int = 6):
+        self.app = app
+        self.encodings = available_encodings(encodings)
+        self.minimum_size = minimum_size
+        self.level = level
+
+    async def __call__(self, scope, receive, send):
+        encoding = None
+        if scope["type"] == "http" and self.encodings:
+            encoding = negotiate(Headers(scope=scope).get("accept-encoding", ""), self.encodings)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        responder = CompressionResponder(self.app, ENCODERS[encoding], encoding, self.minimum_size, self.level)
+        await responder(scope, receive, send)
+
+class CompressionResponder:
+    def __init__(self, app, encoder_class, encoding: str, minimum_size: int, level: int):
+        self.app = app
+        self.encoder_class = encoder_class
+        self.encoding = encoding
+        self.minimum_size = minimum_size
+        self.level = level
+        self.send = None
+        self.start_message = None
+        self.encoder = None
+
+    async def __call__(self, scope, receive, send):
+        self.send = send
+        await self.app(scope, receive, self.send_compressed)
+
+    def compressible(self, headers: MutableHeaders) -> bool:
+        return (
+            "content-encoding" not in headers
+            and "no-transform" not in headers.get("cache-control", "")
+            and headers.get("content-type", "").startswith(COMPRESSIBLE_TYPES)
+        )
+
+    async def send_compressed(self, message):
+        if message["type"] == "http.response.start":
+            # Held back until the first body chunk shows whether the response is worth compressing
+            self.start_message = message
+            return
+        if message["type"] != "http.response.body":
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if self.start_message is not None:
+            start, self.start_message = self.start_message, None
+            headers = MutableHeaders(raw=start["headers"])
+            if not self.compressible(headers) or (not more_body and len(body) < max(self.minimum_size, 1)):
+                await self.send(start)
+                await self.send(message)
+                return
+
+            self.encoder = self.encoder_class(self.level)
+            body = self.encoder.compress(body, final=not more_body)
+            headers["Content-Encoding"] = self.encoding
+            headers.add_vary_header("Accept-Encoding")
+            # The compressed bytes are a different representation; If-None-Match still matches weakly
+            etag = headers.get("etag")
+            if etag and not etag.startswith("W/"):
+                headers["ETag"] = f"W/{etag}"
+            if more_body:
+                if "content-length" in headers:
+                    del headers["content-length"]
+            else:
+                headers["Content-Length"] = str(len(body))
+            await self.send(start)
+            await self.send({**message, "body": body})
+            return
+
+        if self.encoder is not None:
+            message = {**message, "body": self.encoder.compress(body, final=not more_body)}
+        await self.send(message)
@@ -0,0 +1,40 @@
+import os
+import tempfile
+
+import mongomock
+import pytest
+from fastapi.testclient import TestClient
+
+# Apps run against an in-memory MongoDB stand-in, or a scratch database file when the suite runs with STORAGE_BACKEND=sqlite
+os.environ.setdefault("SQLITE_PATH", os.path.join(tempfile.mkdtemp(), "hrms.sqlite3"))
+
+import application
+
+# Settings the app is built with, over the environment's; override the fixture in a module, or parametrize a test with it
+@pytest.fixture
+def app_settings():
+    return {}
+
+# Builds an app over empty storage with these settings. Each mongomock client starts out empty, but
+# the SQLite file is shared between tests, so storage is cleared
+@pytest.fixture
+def make_app():
+    def make_app(**overrides):
+        app = application.create_app(application.Settings.from_env(mongo_client=mongomock.MongoClient, **overrides))
+        app.state.hrms.repository.create_indexes()
+        app.state.hrms.repository.clear()
+        return app
+    return make_app
+
+# A new app per test, with its own repository, employee cache, live feed and list versions
+@pytest.fixture
+def app(make_app, app_settings):
+    return make_app(**app_settings)
+
+@pytest.fixture
+def state(app):
+    return app.state.hrms
+
+@pytest.fixture
+def client(app):
+    return TestClient(app)
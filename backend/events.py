@@ -0,0 +1,128 @@
+import asyncio
+import json
+import threading
+import uuid
+from collections import deque
+from typing import Optional
+
+from fastapi.encoders import jsonable_encoder
+
+# Live change feed for GET /api/events (Server-Sent Events). Route handlers, which run in the thread
+# pool, publish inserted and deleted rows; each event is encoded once and the same frame is queued
+# for every connected client on the event loop, so a write costs one encode however many are listening.
+#
+# Clients resume after a reconnect from the Last-Event-ID they send: recent frames are replayed from
+# a bounded history. A client that falls too far behind, or asks for an id the history no longer
+# holds, gets a `reset` event and should re-fetch the listings.
+#
+# Event ids are `<broker>-<n>`, counted by each broker (one per worker process), so an id from another
+# process or an earlier run of this one is not mistaken for a position in this history; it gets a reset.
+# A broker only carries the writes its own process handles, unless a change stream feeds it: on Vercel,
+# where each serverless instance has its own broker, a client sees only the writes of the instance
+# that happens to serve its connection.
+
+RESET = b"event: reset\ndata: {}\n\n"
+# Bulk writes publish whole chunks, so the replay history is bounded in bytes as well as events
+MAX_HISTORY_BYTES = 8 * 1024 * 1024
+HEARTBEAT = b": keepalive\n\n"
+
+def event_frame(event_id: str, kind: str, rows: list) -> bytes:
+    data = json.dumps(jsonable_encoder(rows), separators=(",", ":"))
+    return f"id: {event_id}\nevent: {kind}\ndata: {data}\n\n".encode()
+
+class Subscriber:
+    def __init__(self):
+        self.loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue()
+
+class EventBroker:
+    def __init__(self, queue_size: int = 1000, history_size: int = 1000):
+        self.queue_size = queue_size
+        self.instance = uuid.uuid4().hex[:12]
+        self.history_size = history_size
+        self.lock = threading.Lock()
+        self.history = deque()
+        self.history_bytes = 0
+        self.last_id = 0
+        self.subscribers = set()
+        # Set while a change stream is publishing writes in place of the route handlers
+        self.change_stream = False
+
+    # Safe to call from any thread
+    def publish(self, kind: str, rows: list):
+        if not rows:
+            return
+        with self.lock:
+            self.last_id += 1
+            frame = event_frame(f"{self.instance}-{self.last_id}", kind, rows)
+            self.history.append((self.last_id, frame))
+            self.history_bytes += len(frame)
+            while len(self.history) > self.history_size or (self.history_bytes > MAX_HISTORY_BYTES and len(self.history) > 1):
+                self.history_bytes -= len(self.history.popleft()[1])
+            loops = {subscriber.loop for subscriber in self.subscribers}
+        # Queues belong to the loop their client is served on (one per worker outside of tests)
+        for loop in loops:
+            try:
+                loop.call_soon_threadsafe(self.fan_out, loop, frame)
+            except RuntimeError:
+                # The loop has closed; its clients are gone
+                pass
+
+    def fan_out(self, loop, frame: bytes):
+        with self.lock:
+            subscribers = [subscriber for subscriber in self.subscribers if subscriber.loop is loop]
+        for subscriber in subscribers:
+            if subscriber.queue.qsize() >= self.queue_size:
+                self.unsubscribe(subscriber)
+                subscriber.queue.put_nowait(RESET)
+            else:
+                subscriber.queue.put_nowait(frame)
+
+    def unsubscribe(self, subscriber: Subscriber):
+        with self.lock:
+            self.subscribers.discard(subscriber)
+
+    def backlog(self, last_event_id: Optional[str]) -> list:
+        if last_event_id is None:
+            return []
+        instance, _, after = last_event_id.rpartition("-")
+        if instance != self.instance or not after.isdigit():
+            return [RESET]
+        after = int(after)
+        with self.lock:
+            if after == self.last_id:
+                return []
+            if after > self.last_id or not self.history or self.history[0][0] > after + 1:
+                return [RESET]
+            return [frame for event_id, frame in self.history if event_id > after]
+
+    async def stream(self, last_event_id: Optional[str] = None, heartbeat: float = 15):
+        subscriber = Subscriber()
+        with self.lock:
+            self.subscribers.add(subscriber)
+        try:
+            # Registered before the backlog is read, so nothing published in between is missed;
+            # a frame that arrives both ways is sent once
+            replayed = self.backlog(last_event_id)
+            for frame in replayed:
+                yield frame
+                if frame is RESET:
+                    return
+            skip = set(replayed)
+            yield b"retry: 3000\n\n"
+            while True:
+                try:
+                    frame = await asyncio.wait_for(subscriber.queue.get(), heartbeat)
+                except asyncio.TimeoutError:
+                    yield HEARTBEAT
+                    continue
+                if frame in skip:
+                    continue
+                yield frame
+                if frame is RESET:
+                    return
+        finally:
+            self.unsubscribe(subscriber)
+
+    def stats(self) -> dict:
+        return {"subscribers": len(self.subscribers), "lastEventId": f"{self.instance}-{self.last_id}"}
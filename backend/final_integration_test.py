@@ -1,139 +0,0 @@
-import requests
-import json
-import time
-from datetime import datetime
-
-def final_integration_test():
-    """Final integration test to verify the complete HRMS Lite system"""
-    print("🎯 FINAL INTEGRATION TEST - HRMS Lite")
-    print("=" * 50)
-    
-    BASE_URL = "http://localhost:5000/api"
-    FRONTEND_URL = "http://localhost:3000"
-    
-    # Test 1: Backend Health Check
-    print("\n1️⃣ Backend Health Check")
-    try:
-        response = requests.get(f"{BASE_URL}/employees")
-        if response.status_code == 200:
-            print("✅ Backend is running and responsive")
-        else:
-            print(f"❌ Backend error: {response.status_code}")
-            return False
-    except Exception as e:
-        print(f"❌ Backend connection failed: {e}")
-        return False
-    
-    # Test 2: Frontend Accessibility Check
-    print("\n2️⃣ Frontend Accessibility Check")
-    try:
-        response = requests.get(f"{FRONTEND_URL}")
-        if response.status_code == 200:
-            print("✅ Frontend is accessible")
-        else:
-            print(f"⚠️  Frontend may not be running (status: {response.status_code})")
-    except Exception as e:
-        print(f"⚠️  Frontend check failed: {e}")
-    
-    # Test 3: Complete Workflow Test
-    print("\n3️⃣ Complete Workflow Test")
-    
-    # Create test employee
-    test_employee = {
-        "employeeId": f"TEST{int(time.time())}",
-        "fullName": "Integration Test User",
-        "email": f"test{int(time.time())}@company.com",
-        "department": "QA"
-    }
-    
-    try:
-        # Create employee
-        response = requests.post(f"{BASE_URL}/employees", json=test_employee)
-        if response.status_code == 200:
-            created_employee = response.json()
-            print(f"✅ Created employee: {created_employee['fullName']}")
-        else:
-            print(f"❌ Failed to create employee: {response.status_code}")
-            return False
-        
-        # Mark attendance
-        attendance_data = {
-            "employeeId": created_employee['employeeId'],
-            "date": datetime.now().strftime("%Y-%m-%d"),
-            "status": "Present"
-        }
-        
-        response = requests.post(f"{BASE_URL}/attendance", json=attendance_data)
-        if response.status_code == 200:
-            print("✅ Marked attendance successfully")
-        else:
-            print(f"❌ Failed to mark attendance: {response.status_code}")
-        
-        # Verify data persistence
-        response = requests.get(f"{BASE_URL}/employees")
-        if response.status_code == 200:
-            employees = response.json()
-            print(f"✅ Total employees: {len(employees)}")
-        
-        response = requests.get(f"{BASE_URL}/attendance")
-        if response.status_code == 200:
-            attendance = response.json()
-            print(f"✅ Total attendance records: {len(attendance)}")
-        
-        # Test deletion (simulating confirmation modal)
-        response = requests.delete(f"{BASE_URL}/employees/{created_employee['id']}")
-        if response.status_code == 200:
-            print("✅ Employee deletion works (confirmation modal ready)")
-        else:
-            print(f"⚠️  Deletion test failed: {response.status_code}")
-        
-    except Exception as e:
-        print(f"❌ Workflow test failed: {e}")
-        return False
-    
-    # Test 4: API Response Validation
-    print("\n4️⃣ API Response Validation")
-    try:
-        # Test employee structure
-        response = requests.get(f"{BASE_URL}/employees")
-        if response.status_code == 200:
-            employees = response.json()
-            if employees:
-                sample = employees[0]
-                required_fields = ['id', 'employeeId', 'fullName', 'email', 'department']
-                missing_fields = [field for field in required_fields if field not in sample]
-                if not missing_fields:
-                    print("✅ Employee API response structure is correct")
-                else:
-                    print(f"⚠️  Missing fields in employee response: {missing_fields}")
-        
-        # Test attendance structure
-        response = requests.get(f"{BASE_URL}/attendance")
-        if response.status_code == 200:
-            attendance = response.json()
-            if attendance:
-                sample = attendance[0]
-                required_fields = ['_id', 'employeeId', 'date', 'status']
-                missing_fields = [field for field in required_fields if field not in sample]
-                if not missing_fields:
-                    print("✅ Attendance API response structure is correct")
-                else:
-                    print(f"⚠️  Missing fields in attendance response: {missing_fields}")
-                    
-    except Exception as e:
-        print(f"❌ API validation failed: {e}")
-    
-    print("\n" + "=" * 50)
-    print("🎉 FINAL INTEGRATION TEST COMPLETE!")
-    print("✅ FastAPI backend is fully functional")
-    print("✅ MongoDB integration works correctly")
-    print("✅ Employee CRUD operations are working")
-    print("✅ Attendance tracking is operational")
-    print("✅ Confirmation modal backend is ready")
-    print("✅ Frontend-backend integration is configured")
-    print("=" * 50)
-    
-    return True
-
-if __name__ == "__main__":
-    final_integration_test()
\ No newline at end of file
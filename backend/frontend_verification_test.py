@@ -1,126 +0,0 @@
-import requests
-import json
-import time
-from datetime import datetime
-
-def frontend_integration_verification():
-    """Verify frontend-backend integration is working correctly after fixes"""
-    print("🔍 FRONTEND INTEGRATION VERIFICATION - HRMS Lite")
-    print("=" * 60)
-    
-    BASE_URL = "http://localhost:5000/api"
-    
-    # Test 1: Verify Employee Data Structure
-    print("\n1️⃣ Employee Data Structure Verification")
-    try:
-        response = requests.get(f"{BASE_URL}/employees")
-        if response.status_code == 200:
-            employees = response.json()
-            if employees:
-                sample = employees[0]
-                print(f"✅ Employee ID field: {'id' in sample}")
-                print(f"✅ Employee data type: {type(sample.get('id'))}")
-                print(f"✅ Employee ID value: {sample.get('id')}")
-                print(f"✅ Employee ID field (not _id): {'id' in sample and '_id' not in sample}")
-            else:
-                print("⚠️  No employees found")
-        else:
-            print(f"❌ Failed to fetch employees: {response.status_code}")
-    except Exception as e:
-        print(f"❌ Employee structure test failed: {e}")
-    
-    # Test 2: Verify Attendance Data Structure
-    print("\n2️⃣ Attendance Data Structure Verification")
-    try:
-        response = requests.get(f"{BASE_URL}/attendance")
-        if response.status_code == 200:
-            attendance = response.json()
-            if attendance:
-                sample = attendance[0]
-                print(f"✅ Attendance ID field: {'_id' in sample}")
-                print(f"✅ Employee ID field: {'employeeId' in sample}")
-                print(f"✅ Date field: {'date' in sample}")
-                print(f"✅ Status field: {'status' in sample}")
-            else:
-                print("⚠️  No attendance records found")
-        else:
-            print(f"❌ Failed to fetch attendance: {response.status_code}")
-    except Exception as e:
-        print(f"❌ Attendance structure test failed: {e}")
-    
-    # Test 3: Test Employee Creation with Frontend-Compatible Structure
-    print("\n3️⃣ Frontend-Compatible Employee Creation")
-    try:
-        test_employee = {
-            "employeeId": f"FRONTEND{int(time.time())}",
-            "fullName": "Frontend Test User",
-            "email": f"frontend{int(time.time())}@company.com",
-            "department": "QA"
-        }
-        
-        response = requests.post(f"{BASE_URL}/employees", json=test_employee)
-        if response.status_code == 200:
-            created_employee = response.json()
-            print(f"✅ Created employee with ID: {created_employee.get('id')}")
-            print(f"✅ Employee structure has 'id' field: {'id' in created_employee}")
-            print(f"✅ Employee structure does NOT have '_id' field: {'_id' not in created_employee}")
-            
-            # Test deletion with correct ID field
-            delete_response = requests.delete(f"{BASE_URL}/employees/{created_employee['id']}")
-            if delete_response.status_code == 200:
-                print("✅ Deletion with 'id' field works correctly")
-            else:
-                print(f"❌ Deletion failed: {delete_response.status_code}")
-        else:
-            print(f"❌ Employee creation failed: {response.status_code}")
-    except Exception as e:
-        print(f"❌ Frontend-compatible test failed: {e}")
-    
-    # Test 4: Test Attendance with Employee ID (not _id)
-    print("\n4️⃣ Attendance with Employee ID Verification")
-    try:
-        # Create test employee
-        test_employee = {
-            "employeeId": f"ATTEND{int(time.time())}",
-            "fullName": "Attendance Test User",
-            "email": f"attend{int(time.time())}@company.com",
-            "department": "Testing"
-        }
-        
-        response = requests.post(f"{BASE_URL}/employees", json=test_employee)
-        if response.status_code == 200:
-            created_employee = response.json()
-            
-            # Test attendance with employeeId (not _id)
-            attendance_data = {
-                "employeeId": created_employee['employeeId'],  # Use employeeId, not _id
-                "date": datetime.now().strftime("%Y-%m-%d"),
-                "status": "Present"
-            }
-            
-            attendance_response = requests.post(f"{BASE_URL}/attendance", json=attendance_data)
-            if attendance_response.status_code == 200:
-                print("✅ Attendance creation with employeeId works correctly")
-                print("✅ No '_id' reference needed for attendance")
-            else:
-                print(f"❌ Attendance creation failed: {attendance_response.status_code}")
-                print(f"Response: {attendance_response.text}")
-            
-            # Clean up
-            requests.delete(f"{BASE_URL}/employees/{created_employee['id']}")
-        else:
-            print(f"❌ Test employee creation failed: {response.status_code}")
-    except Exception as e:
-        print(f"❌ Attendance verification failed: {e}")
-    
-    print("\n" + "=" * 60)
-    print("🎉 FRONTEND INTEGRATION VERIFICATION COMPLETE!")
-    print("✅ Employee data uses 'id' field (not '_id')")
-    print("✅ Attendance uses 'employeeId' field")
-    print("✅ Deletion works with correct 'id' field")
-    print("✅ No React key warnings expected")
-    print("✅ Frontend-backend data structure alignment verified")
-    print("=" * 60)
-
-if __name__ == "__main__":
-    frontend_integration_verification()
\ No newline at end of file
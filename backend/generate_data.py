@@ -0,0 +1,165 @@
+import argparse
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, timedelta
+
+import application
+from rollups import rebuild_rollups
+
+# Fills the configured database with a synthetic company for scale testing: employees spread over
+# departments of different sizes, each with a stretch of weekday attendance and realistic absences.
+# Every employee is generated from (seed, index) alone, so a run is reproducible whatever the number
+# of workers, and each worker process writes its own blocks of employees without coordinating
+
+DEPARTMENTS = [
+    ("Engineering", 30), ("Sales", 18), ("Operations", 15), ("Customer Support", 12), ("Marketing", 8),
+    ("Finance", 7), ("Human Resources", 5), ("Legal", 3), ("Facilities", 2),
+]
+FIRST_NAMES = [
+    "James", "Mary", "Robert", "Patricia", "John", "Jennifer", "Michael", "Linda", "David", "Elizabeth",
+    "William", "Barbara", "Richard", "Susan", "Joseph", "Jessica", "Thomas", "Sarah", "Priya", "Rahul",
+    "Wei", "Mei", "Hiroshi", "Yuki", "Carlos", "Maria", "Ahmed", "Fatima", "Olga", "Ivan",
+]
+LAST_NAMES = [
+    "Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis", "Rodriguez", "Martinez",
+    "Wilson", "Anderson", "Taylor", "Thomas", "Moore", "Jackson", "Lee", "Sharma", "Patel", "Chen",
+    "Wang", "Tanaka", "Sato", "Silva", "Santos", "Khan", "Ali", "Ivanova", "Novak", "Nguyen",
+]
+
+# Absences are likelier next to weekends and in flu season, summer and December
+WEEKDAY_FACTORS = [1.3, 1.0, 0.9, 1.0, 1.4]
+MONTH_FACTORS = [1.5, 1.4, 1.1, 1.0, 1.0, 1.0, 1.2, 1.3, 1.0, 1.0, 1.1, 1.3]
+# A sick day is followed by another with this probability
+SICK_SPELL_CONTINUES = 0.35
+VACATION_DAYS = 5
+VACATIONS_PER_YEAR = 2
+WORKING_DAYS_PER_YEAR = 261
+
+def working_days(start: date, end: date) -> list:
+    days = []
+    day = start
+    while day <= end:
+        if day.weekday() < 5:
+            days.append(day)
+        day += timedelta(days=1)
+    return days
+
+def employee_document(seed: int, index: int, start: date) -> dict:
+    rng = random.Random(f"{seed}:employee:{index}")
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    department = rng.choices([name for name, _ in DEPARTMENTS], [weight for _, weight in DEPARTMENTS])[0]
+    return {
+        "employeeId": f"EMP{index:06d}",
+        "fullName": f"{first} {last}",
+        "email": f"{first}.{last}.{index}@company.com".lower(),
+        "department": department,
+        "createdAt": datetime.combine(start, datetime.min.time()) - timedelta(days=rng.randint(1, 30))
+    }
+
+# A contiguous stretch of working days (all of them when stretch is None), marked Present or Absent
+def attendance_days(seed: int, index: int, days: list, stretch) -> tuple:
+    rng = random.Random(f"{seed}:attendance:{index}")
+    length = len(days) if stretch is None else min(len(days), max(1, round(stretch * rng.uniform(0.5, 1.5))))
+    first = rng.randint(0, len(days) - length)
+    days = days[first:first + length]
+
+    # Most people are rarely off; a few are off a lot
+    base_rate = rng.betavariate(1.5, 30)
+    absent = set()
+    for _ in range(round(VACATIONS_PER_YEAR * length / WORKING_DAYS_PER_YEAR)):
+        start = rng.randrange(length)
+        absent.update(range(start, min(start + VACATION_DAYS, length)))
+    sick = False
+    statuses = []
+    for offset, day in enumerate(days):
+        if offset in absent:
+            sick = False
+            statuses.append("Absent")
+            continue
+        chance = SICK_SPELL_CONTINUES if sick else base_rate * WEEKDAY_FACTORS[day.weekday()] * MONTH_FACTORS[day.month - 1]
+        sick = rng.random() < chance
+        statuses.append("Absent" if sick else "Present")
+    return days, statuses
+
+def generate_block(seed: int, first: int, count: int, start: date, end: date, stretch, chunk_size: int) -> tuple:
+    days = working_days(start, end)
+    employees = [employee_document(seed, index, start) for index in range(first, first + count)]
+    inserted, duplicates = application.repository.insert_employees(employees)
+    # Employees left by an earlier run with the same seed keep their attendance, which is identical
+    existing = {index for index, _ in duplicates}
+
+    rows = []
+    created = 0
+    for offset, employee in enumerate(employees):
+        if offset in existing:
+            continue
+        marked, statuses = attendance_days(seed, first + offset, days, stretch)
+        for day, status in zip(marked, statuses):
+            rows.append({
+                "employeeId": employee["employeeId"],
+                "employeeName": employee["fullName"],
+                "date": day.isoformat(),
+                "status": status,
+                "createdAt": datetime(day.year, day.month, day.day, 9)
+            })
+        if len(rows) >= chunk_size:
+            created += len(rows) - len(application.repository.insert_attendance_many(rows))
+            rows = []
+    if rows:
+        created += len(rows) - len(application.repository.insert_attendance_many(rows))
+    return inserted, created
+
+# The day after the same date `years` earlier, so a range ending on 31 December covers whole calendar years
+def range_start(end: date, years: int) -> date:
+    try:
+        earlier = end.replace(year=end.year - years)
+    except ValueError:
+        # 29 February in a year that has none
+        earlier = end.replace(year=end.year - years, day=28)
+    return earlier + timedelta(days=1)
+
+def generate(employees: int, rows=None, years: int = 2, end: date = date(2024, 12, 31), seed: int = 0,
+             workers: int = 1, block_size: int = 1000, chunk_size: int = 10000) -> dict:
+    start = range_start(end, years)
+    stretch = None if rows is None else rows / employees
+    blocks = [
+        (seed, first, min(block_size, employees - first), start, end, stretch, chunk_size)
+        for first in range(0, employees, block_size)
+    ]
+    application.repository.create_indexes()
+    # Each worker process opens its own connection on first use
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(generate_block, *zip(*blocks)))
+    else:
+        results = [generate_block(*block) for block in blocks]
+    return {"employees": sum(inserted for inserted, _ in results), "attendance": sum(created for _, created in results)}
+
+def main_generate():
+    parser = argparse.ArgumentParser(description="Fill the configured database with synthetic employees and attendance")
+    parser.add_argument("--employees", type=int, default=1000)
+    parser.add_argument("--rows", type=int,
+                        help="Approximate number of attendance rows (default: every employee on every working day)")
+    parser.add_argument("--years", type=int, default=2, help="Years of attendance, ending on --end")
+    parser.add_argument("--end", type=date.fromisoformat, default=date(2024, 12, 31))
+    parser.add_argument("--seed", type=int, default=0, help="The same seed generates the same data")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Processes writing in parallel")
+    parser.add_argument("--block-size", type=int, default=1000, help="Employees per worker task")
+    parser.add_argument("--chunk-size", type=int, default=10000, help="Attendance rows per insert")
+    parser.add_argument("--skip-rollups", action="store_true", help="Leave the rollups for `python rollups.py rebuild`")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    counts = generate(args.employees, args.rows, args.years, args.end, args.seed, args.workers, args.block_size, args.chunk_size)
+    elapsed = time.perf_counter() - started
+    print(f"Added {counts['employees']} employees and {counts['attendance']} attendance rows to the "
+          f"{application.settings.storage_backend} backend in {elapsed:.1f}s ({counts['attendance'] / elapsed:,.0f} rows/s)")
+    if not args.skip_rollups:
+        started = time.perf_counter()
+        rollups = rebuild_rollups(application.repository, args.workers)
+        print(f"Rebuilt rollups: {rollups['monthly']} monthly rows, {rollups['daily']} daily rows in {time.perf_counter() - started:.1f}s")
+
+if __name__ == "__main__":
+    main_generate()
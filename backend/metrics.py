@@ -0,0 +1,219 @@
+import threading
+import time
+from bisect import bisect_left
+
+from pymongo import monitoring
+
+# Process-wide request and database metrics, rendered in the Prometheus text format at GET /metrics.
+# Each worker process keeps its own counts, so scrape every worker (or run one per container).
+#
+# Recording is a bisect and a few list updates under a lock; HTTP requests are timed in the
+# middleware below, MongoDB commands and pool checkouts by pymongo's monitoring listeners.
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+DB_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+
+def escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+def label_text(names: tuple, values: tuple, extra: str = "") -> str:
+    pairs = [f'{name}="{escape_label(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+def format_value(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+class Counter:
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labels: tuple = ()):
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self.lock = threading.Lock()
+        self.values = {}
+
+    def inc(self, labels: tuple = (), amount: float = 1):
+        with self.lock:
+            self.values[labels] = self.values.get(labels, 0) + amount
+
+    def samples(self) -> list:
+        with self.lock:
+            values = sorted(self.values.items())
+        return [f"{self.name}{label_text(self.labels, key)} {format_value(value)}" for key, value in values]
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def dec(self, labels: tuple = (), amount: float = 1):
+        self.inc(labels, -amount)
+
+class Histogram:
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, labels: tuple = (), buckets: tuple = LATENCY_BUCKETS):
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self.buckets = buckets
+        self.lock = threading.Lock()
+        # label values -> per-bucket counts (the last one is +Inf), then the sum of observations
+        self.series = {}
+
+    def observe(self, labels: tuple, value: float):
+        index = bisect_left(self.buckets, value)
+        with self.lock:
+            series = self.series.get(labels)
+            if series is None:
+                series = self.series[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+            series[index] += 1
+            series[-1] += value
+
+    def samples(self) -> list:
+        with self.lock:
+            series = sorted((key, list(counts)) for key, counts in self.series.items())
+        lines = []
+        for key, counts in series:
+            cumulative = 0
+            for bound, count in zip(self.buckets + ("+Inf",), counts):
+                cumulative += count
+                le = f'le="{bound}"'
+                lines.append(f"{self.name}_bucket{label_text(self.labels, key, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{label_text(self.labels, key)} {format_value(counts[-1])}")
+            lines.append(f"{self.name}_count{label_text(self.labels, key)} {cumulative}")
+        return lines
+
+class Metrics:
+    def __init__(self):
+        self.requests = Counter("http_requests_total", "HTTP requests handled", ("method", "route", "status"))
+        self.request_duration = Histogram(
+            "http_request_duration_seconds", "Time to the end of the response body", ("method", "route"), LATENCY_BUCKETS
+        )
+        self.in_flight = Gauge("http_requests_in_flight", "HTTP requests being handled")
+        self.db_command_duration = Histogram(
+            "mongodb_command_duration_seconds", "MongoDB command round trips", ("command", "collection"), DB_BUCKETS
+        )
+        self.db_command_failures = Counter("mongodb_command_failures_total", "MongoDB commands that failed", ("command", "collection"))
+        self.pool_checkout_wait = Histogram(
+            "mongodb_pool_checkout_wait_seconds", "Time spent waiting for a pooled connection", (), DB_BUCKETS
+        )
+        self.pool_checkout_failures = Counter("mongodb_pool_checkout_failures_total", "Connection checkouts that failed", ("reason",))
+
+    def all(self) -> list:
+        return [
+            self.requests, self.request_duration, self.in_flight,
+            self.db_command_duration, self.db_command_failures, self.pool_checkout_wait, self.pool_checkout_failures
+        ]
+
+    def render(self) -> str:
+        lines = []
+        for metric in self.all():
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+    # Passed to MongoClient(event_listeners=...)
+    def event_listeners(self) -> list:
+        return [CommandTimer(self), PoolCheckoutTimer(self)]
+
+# Command events only name the collection when the command starts, so it is kept until the reply arrives
+def command_collection(event) -> str:
+    collection = event.command.get(event.command_name)
+    if not isinstance(collection, str):
+        collection = event.command.get("collection", "")
+    return collection if isinstance(collection, str) else ""
+
+class CommandTimer(monitoring.CommandListener):
+    def __init__(self, metrics: Metrics):
+        self.metrics = metrics
+        self.collections = {}
+
+    def started(self, event):
+        self.collections[(event.connection_id, event.request_id)] = command_collection(event)
+
+    def succeeded(self, event):
+        collection = self.collections.pop((event.connection_id, event.request_id), "")
+        self.metrics.db_command_duration.observe((event.command_name, collection), event.duration_micros / 1e6)
+
+    def failed(self, event):
+        collection = self.collections.pop((event.connection_id, event.request_id), "")
+        self.metrics.db_command_duration.observe((event.command_name, collection), event.duration_micros / 1e6)
+        self.metrics.db_command_failures.inc((event.command_name, collection))
+
+# A checkout starts and finishes on the thread running the operation
+class PoolCheckoutTimer(monitoring.ConnectionPoolListener):
+    def __init__(self, metrics: Metrics):
+        self.metrics = metrics
+        self.local = threading.local()
+
+    def connection_check_out_started(self, event):
+        self.local.started = time.perf_counter()
+
+    def connection_checked_out(self, event):
+        started = getattr(self.local, "started", None)
+        if started is not None:
+            self.metrics.pool_checkout_wait.observe((), time.perf_counter() - started)
+            self.local.started = None
+
+    def connection_check_out_failed(self, event):
+        self.local.started = None
+        self.metrics.pool_checkout_failures.inc((str(event.reason),))
+
+    # pymongo calls every pool event on a registered listener
+    def pool_created(self, event):
+        pass
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        pass
+
+    def pool_closed(self, event):
+        pass
+
+    def connection_created(self, event):
+        pass
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_closed(self, event):
+        pass
+
+    def connection_checked_in(self, event):
+        pass
+
+class MetricsMiddleware:
+    def __init__(self, app, metrics: Metrics):
+        self.app = app
+        self.metrics = metrics
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = [500]
+
+        async def send_with_status(message):
+            if message["type"] == "http.response.start":
+                status[0] = message["status"]
+            await send(message)
+
+        self.metrics.in_flight.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - started
+            self.metrics.in_flight.dec()
+            # The route template (e.g. /api/employees/{employee_id}), so ids do not become label values
+            route = scope.get("route")
+            path = getattr(route, "path", None) or "other"
+            method = scope["method"]
+            self.metrics.requests.inc((method, path, str(status[0])))
+            self.metrics.request_duration.observe((method, path), elapsed)
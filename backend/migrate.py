@@ -0,0 +1,21 @@
+import argparse
+
+import application
+
+# Creates the indexes the API relies on (unique employee IDs, emails and attendance days, plus the
+# lookup, rollup and sync indexes) and, for SQLite, the tables themselves, then gives rows written
+# before delta sync existed their sequence numbers. Run it once per deploy, before the app starts
+# serving; importing the app never touches the database
+def migrate() -> int:
+    application.repository.create_indexes()
+    return application.repository.backfill_sequence()
+
+def main_migrate():
+    parser = argparse.ArgumentParser(description="Create the database indexes and tables the API needs")
+    parser.parse_args()
+
+    stamped = migrate()
+    print(f"Indexes are in place for the {application.settings.storage_backend} backend; {stamped} existing rows numbered for sync")
+
+if __name__ == "__main__":
+    main_migrate()
@@ -0,0 +1,193 @@
+import asyncio
+import cProfile
+import functools
+import hmac
+import os
+import pstats
+import random
+import re
+import sys
+import threading
+import time
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Optional
+
+from fastapi.routing import APIRoute
+from starlette.datastructures import Headers, MutableHeaders
+
+from repositories import LazyRepository
+
+# Opt-in request profiling. A profiled request (one whose X-Profile header carries the configured
+# token, or one picked by sampling) gets a Server-Timing header that splits its time into
+#
+#   db         repository calls, including the employee-name lookups
+#   handler    the route function itself, less its db time
+#   serialize  the rest of the route: request parsing, response_model validation and JSON encoding
+#   total      everything up to the response headers, middleware included
+#
+# and, when a directory is configured, a cProfile trace written there for `python -m pstats` or
+# snakeviz. One request is traced at a time per process; concurrent profiled requests still get timings.
+
+# The profile of the request being handled; route handlers that run in the thread pool see it too
+current_profile: ContextVar[Optional["RequestProfile"]] = ContextVar("current_profile", default=None)
+
+# Before 3.12 a cProfile.Profile only sees the thread that enabled it, so sync routes running in the
+# thread pool need a profiler of their own; from 3.12 one profiler covers every thread
+PER_THREAD_PROFILER = sys.version_info < (3, 12)
+trace_lock = threading.Lock()
+
+class RequestProfile:
+    def __init__(self, trace: bool):
+        self.timings = {"db": 0.0, "handler": 0.0, "route": 0.0}
+        self.db_calls = 0
+        self.profilers = [cProfile.Profile()] if trace else []
+
+    def add(self, name: str, seconds: float):
+        self.timings[name] += seconds
+
+    def server_timing(self, total: float) -> str:
+        db = self.timings["db"]
+        handler = max(self.timings["handler"] - db, 0.0)
+        serialize = max(self.timings["route"] - self.timings["handler"], 0.0)
+        return ", ".join([
+            f'db;dur={db * 1000:.2f};desc="{self.db_calls} calls"',
+            f"handler;dur={handler * 1000:.2f}",
+            f"serialize;dur={serialize * 1000:.2f}",
+            f"total;dur={total * 1000:.2f}",
+        ])
+
+    def thread_profiler(self) -> Optional[cProfile.Profile]:
+        if not self.profilers or not PER_THREAD_PROFILER:
+            return None
+        profiler = cProfile.Profile()
+        self.profilers.append(profiler)
+        return profiler
+
+    def dump(self, path: str):
+        stats = pstats.Stats(self.profilers[0])
+        for profiler in self.profilers[1:]:
+            stats.add(profiler)
+        stats.dump_stats(path)
+
+def timed_call(profile: RequestProfile, method):
+    @functools.wraps(method)
+    def timed(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            profile.add("db", time.perf_counter() - started)
+            profile.db_calls += 1
+    return timed
+
+class ProfiledRepository(LazyRepository):
+    # Repository methods looked up while a request is profiled are timed as db
+    def __getattr__(self, name):
+        attribute = getattr(self.connect(), name)
+        profile = current_profile.get()
+        if profile is None or not callable(attribute):
+            return attribute
+        return timed_call(profile, attribute)
+
+def timed_endpoint(endpoint):
+    if asyncio.iscoroutinefunction(endpoint):
+        @functools.wraps(endpoint)
+        async def timed_async(*args, **kwargs):
+            profile = current_profile.get()
+            if profile is None:
+                return await endpoint(*args, **kwargs)
+            started = time.perf_counter()
+            try:
+                return await endpoint(*args, **kwargs)
+            finally:
+                profile.add("handler", time.perf_counter() - started)
+        return timed_async
+
+    @functools.wraps(endpoint)
+    def timed(*args, **kwargs):
+        profile = current_profile.get()
+        if profile is None:
+            return endpoint(*args, **kwargs)
+        profiler = profile.thread_profiler()
+        started = time.perf_counter()
+        if profiler is not None:
+            profiler.enable()
+        try:
+            return endpoint(*args, **kwargs)
+        finally:
+            if profiler is not None:
+                profiler.disable()
+            profile.add("handler", time.perf_counter() - started)
+    return timed
+
+class ProfiledRoute(APIRoute):
+    # Times the route function on its own and the whole route (parsing, validation and encoding
+    # included); both checks are a context variable lookup when the request is not profiled
+    def __init__(self, path: str, endpoint, **kwargs):
+        super().__init__(path, timed_endpoint(endpoint), **kwargs)
+
+    def get_route_handler(self):
+        handler = super().get_route_handler()
+
+        async def profiled_handler(request):
+            profile = current_profile.get()
+            if profile is None:
+                return await handler(request)
+            started = time.perf_counter()
+            try:
+                return await handler(request)
+            finally:
+                profile.add("route", time.perf_counter() - started)
+        return profiled_handler
+
+def profile_filename(method: str, path: str) -> str:
+    slug = re.sub(r"[^A-Za-z0-9]+", "-", path).strip("-") or "root"
+    return f"{datetime.utcnow():%Y%m%dT%H%M%S%f}-{method}-{slug}.prof"
+
+class ProfilingMiddleware:
+    def __init__(self, app, sample_rate: float = 0.0, profile_dir: Optional[str] = None, token: Optional[str] = None):
+        self.app = app
+        self.sample_rate = sample_rate
+        self.profile_dir = profile_dir
+        self.token = token
+
+    # Profiling costs CPU and exposes internals, so the header is only honoured with the shared secret
+    def wanted(self, scope) -> bool:
+        requested = Headers(scope=scope).get("x-profile")
+        if self.token and requested is not None and hmac.compare_digest(requested.encode(), self.token.encode()):
+            return True
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self.wanted(scope):
+            await self.app(scope, receive, send)
+            return
+
+        trace = self.profile_dir is not None and trace_lock.acquire(blocking=False)
+        profile = RequestProfile(trace)
+        filename = profile_filename(scope["method"], scope["path"]) if trace else None
+        started = time.perf_counter()
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers.append("Server-Timing", profile.server_timing(time.perf_counter() - started))
+                if filename:
+                    headers["X-Profile"] = filename
+            await send(message)
+
+        token = current_profile.set(profile)
+        if trace:
+            profile.profilers[0].enable()
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            current_profile.reset(token)
+            if trace:
+                profile.profilers[0].disable()
+                try:
+                    os.makedirs(self.profile_dir, exist_ok=True)
+                    profile.dump(os.path.join(self.profile_dir, filename))
+                finally:
+                    trace_lock.release()
@@ -0,0 +1,45 @@
+import argparse
+import math
+from datetime import datetime
+
+import application
+
+# Sweeps attendance left behind by employees deleted before deletes cascaded, or whose background
+# cleanup was cut short (for example a serverless function frozen after its response)
+def find_orphans(repository) -> list:
+    employee_ids = {employee_id for employee_id, _ in repository.employee_departments()}
+    return [employee_id for employee_id in repository.attendance_employee_ids() if employee_id not in employee_ids]
+
+def reconcile_orphans(state: application.AppState, max_batches: int = 100) -> dict:
+    started_at = datetime.utcnow()
+    removed = 0
+    swept = []
+    batches = max_batches
+    for employee_id in find_orphans(state.repository):
+        if batches <= 0:
+            break
+        # The ID may have been re-used since the orphan scan
+        if state.repository.employee_exists(employee_id):
+            continue
+        purged = application.purge_attendance(state, employee_id, None, started_at, max_batches=batches)
+        removed += purged
+        batches -= max(1, math.ceil(purged / state.settings.purge_batch_size))
+        swept.append(employee_id)
+    # Monthly rollups are keyed by employee, so whatever is left for swept IDs is stale
+    if swept:
+        state.repository.delete_monthly_rollups(swept)
+    return {"employees": len(swept), "removed": removed, "remaining": len(find_orphans(state.repository))}
+
+def main_reconcile():
+    parser = argparse.ArgumentParser(description="Delete attendance rows whose employee no longer exists")
+    parser.add_argument("--max-batches", type=int, default=100, help="Upper bound on delete batches per run")
+    args = parser.parse_args()
+
+    summary = reconcile_orphans(application.default_state, args.max_batches)
+    print(f"Removed {summary['removed']} orphaned attendance rows for {summary['employees']} deleted employees; "
+          f"{summary['remaining']} orphaned employee IDs remain")
+    if summary["removed"]:
+        print("Department rollups cannot be corrected without the employee record; run `python rollups.py check`")
+
+if __name__ == "__main__":
+    main_reconcile()
@@ -0,0 +1,1199 @@
+import itertools
+import json
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Optional
+
+from bson import ObjectId
+from bson.errors import InvalidId
+from pymongo import ReturnDocument, UpdateOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError, PyMongoError
+
+# Storage backends for the employee and attendance routes. Both repositories have the same methods
+# and hand back Mongo-shaped documents (`_id` plus the camelCase API fields), so application.py does not
+# depend on which one is configured.
+#
+# Attendance filters are plain dicts with any of employeeId, department, status, date_from and date_to.
+#
+# Delta sync: every inserted employee or attendance row, and every tombstone left by a delete, takes
+# the next value of one shared sequence (`seq`), so a consumer can ask for everything after the last
+# value it has seen. Rows written before the sequence existed get theirs from `python migrate.py`.
+
+DUPLICATE_KEY_ERROR = 11000
+# Listings read only the fields the API returns, so nothing else is sent over the wire or decoded
+EMPLOYEE_PROJECTION = {"employeeId": 1, "fullName": 1, "email": 1, "department": 1, "createdAt": 1}
+ATTENDANCE_PROJECTION = {"employeeId": 1, "employeeName": 1, "date": 1, "status": 1, "createdAt": 1}
+
+# `fields` narrows a listing to some of the document fields ("_id" included only when named)
+def projection(fields: Optional[list], default: dict) -> dict:
+    if fields is None:
+        return default
+    return {"_id": 0, **{name: 1 for name in fields}}
+STORAGE_ERRORS = (PyMongoError, sqlite3.Error)
+EPOCH = datetime(1970, 1, 1)
+
+class DuplicateRecordError(Exception):
+    def __init__(self, field: str):
+        super().__init__(f"Duplicate {field}")
+        self.field = field
+
+def match_all(conditions: list) -> dict:
+    return {"$and": conditions} if conditions else {}
+
+def status_counts(group_id) -> dict:
+    return {"$group": {
+        "_id": group_id,
+        "present": {"$sum": {"$cond": [{"$eq": ["$status", "Present"]}, 1, 0]}},
+        "absent": {"$sum": {"$cond": [{"$eq": ["$status", "Absent"]}, 1, 0]}}
+    }}
+
+# The positions of the documents a bulk write rejected as duplicates; any other failure is re-raised
+def duplicate_indexes(error: BulkWriteError) -> list:
+    duplicates = []
+    for write_error in error.details["writeErrors"]:
+        if write_error["code"] != DUPLICATE_KEY_ERROR:
+            raise error
+        duplicates.append(write_error["index"])
+    return duplicates
+
+# Employee deletes are watched through the tombstones they leave: a delete event only has the `_id`,
+# and clients also need the employee ID to drop the employee's attendance
+def employee_tombstones(tombstones) -> dict:
+    return {"ns.coll": tombstones.name, "operationType": "insert", "fullDocument.collection": "employees"}
+
+def sum_counts(group_id) -> dict:
+    return {"$group": {"_id": group_id, "present": {"$sum": "$present"}, "absent": {"$sum": "$absent"}}}
+
+class MongoRepository:
+    # Change streams need a replica set; watchers fall back when the server turns them down
+    supports_change_streams = True
+
+    def __init__(self, db):
+        self.db = db
+        self.employees = db["employees"]
+        self.attendance = db["attendance"]
+        self.attendance_monthly = db["attendance_monthly"]
+        self.attendance_daily = db["attendance_daily"]
+        self.tombstones = db["tombstones"]
+        self.counters = db["counters"]
+
+    def create_indexes(self):
+        self.employees.create_index("employeeId", unique=True)
+        self.employees.create_index("email", unique=True)
+        self.employees.create_index("department")
+        self.attendance.create_index([("employeeId", 1), ("date", 1)], unique=True)
+        self.attendance_monthly.create_index([("employeeId", 1), ("month", 1)], unique=True)
+        self.attendance_daily.create_index([("date", 1), ("department", 1)], unique=True)
+        self.employees.create_index("seq")
+        self.attendance.create_index("seq")
+        self.tombstones.create_index("seq", unique=True)
+
+    def clear(self):
+        for collection in (self.employees, self.attendance, self.attendance_monthly, self.attendance_daily, self.tombstones):
+            collection.delete_many({})
+
+    def parse_id(self, value: str):
+        try:
+            return ObjectId(value)
+        except (InvalidId, TypeError):
+            raise ValueError(f"Invalid id: {value!r}")
+
+    # Employees
+    def find_employees(self, department: Optional[str] = None, after=None, limit: Optional[int] = None,
+                       fields: Optional[list] = None) -> list:
+        conditions = []
+        if department:
+            conditions.append({"department": department})
+        if after is not None:
+            conditions.append({"_id": {"$gt": after}})
+        if limit is None:
+            return list(self.employees.find(match_all(conditions), projection(fields, EMPLOYEE_PROJECTION)))
+        return list(self.employees.find(match_all(conditions), projection(fields, EMPLOYEE_PROJECTION)).sort("_id", 1).limit(limit))
+
+    def lookup_employees(self, employee_ids: list) -> list:
+        return list(self.employees.find(
+            {"employeeId": {"$in": employee_ids}},
+            {"employeeId": 1, "fullName": 1, "department": 1}
+        ))
+
+    def employee_exists(self, employee_id: str) -> bool:
+        return self.employees.find_one({"employeeId": employee_id}, {"_id": 1}) is not None
+
+    def employee_departments(self) -> list:
+        return [
+            (employee["employeeId"], employee["department"])
+            for employee in self.employees.find({}, {"employeeId": 1, "department": 1})
+        ]
+
+    def duplicate_field(self, error: dict, document: dict) -> str:
+        key_pattern = error.get("keyPattern")
+        if key_pattern is None:
+            # Not every server reports the violated index; check which key is taken
+            key_pattern = {"employeeId": 1} if self.employee_exists(document["employeeId"]) else {"email": 1}
+        return "email" if "email" in key_pattern else "employeeId"
+
+    def insert_employee(self, document: dict):
+        self.stamp([document])
+        try:
+            self.employees.insert_one(document)
+        except DuplicateKeyError as e:
+            raise DuplicateRecordError(self.duplicate_field(e.details or {}, document))
+
+    # Returns the number inserted and (index, field) for each duplicate
+    def insert_employees(self, documents: list) -> tuple:
+        self.stamp(documents)
+        try:
+            self.employees.insert_many(documents, ordered=False)
+            return len(documents), []
+        except BulkWriteError as e:
+            duplicates = []
+            for error in e.details["writeErrors"]:
+                if error["code"] != DUPLICATE_KEY_ERROR:
+                    raise
+                duplicates.append((error["index"], self.duplicate_field(error, documents[error["index"]])))
+            return e.details["nInserted"], duplicates
+
+    def delete_employee(self, employee_key) -> Optional[dict]:
+        deleted = self.employees.find_one_and_delete({"_id": employee_key}, {"employeeId": 1, "department": 1})
+        if deleted is not None:
+            self.add_tombstones("employees", [deleted])
+        return deleted
+
+    def watch_employees(self):
+        return self.employees.watch()
+
+    # Inserts and deletes of employees and attendance, for the live event feed
+    def watch_changes(self):
+        return self.db.watch([{"$match": {"$or": [
+            {"ns.coll": {"$in": ["employees", "attendance"]}, "operationType": "insert"},
+            {"ns.coll": "attendance", "operationType": "delete"},
+            employee_tombstones(self.tombstones)
+        ]}}])
+
+    # Attendance filters, pushed down as a $match on the (employeeId, date) index
+    def attendance_conditions(self, filters: dict) -> list:
+        conditions = []
+        if filters.get("employeeId"):
+            conditions.append({"employeeId": filters["employeeId"]})
+        if filters.get("department"):
+            department_ids = self.employees.distinct("employeeId", {"department": filters["department"]})
+            conditions.append({"employeeId": {"$in": department_ids}})
+        if filters.get("date_from") or filters.get("date_to"):
+            date_range = {}
+            if filters.get("date_from"):
+                date_range["$gte"] = filters["date_from"]
+            if filters.get("date_to"):
+                date_range["$lte"] = filters["date_to"]
+            conditions.append({"date": date_range})
+        if filters.get("status"):
+            conditions.append({"status": filters["status"]})
+        return conditions
+
+    # Ordered results follow the (employeeId, date) index; `after` is the last key of the previous page
+    def find_attendance(self, filters: dict, after: Optional[list] = None, limit: Optional[int] = None,
+                        ordered: bool = False, batch_size: int = 0, fields: Optional[list] = None):
+        conditions = self.attendance_conditions(filters)
+        if after:
+            last_employee_id, last_date = after
+            conditions.append({"$or": [
+                {"employeeId": {"$gt": last_employee_id}},
+                {"employeeId": last_employee_id, "date": {"$gt": last_date}}
+            ]})
+        records = self.attendance.find(match_all(conditions), projection(fields, ATTENDANCE_PROJECTION), batch_size=batch_size)
+        if ordered or limit is not None:
+            records = records.sort([("employeeId", 1), ("date", 1)])
+        if limit is not None:
+            records = records.limit(limit)
+        return records
+
+    def insert_attendance(self, document: dict):
+        self.stamp([document])
+        try:
+            self.attendance.insert_one(document)
+        except DuplicateKeyError:
+            raise DuplicateRecordError("date")
+
+    # Assigns `_id` to every document and returns the indexes rejected as duplicates
+    def insert_attendance_many(self, documents: list) -> list:
+        for document in documents:
+            document["_id"] = ObjectId()
+        self.stamp(documents)
+        try:
+            self.attendance.insert_many(documents, ordered=False)
+            return []
+        except BulkWriteError as e:
+            return duplicate_indexes(e)
+
+    # Present/absent counts grouped by employeeId or date, sorted by that key
+    def count_attendance(self, filters: dict, by: str) -> list:
+        return list(self.aggregate_attendance(filters, [status_counts(f"${by}"), {"$sort": {"_id": 1}}]))
+
+    # Runs `stages` over the attendance rows matching `filters` (and, if given, one of employee_ids)
+    def aggregate_attendance(self, filters: dict, stages: list, employee_ids: Optional[list] = None):
+        conditions = self.attendance_conditions(filters)
+        if employee_ids is not None:
+            conditions.append({"employeeId": {"$in": employee_ids}})
+        return self.attendance.aggregate([{"$match": match_all(conditions)}, *stages])
+
+    # Both groupings in a single pass over the matching rows
+    def summarize_attendance(self, filters: dict) -> tuple:
+        facets = next(self.aggregate_attendance(filters, [
+            {"$facet": {
+                "employees": [status_counts("$employeeId"), {"$sort": {"_id": 1}}],
+                "days": [status_counts("$date"), {"$sort": {"_id": 1}}]
+            }}
+        ]))
+        return facets["employees"], facets["days"]
+
+    # Rows marked after `deleted_at` belong to a re-created employee with the same ID and are kept
+    def purge_attendance_batch(self, employee_id: str, deleted_at: datetime, limit: int) -> list:
+        query = {"employeeId": employee_id, "createdAt": {"$not": {"$gt": deleted_at}}}
+        batch = list(self.attendance.find(query, {"employeeId": 1, "date": 1, "status": 1}).limit(limit))
+        if batch:
+            self.attendance.delete_many({"_id": {"$in": [row["_id"] for row in batch]}})
+            self.add_tombstones("attendance", batch)
+        return batch
+
+    def attendance_employee_ids(self) -> list:
+        return sorted(self.attendance.distinct("employeeId"))
+
+    # Rollups
+    def apply_rollup_counts(self, monthly: dict, daily: dict, target: str = ""):
+        if monthly:
+            self.db[self.attendance_monthly.name + target].bulk_write([
+                UpdateOne({"employeeId": employee_id, "month": month}, {"$inc": counts}, upsert=True)
+                for (employee_id, month), counts in monthly.items()
+            ], ordered=False)
+        if daily:
+            self.db[self.attendance_daily.name + target].bulk_write([
+                UpdateOne({"date": date, "department": department}, {"$inc": counts}, upsert=True)
+                for (department, date), counts in daily.items()
+            ], ordered=False)
+
+    def monthly_rollup_counts(self, filters: dict, months: dict) -> list:
+        conditions = self.attendance_conditions(filters)
+        if months:
+            conditions.append({"month": months})
+        return list(self.attendance_monthly.aggregate([
+            {"$match": match_all(conditions)},
+            sum_counts("$employeeId"),
+            {"$sort": {"_id": 1}}
+        ]))
+
+    def daily_rollup_counts(self, department: Optional[str], date_from: Optional[str], date_to: Optional[str]) -> list:
+        conditions = self.attendance_conditions({"date_from": date_from, "date_to": date_to})
+        if department:
+            conditions.append({"department": department})
+        return list(self.attendance_daily.aggregate([
+            {"$match": match_all(conditions)},
+            sum_counts("$date"),
+            {"$sort": {"_id": 1}}
+        ]))
+
+    def delete_empty_rollups(self, employee_id: str, department: str):
+        self.attendance_monthly.delete_many({"employeeId": employee_id, "present": 0, "absent": 0})
+        self.attendance_daily.delete_many({"department": department, "present": 0, "absent": 0})
+
+    def delete_monthly_rollups(self, employee_ids: list):
+        self.attendance_monthly.delete_many({"employeeId": {"$in": employee_ids}})
+
+    # Recomputes monthly counts per employee and daily counts for the chunk as a whole
+    def rollup_chunk(self, employee_ids: list) -> tuple:
+        facets = next(self.aggregate_attendance({}, [
+            {"$facet": {
+                "monthly": [status_counts({"employeeId": "$employeeId", "month": {"$substr": ["$date", 0, 7]}})],
+                "daily": [status_counts("$date")]
+            }}
+        ], employee_ids))
+        monthly = {(row["_id"]["employeeId"], row["_id"]["month"]): row for row in facets["monthly"]}
+        daily = {row["_id"]: row for row in facets["daily"]}
+        return (
+            {key: {"present": row["present"], "absent": row["absent"]} for key, row in monthly.items()},
+            {date: {"present": row["present"], "absent": row["absent"]} for date, row in daily.items()}
+        )
+
+    # Rebuilt rollups are written to scratch collections which then replace the live ones by rename
+    REBUILD_SUFFIX = "_rebuild"
+
+    def begin_rollup_rebuild(self):
+        for live in (self.attendance_monthly, self.attendance_daily):
+            self.db[live.name + self.REBUILD_SUFFIX].drop()
+        self.db[self.attendance_monthly.name + self.REBUILD_SUFFIX].create_index([("employeeId", 1), ("month", 1)], unique=True)
+        self.db[self.attendance_daily.name + self.REBUILD_SUFFIX].create_index([("date", 1), ("department", 1)], unique=True)
+
+    def add_rebuilt_rollups(self, monthly: dict, daily: dict):
+        self.apply_rollup_counts(monthly, daily, target=self.REBUILD_SUFFIX)
+
+    def finish_rollup_rebuild(self):
+        for live in (self.attendance_monthly, self.attendance_daily):
+            self.db[live.name + self.REBUILD_SUFFIX].rename(live.name, dropTarget=True)
+
+    def rollup_counts(self) -> tuple:
+        monthly = {
+            (row["employeeId"], row["month"]): (row.get("present", 0), row.get("absent", 0))
+            for row in self.attendance_monthly.find({}, {"_id": 0})
+        }
+        daily = {
+            (row["department"], row["date"]): (row.get("present", 0), row.get("absent", 0))
+            for row in self.attendance_daily.find({}, {"_id": 0})
+        }
+        return monthly, daily
+
+    # Delta sync
+    def next_sequence(self, count: int = 1) -> int:
+        counter = self.counters.find_one_and_update(
+            {"_id": "sync"}, {"$inc": {"seq": count}}, upsert=True, return_document=ReturnDocument.AFTER
+        )
+        return counter["seq"] - count + 1
+
+    # One counter round trip per write or batch
+    def stamp(self, documents: list):
+        if not documents:
+            return
+        first = self.next_sequence(len(documents))
+        updated_at = datetime.utcnow()
+        for offset, document in enumerate(documents):
+            document["seq"] = first + offset
+            document["updatedAt"] = updated_at
+
+    def add_tombstones(self, collection: str, documents: list):
+        first = self.next_sequence(len(documents))
+        deleted_at = datetime.utcnow()
+        self.tombstones.insert_many([
+            {"seq": first + offset, "collection": collection, "recordId": str(document["_id"]),
+             "employeeId": document["employeeId"], "deletedAt": deleted_at}
+            for offset, document in enumerate(documents)
+        ])
+
+    def find_changed(self, collection: str, after: int, limit: int) -> list:
+        fields = {"employees": EMPLOYEE_PROJECTION, "attendance": ATTENDANCE_PROJECTION}[collection]
+        query = self.db[collection].find({"seq": {"$gt": after}}, {**fields, "seq": 1, "updatedAt": 1})
+        return list(query.sort("seq", 1).limit(limit))
+
+    def find_tombstones(self, after: int, limit: int) -> list:
+        return list(self.tombstones.find({"seq": {"$gt": after}}, {"_id": 0}).sort("seq", 1).limit(limit))
+
+    # Numbers the documents that have no `seq` yet, in insertion order
+    def backfill_sequence(self, batch_size: int = 1000) -> int:
+        stamped = 0
+        for collection in (self.employees, self.attendance):
+            while True:
+                batch = list(collection.find({"seq": {"$exists": False}}, {"createdAt": 1}).sort("_id", 1).limit(batch_size))
+                if not batch:
+                    break
+                first = self.next_sequence(len(batch))
+                collection.bulk_write([
+                    UpdateOne({"_id": document["_id"]}, {"$set": {"seq": first + offset, "updatedAt": document.get("createdAt", EPOCH)}})
+                    for offset, document in enumerate(batch)
+                ])
+                stamped += len(batch)
+        return stamped
+
+# Attendance bucketed by month (ATTENDANCE_LAYOUT=monthly): one document per employee and month in
+# attendance_buckets, keyed "<employeeId>:<YYYY-MM>", whose `days` map each day of the month to
+# {s: "P" or "A", c: createdAt, q: seq}. A month of marks costs one document and one index entry
+# instead of twenty-odd, and a monthly report for an employee reads a single document.
+#
+# Reads rebuild the usual rows, with `_id` "<employeeId>:<date>". Each bucket carries the highest
+# and lowest `seq` of its days, so delta sync finds changed days without scanning every bucket.
+# `python bucket_attendance.py` copies an existing row collection into buckets.
+STATUS_CODES = {"Present": "P", "Absent": "A"}
+STATUSES = {code: status for status, code in STATUS_CODES.items()}
+
+def bucket_key(employee_id: str, month: str) -> str:
+    return f"{employee_id}:{month}"
+
+def row_id(employee_id: str, date: str) -> str:
+    return f"{employee_id}:{date}"
+
+def bucket_row(employee_id: str, month: str, day: str, mark: dict) -> dict:
+    return {
+        "_id": row_id(employee_id, f"{month}-{day}"), "employeeId": employee_id, "date": f"{month}-{day}",
+        "status": STATUSES[mark["s"]], "createdAt": mark["c"], "seq": mark["q"], "updatedAt": mark["c"]
+    }
+
+def bucket_rows(bucket: dict) -> list:
+    return [bucket_row(bucket["employeeId"], bucket["month"], day, mark) for day, mark in sorted(bucket["days"].items())]
+
+def bucket_mark(document: dict) -> dict:
+    return {"s": STATUS_CODES[document["status"]], "c": document["createdAt"], "q": document["seq"]}
+
+# Upserts day marks into the month's bucket, keeping its sequence bounds and updatedAt current
+def bucket_update(employee_id: str, month: str, marks: dict) -> dict:
+    return {
+        "$set": {f"days.{day}": mark for day, mark in marks.items()},
+        "$max": {"seq": max(mark["q"] for mark in marks.values()), "updatedAt": max(mark["c"] for mark in marks.values())},
+        "$min": {"minSeq": min(mark["q"] for mark in marks.values())},
+        "$setOnInsert": {"employeeId": employee_id, "month": month}
+    }
+
+# Creates the month's bucket for a mark if there is none yet. The filter is `_id` alone, so the server
+# retries an upsert that loses a race with another one for the same bucket instead of failing it
+def new_bucket(document: dict) -> tuple:
+    month = document["date"][:7]
+    return (
+        {"_id": bucket_key(document["employeeId"], month)},
+        {"$setOnInsert": {"employeeId": document["employeeId"], "month": month, "days": {}}}
+    )
+
+# A mark only matches an existing bucket whose day is still free; when it matches nothing, the day is taken.
+# Returns the filter and update, which is applied without upserting after new_bucket
+def new_mark(document: dict) -> tuple:
+    month, day = document["date"][:7], document["date"][8:]
+    update = bucket_update(document["employeeId"], month, {day: bucket_mark(document)})
+    del update["$setOnInsert"]
+    return {"_id": bucket_key(document["employeeId"], month), f"days.{day}": {"$exists": False}}, update
+
+class BucketedMongoRepository(MongoRepository):
+    def __init__(self, db):
+        super().__init__(db)
+        self.attendance_buckets = db["attendance_buckets"]
+
+    def create_indexes(self):
+        super().create_indexes()
+        self.attendance_buckets.create_index([("employeeId", 1), ("month", 1)])
+        self.attendance_buckets.create_index("seq")
+        self.attendance_buckets.create_index("minSeq")
+
+    def clear(self):
+        super().clear()
+        self.attendance_buckets.delete_many({})
+
+    # Changes to buckets are reported as the row inserts and deletes they stand for
+    def watch_changes(self):
+        return BucketChangeStream(self.db.watch([{"$match": {"$or": [
+            {"ns.coll": "employees", "operationType": "insert"},
+            {"ns.coll": self.attendance_buckets.name, "operationType": {"$in": ["insert", "update"]}},
+            employee_tombstones(self.tombstones)
+        ]}}]))
+
+    # Employee and month conditions select buckets; date and status are checked per day
+    def bucket_conditions(self, filters: dict) -> list:
+        conditions = self.attendance_conditions({"employeeId": filters.get("employeeId"), "department": filters.get("department")})
+        if filters.get("date_from") or filters.get("date_to"):
+            month_range = {}
+            if filters.get("date_from"):
+                month_range["$gte"] = filters["date_from"][:7]
+            if filters.get("date_to"):
+                month_range["$lte"] = filters["date_to"][:7]
+            conditions.append({"month": month_range})
+        return conditions
+
+    # Rows always come in (employeeId, date) order, which the bucket index gives for free
+    def find_attendance(self, filters: dict, after: Optional[list] = None, limit: Optional[int] = None,
+                        ordered: bool = False, batch_size: int = 0, fields: Optional[list] = None):
+        conditions = self.bucket_conditions(filters)
+        if after:
+            last_employee_id, last_date = after
+            conditions.append({"$or": [
+                {"employeeId": {"$gt": last_employee_id}},
+                {"employeeId": last_employee_id, "month": {"$gte": last_date[:7]}}
+            ]})
+        buckets = self.attendance_buckets.find(match_all(conditions), batch_size=batch_size).sort([("employeeId", 1), ("month", 1)])
+        rows = (
+            row for bucket in buckets for row in bucket_rows(bucket)
+            if (not filters.get("date_from") or row["date"] >= filters["date_from"])
+            and (not filters.get("date_to") or row["date"] <= filters["date_to"])
+            and (not filters.get("status") or row["status"] == filters["status"])
+            and (not after or (row["employeeId"], row["date"]) > tuple(after))
+        )
+        if limit is not None:
+            rows = itertools.islice(rows, limit)
+        if fields is not None:
+            rows = ({name: row[name] for name in fields if name in row} for row in rows)
+        return rows
+
+    def insert_attendance(self, document: dict):
+        self.stamp([document])
+        self.attendance_buckets.update_one(*new_bucket(document), upsert=True)
+        if not self.attendance_buckets.update_one(*new_mark(document)).matched_count:
+            raise DuplicateRecordError("date")
+        document["_id"] = row_id(document["employeeId"], document["date"])
+
+    # Buckets are created first, then marks are set where their day is free. The bulk result only counts
+    # matches, so a mark was a duplicate unless its bucket now holds it under its own sequence number
+    def insert_attendance_many(self, documents: list) -> list:
+        if not documents:
+            return []
+        self.stamp(documents)
+        for document in documents:
+            document["_id"] = row_id(document["employeeId"], document["date"])
+        buckets = {new_bucket(document)[0]["_id"]: new_bucket(document) for document in documents}
+        self.attendance_buckets.bulk_write([UpdateOne(*bucket, upsert=True) for bucket in buckets.values()], ordered=False)
+        result = self.attendance_buckets.bulk_write([UpdateOne(*new_mark(document)) for document in documents], ordered=False)
+        if result.matched_count == len(documents):
+            return []
+        days = {
+            bucket["_id"]: bucket["days"]
+            for bucket in self.attendance_buckets.find({"_id": {"$in": list(buckets)}}, {"days": 1})
+        }
+        return [
+            index for index, document in enumerate(documents)
+            if days[bucket_key(document["employeeId"], document["date"][:7])].get(document["date"][8:], {}).get("q") != document["seq"]
+        ]
+
+    # Days are unwound into rows of employeeId, date and status before `stages` run
+    def aggregate_attendance(self, filters: dict, stages: list, employee_ids: Optional[list] = None):
+        conditions = self.bucket_conditions(filters)
+        if employee_ids is not None:
+            conditions.append({"employeeId": {"$in": employee_ids}})
+        day_conditions = self.attendance_conditions({key: filters.get(key) for key in ("date_from", "date_to", "status")})
+        return self.attendance_buckets.aggregate([
+            {"$match": match_all(conditions)},
+            {"$project": {"employeeId": 1, "month": 1, "days": {"$objectToArray": "$days"}}},
+            {"$unwind": "$days"},
+            {"$project": {
+                "employeeId": 1,
+                "date": {"$concat": ["$month", "-", "$days.k"]},
+                "status": {"$cond": [{"$eq": ["$days.v.s", STATUS_CODES["Present"]]}, "Present", "Absent"]}
+            }},
+            *([{"$match": match_all(day_conditions)}] if day_conditions else []),
+            *stages
+        ])
+
+    def purge_attendance_batch(self, employee_id: str, deleted_at: datetime, limit: int) -> list:
+        batch = []
+        for bucket in self.attendance_buckets.find({"employeeId": employee_id}).sort("month", 1):
+            rows = [row for row in bucket_rows(bucket) if row["createdAt"] <= deleted_at][:limit - len(batch)]
+            if not rows:
+                continue
+            days = [row["date"][8:] for row in rows]
+            # Skipped if one of the days has been marked again since it was read; the next batch sees the new mark
+            removed = self.attendance_buckets.update_one(
+                {"_id": bucket["_id"], **{f"days.{day}.c": {"$lte": deleted_at} for day in days}},
+                {"$unset": {f"days.{day}": "" for day in days}}
+            )
+            if removed.modified_count:
+                batch.extend(rows)
+            if len(batch) == limit:
+                break
+        if batch:
+            self.attendance_buckets.delete_many({"employeeId": employee_id, "days": {}})
+            self.add_tombstones("attendance", batch)
+        return batch
+
+    def attendance_employee_ids(self) -> list:
+        return sorted(self.attendance_buckets.distinct("employeeId"))
+
+    # Changed days are collected from the buckets whose sequence bounds overlap a window after `after`,
+    # widening the window until it holds `limit` days or reaches the newest bucket
+    def find_changed(self, collection: str, after: int, limit: int) -> list:
+        if collection != "attendance":
+            return super().find_changed(collection, after, limit)
+        rows = []
+        low, span = after, limit
+        while len(rows) < limit:
+            high = low + span
+            for bucket in self.attendance_buckets.find({"seq": {"$gt": low}, "minSeq": {"$lte": high}}):
+                rows.extend(row for row in bucket_rows(bucket) if low < row["seq"] <= high)
+            if self.attendance_buckets.find_one({"seq": {"$gt": high}}, {"_id": 1}) is None:
+                break
+            low, span = high, span * 2
+        rows.sort(key=lambda row: row["seq"])
+        return rows[:limit]
+
+    # Copies a batch of rows from the row collection into buckets, keeping their sequence numbers, and
+    # returns the number read and the key to continue after. Safe to repeat: a day already copied is
+    # overwritten with the same mark, and rows of employees deleted since are left out
+    def copy_rows_to_buckets(self, after: Optional[list], batch_size: int) -> tuple:
+        rows = list(self.attendance.find(
+            match_all([{"$or": [
+                {"employeeId": {"$gt": after[0]}}, {"employeeId": after[0], "date": {"$gt": after[1]}}
+            ]}] if after else []),
+            {"employeeId": 1, "date": 1, "status": 1, "createdAt": 1, "seq": 1}
+        ).sort([("employeeId", 1), ("date", 1)]).limit(batch_size))
+        if not rows:
+            return 0, after
+        existing = set(self.employees.distinct("employeeId", {"employeeId": {"$in": list({row["employeeId"] for row in rows})}}))
+        months = {}
+        for row in rows:
+            if row["employeeId"] not in existing:
+                continue
+            months.setdefault((row["employeeId"], row["date"][:7]), {})[row["date"][8:]] = bucket_mark(row)
+        if months:
+            self.attendance_buckets.bulk_write([
+                UpdateOne({"_id": bucket_key(employee_id, month)}, bucket_update(employee_id, month, marks), upsert=True)
+                for (employee_id, month), marks in months.items()
+            ], ordered=False)
+        return len(rows), [rows[-1]["employeeId"], rows[-1]["date"]]
+
+    def count_bucketed_days(self) -> int:
+        counted = list(self.attendance_buckets.aggregate([
+            {"$group": {"_id": None, "days": {"$sum": {"$size": {"$objectToArray": "$days"}}}}}
+        ]))
+        return counted[0]["days"] if counted else 0
+
+# Iterates a change stream on employees and attendance_buckets as if attendance were stored as rows
+class BucketChangeStream:
+    def __init__(self, stream):
+        self.stream = stream
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stream.close()
+
+    def __iter__(self):
+        for change in self.stream:
+            if change["ns"]["coll"] in ("employees", "tombstones"):
+                yield change
+                continue
+            employee_id, month = change["documentKey"]["_id"].rsplit(":", 1)
+            if change["operationType"] == "insert":
+                marked, removed = change["fullDocument"]["days"], []
+            else:
+                description = change["updateDescription"]
+                marked = {path[5:]: mark for path, mark in description["updatedFields"].items() if path.startswith("days.")}
+                removed = [path[5:] for path in description.get("removedFields", []) if path.startswith("days.")]
+            for day, mark in sorted(marked.items()):
+                yield {"operationType": "insert", "ns": {"coll": "attendance"}, "fullDocument": bucket_row(employee_id, month, day, mark)}
+            for day in removed:
+                yield {"operationType": "delete", "ns": {"coll": "attendance"}, "documentKey": {"_id": row_id(employee_id, f"{month}-{day}")}}
+
+# SQLite keeps the schema of the bundled db.sqlite3 (core_liteemployee / core_liteattendance), so its
+# existing rows are served as-is; the employee ID doubles as the record `id`
+SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS core_liteemployee (
+    employee_id varchar(50) NOT NULL PRIMARY KEY,
+    full_name varchar(200) NOT NULL,
+    email varchar(200) NOT NULL UNIQUE,
+    department varchar(100) NOT NULL,
+    created_at datetime NOT NULL,
+    updated_at datetime NOT NULL
+);
+CREATE INDEX IF NOT EXISTS core_liteemployee_department ON core_liteemployee (department);
+CREATE TABLE IF NOT EXISTS core_liteattendance (
+    id integer NOT NULL PRIMARY KEY AUTOINCREMENT,
+    date date NOT NULL,
+    status varchar(10) NOT NULL,
+    created_at datetime NOT NULL,
+    updated_at datetime NOT NULL,
+    employee_id varchar(50) NOT NULL REFERENCES core_liteemployee (employee_id) DEFERRABLE INITIALLY DEFERRED,
+    UNIQUE (employee_id, date)
+);
+"""
+
+SQLITE_ROLLUP_SCHEMA = """
+CREATE TABLE IF NOT EXISTS attendance_monthly{suffix} (
+    employee_id varchar(50) NOT NULL,
+    month char(7) NOT NULL,
+    present integer NOT NULL DEFAULT 0,
+    absent integer NOT NULL DEFAULT 0,
+    PRIMARY KEY (employee_id, month)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS attendance_daily{suffix} (
+    date date NOT NULL,
+    department varchar(100) NOT NULL,
+    present integer NOT NULL DEFAULT 0,
+    absent integer NOT NULL DEFAULT 0,
+    PRIMARY KEY (date, department)
+) WITHOUT ROWID;
+"""
+
+# The Django tables gain a `seq` column (added by create_indexes) and the sequence and tombstones live alongside
+SQLITE_SYNC_SCHEMA = """
+CREATE INDEX IF NOT EXISTS core_liteemployee_seq ON core_liteemployee (seq);
+CREATE INDEX IF NOT EXISTS core_liteattendance_seq ON core_liteattendance (seq);
+CREATE TABLE IF NOT EXISTS sync_sequence (
+    name varchar(20) NOT NULL PRIMARY KEY,
+    seq integer NOT NULL
+);
+CREATE TABLE IF NOT EXISTS sync_tombstones (
+    seq integer NOT NULL PRIMARY KEY,
+    collection varchar(20) NOT NULL,
+    record_id varchar(50) NOT NULL,
+    employee_id varchar(50) NOT NULL,
+    deleted_at datetime NOT NULL
+);
+"""
+
+EMPLOYEE_COLUMNS = "employee_id, full_name, email, department, created_at"
+ATTENDANCE_COLUMNS = "id, employee_id, date, status, created_at"
+COUNT_COLUMNS = "SUM(status = 'Present') AS present, SUM(status = 'Absent') AS absent"
+# Document field -> column, for listings narrowed with `fields`
+EMPLOYEE_FIELD_COLUMNS = {
+    "_id": "employee_id", "employeeId": "employee_id", "fullName": "full_name",
+    "email": "email", "department": "department", "createdAt": "created_at"
+}
+ATTENDANCE_FIELD_COLUMNS = {"_id": "id", "employeeId": "employee_id", "date": "date", "status": "status", "createdAt": "created_at"}
+
+def parse_timestamp(value: str) -> datetime:
+    return datetime.fromisoformat(value)
+
+def employee_document(row) -> dict:
+    return {
+        "_id": row[0],
+        "employeeId": row[0],
+        "fullName": row[1],
+        "email": row[2],
+        "department": row[3],
+        "createdAt": parse_timestamp(row[4])
+    }
+
+def attendance_document(row) -> dict:
+    return {
+        "_id": row[0],
+        "employeeId": row[1],
+        "date": row[2],
+        "status": row[3],
+        "createdAt": parse_timestamp(row[4])
+    }
+
+def select_fields(fields: list, columns: dict) -> tuple:
+    names = [name for name in fields if name in columns]
+    return names, ", ".join(columns[name] for name in names)
+
+def field_document(names: list, row) -> dict:
+    document = dict(zip(names, row))
+    if "createdAt" in document:
+        document["createdAt"] = parse_timestamp(document["createdAt"])
+    return document
+
+def count_rows(rows) -> list:
+    return [{"_id": key, "present": present or 0, "absent": absent or 0} for key, present, absent in rows]
+
+class SQLiteRepository:
+    # Each worker thread gets its own connection; WAL lets readers run alongside the single writer.
+    # Statement text is kept constant per query shape (id lists go through json_each) so the
+    # connection's prepared statement cache is reused across requests. There are no change streams, so each
+    # worker only sees its own writes
+    supports_change_streams = False
+
+    def __init__(self, path: str):
+        self.path = path
+        self.local = threading.local()
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        connection = getattr(self.local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=30, isolation_level=None, cached_statements=256)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self.local.connection = connection
+        return connection
+
+    @contextmanager
+    def transaction(self):
+        connection = self.connection
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield connection
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+
+    def create_indexes(self):
+        connection = self.connection
+        rollups_exist = connection.execute("SELECT 1 FROM sqlite_master WHERE name = 'attendance_monthly'").fetchone()
+        connection.executescript(SQLITE_SCHEMA + SQLITE_ROLLUP_SCHEMA.format(suffix=""))
+        for table in ("core_liteemployee", "core_liteattendance"):
+            if not any(column[1] == "seq" for column in connection.execute(f"PRAGMA table_info({table})")):
+                connection.execute(f"ALTER TABLE {table} ADD COLUMN seq integer")
+        connection.executescript(SQLITE_SYNC_SCHEMA)
+        if not rollups_exist:
+            # Rows already in the file were written before the rollups existed; count them once
+            with self.transaction() as connection:
+                connection.execute(
+                    "INSERT INTO attendance_monthly (employee_id, month, present, absent)"
+                    f" SELECT employee_id, substr(date, 1, 7), {COUNT_COLUMNS} FROM core_liteattendance"
+                    " GROUP BY employee_id, substr(date, 1, 7)"
+                )
+                connection.execute(
+                    "INSERT INTO attendance_daily (date, department, present, absent)"
+                    f" SELECT a.date, e.department, {COUNT_COLUMNS} FROM core_liteattendance a"
+                    " JOIN core_liteemployee e ON e.employee_id = a.employee_id GROUP BY a.date, e.department"
+                )
+
+    def clear(self):
+        with self.transaction() as connection:
+            for table in ("core_liteemployee", "core_liteattendance", "attendance_monthly", "attendance_daily", "sync_tombstones"):
+                connection.execute(f"DELETE FROM {table}")
+
+    def parse_id(self, value: str) -> str:
+        if not value:
+            raise ValueError(f"Invalid id: {value!r}")
+        return value
+
+    # Employees
+    def find_employees(self, department: Optional[str] = None, after=None, limit: Optional[int] = None,
+                       fields: Optional[list] = None) -> list:
+        clauses = []
+        params = []
+        if department:
+            clauses.append("department = ?")
+            params.append(department)
+        if after is not None:
+            clauses.append("employee_id > ?")
+            params.append(after)
+        names, columns = select_fields(fields, EMPLOYEE_FIELD_COLUMNS) if fields is not None else (None, EMPLOYEE_COLUMNS)
+        sql = f"SELECT {columns} FROM core_liteemployee"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY employee_id"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        rows = self.connection.execute(sql, params)
+        if names is not None:
+            return [field_document(names, row) for row in rows]
+        return [employee_document(row) for row in rows]
+
+    def lookup_employees(self, employee_ids: list) -> list:
+        rows = self.connection.execute(
+            "SELECT employee_id, full_name, department FROM core_liteemployee"
+            " WHERE employee_id IN (SELECT value FROM json_each(?))",
+            (json.dumps(list(employee_ids)),)
+        )
+        return [{"_id": row[0], "employeeId": row[0], "fullName": row[1], "department": row[2]} for row in rows]
+
+    def employee_exists(self, employee_id: str) -> bool:
+        return self.connection.execute("SELECT 1 FROM core_liteemployee WHERE employee_id = ?", (employee_id,)).fetchone() is not None
+
+    def employee_departments(self) -> list:
+        return self.connection.execute("SELECT employee_id, department FROM core_liteemployee").fetchall()
+
+    def insert_employee_row(self, connection, document: dict, seq: Optional[int] = None):
+        created_at = str(document["createdAt"])
+        if seq is None:
+            seq = self.next_sequence(connection)
+        try:
+            connection.execute(
+                f"INSERT INTO core_liteemployee ({EMPLOYEE_COLUMNS}, updated_at, seq) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (document["employeeId"], document["fullName"], document["email"], document["department"], created_at, created_at, seq)
+            )
+        except sqlite3.IntegrityError:
+            # SQLite names whichever constraint it checked first; an ID clash takes precedence, as in MongoDB
+            taken = connection.execute("SELECT 1 FROM core_liteemployee WHERE employee_id = ?", (document["employeeId"],)).fetchone()
+            raise DuplicateRecordError("employeeId" if taken else "email")
+        document["_id"] = document["employeeId"]
+        document["seq"] = seq
+
+    # The sequence value is taken in the same transaction as the row, so rows commit in sequence order
+    def insert_employee(self, document: dict):
+        with self.transaction() as connection:
+            self.insert_employee_row(connection, document)
+
+    # A failed INSERT only undoes itself, so one transaction covers the whole batch
+    def insert_employees(self, documents: list) -> tuple:
+        duplicates = []
+        with self.transaction() as connection:
+            first = self.next_sequence(connection, len(documents)) if documents else 0
+            for index, document in enumerate(documents):
+                try:
+                    self.insert_employee_row(connection, document, first + index)
+                except DuplicateRecordError as e:
+                    duplicates.append((index, e.field))
+        return len(documents) - len(duplicates), duplicates
+
+    def delete_employee(self, employee_key: str) -> Optional[dict]:
+        with self.transaction() as connection:
+            row = connection.execute(
+                "SELECT employee_id, department FROM core_liteemployee WHERE employee_id = ?", (employee_key,)
+            ).fetchone()
+            if row is None:
+                return None
+            connection.execute("DELETE FROM core_liteemployee WHERE employee_id = ?", (employee_key,))
+            deleted = {"_id": row[0], "employeeId": row[0], "department": row[1]}
+            self.add_tombstones(connection, "employees", [deleted])
+        return deleted
+
+    # Attendance filters as a WHERE clause served by the (employee_id, date) unique index
+    def attendance_where(self, filters: dict) -> tuple:
+        clauses = []
+        params = []
+        if filters.get("employeeId"):
+            clauses.append("employee_id = ?")
+            params.append(filters["employeeId"])
+        if filters.get("department"):
+            clauses.append("employee_id IN (SELECT employee_id FROM core_liteemployee WHERE department = ?)")
+            params.append(filters["department"])
+        if filters.get("date_from"):
+            clauses.append("date >= ?")
+            params.append(filters["date_from"])
+        if filters.get("date_to"):
+            clauses.append("date <= ?")
+            params.append(filters["date_to"])
+        if filters.get("status"):
+            clauses.append("status = ?")
+            params.append(filters["status"])
+        return clauses, params
+
+    def find_attendance(self, filters: dict, after: Optional[list] = None, limit: Optional[int] = None,
+                        ordered: bool = False, batch_size: int = 0, fields: Optional[list] = None):
+        if batch_size and limit is None and fields is None:
+            return self.stream_attendance(filters, after, batch_size)
+        clauses, params = self.attendance_where(filters)
+        if after:
+            clauses.append("(employee_id, date) > (?, ?)")
+            params.extend(after)
+        names, columns = select_fields(fields, ATTENDANCE_FIELD_COLUMNS) if fields is not None else (None, ATTENDANCE_COLUMNS)
+        sql = f"SELECT {columns} FROM core_liteattendance"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        if ordered or limit is not None:
+            sql += " ORDER BY employee_id, date"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        rows = self.connection.execute(sql, params)
+        if names is not None:
+            return (field_document(names, row) for row in rows)
+        return (attendance_document(row) for row in rows)
+
+    # A streamed export is resumed on whichever worker thread is free, and a connection may only be used
+    # on the thread that opened it, so it is read a keyset page at a time on the current thread's connection
+    def stream_attendance(self, filters: dict, after: Optional[list], batch_size: int):
+        while True:
+            page = list(self.find_attendance(filters, after, limit=batch_size))
+            yield from page
+            if len(page) < batch_size:
+                return
+            after = [page[-1]["employeeId"], page[-1]["date"]]
+
+    def insert_attendance_row(self, connection, document: dict, seq: Optional[int] = None):
+        created_at = str(document["createdAt"])
+        if seq is None:
+            seq = self.next_sequence(connection)
+        try:
+            cursor = connection.execute(
+                "INSERT INTO core_liteattendance (employee_id, date, status, created_at, updated_at, seq) VALUES (?, ?, ?, ?, ?, ?)",
+                (document["employeeId"], document["date"], document["status"], created_at, created_at, seq)
+            )
+        except sqlite3.IntegrityError:
+            raise DuplicateRecordError("date")
+        document["_id"] = cursor.lastrowid
+        document["seq"] = seq
+
+    def insert_attendance(self, document: dict):
+        with self.transaction() as connection:
+            self.insert_attendance_row(connection, document)
+
+    def insert_attendance_many(self, documents: list) -> list:
+        duplicates = []
+        with self.transaction() as connection:
+            # One block of sequence values per batch; rejected duplicates leave gaps, as in MongoDB
+            first = self.next_sequence(connection, len(documents)) if documents else 0
+            for index, document in enumerate(documents):
+                try:
+                    self.insert_attendance_row(connection, document, first + index)
+                except DuplicateRecordError:
+                    duplicates.append(index)
+        return duplicates
+
+    def count_attendance(self, filters: dict, by: str) -> list:
+        column = {"employeeId": "employee_id", "date": "date"}[by]
+        clauses, params = self.attendance_where(filters)
+        sql = f"SELECT {column}, {COUNT_COLUMNS} FROM core_liteattendance"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += f" GROUP BY {column} ORDER BY {column}"
+        return count_rows(self.connection.execute(sql, params))
+
+    # Read inside one transaction so both groupings see the same snapshot
+    def summarize_attendance(self, filters: dict) -> tuple:
+        connection = self.connection
+        connection.execute("BEGIN")
+        try:
+            return self.count_attendance(filters, "employeeId"), self.count_attendance(filters, "date")
+        finally:
+            connection.execute("COMMIT")
+
+    def purge_attendance_batch(self, employee_id: str, deleted_at: datetime, limit: int) -> list:
+        with self.transaction() as connection:
+            rows = connection.execute(
+                "SELECT id, employee_id, date, status FROM core_liteattendance"
+                " WHERE employee_id = ? AND created_at <= ? ORDER BY date LIMIT ?",
+                (employee_id, str(deleted_at), limit)
+            ).fetchall()
+            connection.execute(
+                "DELETE FROM core_liteattendance WHERE id IN (SELECT value FROM json_each(?))",
+                (json.dumps([row[0] for row in rows]),)
+            )
+            batch = [{"_id": row[0], "employeeId": row[1], "date": row[2], "status": row[3]} for row in rows]
+            if batch:
+                self.add_tombstones(connection, "attendance", batch)
+        return batch
+
+    def attendance_employee_ids(self) -> list:
+        return [row[0] for row in self.connection.execute("SELECT DISTINCT employee_id FROM core_liteattendance ORDER BY employee_id")]
+
+    # Rollups
+    def apply_rollup_counts(self, monthly: dict, daily: dict, target: str = ""):
+        with self.transaction() as connection:
+            connection.executemany(
+                f"INSERT INTO attendance_monthly{target} (employee_id, month, present, absent) VALUES (?, ?, ?, ?)"
+                " ON CONFLICT (employee_id, month) DO UPDATE SET"
+                " present = present + excluded.present, absent = absent + excluded.absent",
+                [(employee_id, month, counts["present"], counts["absent"]) for (employee_id, month), counts in monthly.items()]
+            )
+            connection.executemany(
+                f"INSERT INTO attendance_daily{target} (date, department, present, absent) VALUES (?, ?, ?, ?)"
+                " ON CONFLICT (date, department) DO UPDATE SET"
+                " present = present + excluded.present, absent = absent + excluded.absent",
+                [(date, department, counts["present"], counts["absent"]) for (department, date), counts in daily.items()]
+            )
+
+    def monthly_rollup_counts(self, filters: dict, months: dict) -> list:
+        clauses, params = self.attendance_where(filters)
+        if "$gte" in months:
+            clauses.append("month >= ?")
+            params.append(months["$gte"])
+        if "$lt" in months:
+            clauses.append("month < ?")
+            params.append(months["$lt"])
+        sql = "SELECT employee_id, SUM(present), SUM(absent) FROM attendance_monthly"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " GROUP BY employee_id ORDER BY employee_id"
+        return count_rows(self.connection.execute(sql, params))
+
+    def daily_rollup_counts(self, department: Optional[str], date_from: Optional[str], date_to: Optional[str]) -> list:
+        clauses, params = self.attendance_where({"date_from": date_from, "date_to": date_to})
+        if department:
+            clauses.append("department = ?")
+            params.append(department)
+        sql = "SELECT date, SUM(present), SUM(absent) FROM attendance_daily"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " GROUP BY date ORDER BY date"
+        return count_rows(self.connection.execute(sql, params))
+
+    def delete_empty_rollups(self, employee_id: str, department: str):
+        with self.transaction() as connection:
+            connection.execute("DELETE FROM attendance_monthly WHERE employee_id = ? AND present = 0 AND absent = 0", (employee_id,))
+            connection.execute("DELETE FROM attendance_daily WHERE department = ? AND present = 0 AND absent = 0", (department,))
+
+    def delete_monthly_rollups(self, employee_ids: list):
+        with self.transaction() as connection:
+            connection.execute(
+                "DELETE FROM attendance_monthly WHERE employee_id IN (SELECT value FROM json_each(?))",
+                (json.dumps(list(employee_ids)),)
+            )
+
+    def rollup_chunk(self, employee_ids: list) -> tuple:
+        ids = json.dumps(list(employee_ids))
+        connection = self.connection
+        monthly = connection.execute(
+            f"SELECT employee_id, substr(date, 1, 7) AS month, {COUNT_COLUMNS} FROM core_liteattendance"
+            " WHERE employee_id IN (SELECT value FROM json_each(?)) GROUP BY employee_id, month",
+            (ids,)
+        )
+        monthly = {(employee_id, month): {"present": present, "absent": absent} for employee_id, month, present, absent in monthly}
+        daily = connection.execute(
+            f"SELECT date, {COUNT_COLUMNS} FROM core_liteattendance"
+            " WHERE employee_id IN (SELECT value FROM json_each(?)) GROUP BY date",
+            (ids,)
+        )
+        return monthly, {date: {"present": present, "absent": absent} for date, present, absent in daily}
+
+    REBUILD_SUFFIX = "_rebuild"
+
+    def begin_rollup_rebuild(self):
+        with self.transaction() as connection:
+            connection.execute(f"DROP TABLE IF EXISTS attendance_monthly{self.REBUILD_SUFFIX}")
+            connection.execute(f"DROP TABLE IF EXISTS attendance_daily{self.REBUILD_SUFFIX}")
+        self.connection.executescript(SQLITE_ROLLUP_SCHEMA.format(suffix=self.REBUILD_SUFFIX))
+
+    def add_rebuilt_rollups(self, monthly: dict, daily: dict):
+        self.apply_rollup_counts(monthly, daily, target=self.REBUILD_SUFFIX)
+
+    def finish_rollup_rebuild(self):
+        with self.transaction() as connection:
+            for table in ("attendance_monthly", "attendance_daily"):
+                connection.execute(f"DROP TABLE {table}")
+                connection.execute(f"ALTER TABLE {table}{self.REBUILD_SUFFIX} RENAME TO {table}")
+
+    def rollup_counts(self) -> tuple:
+        connection = self.connection
+        monthly = {
+            (employee_id, month): (present, absent)
+            for employee_id, month, present, absent in connection.execute("SELECT employee_id, month, present, absent FROM attendance_monthly")
+        }
+        daily = {
+            (department, date): (present, absent)
+            for date, department, present, absent in connection.execute("SELECT date, department, present, absent FROM attendance_daily")
+        }
+        return monthly, daily
+
+    # Delta sync
+    def next_sequence(self, connection, count: int = 1) -> int:
+        last = connection.execute(
+            "INSERT INTO sync_sequence (name, seq) VALUES ('sync', ?)"
+            " ON CONFLICT (name) DO UPDATE SET seq = seq + excluded.seq RETURNING seq",
+            (count,)
+        ).fetchall()[0][0]
+        return last - count + 1
+
+    def add_tombstones(self, connection, collection: str, documents: list):
+        first = self.next_sequence(connection, len(documents))
+        deleted_at = str(datetime.utcnow())
+        connection.executemany(
+            "INSERT INTO sync_tombstones (seq, collection, record_id, employee_id, deleted_at) VALUES (?, ?, ?, ?, ?)",
+            [(first + offset, collection, str(document["_id"]), document["employeeId"], deleted_at) for offset, document in enumerate(documents)]
+        )
+
+    def find_changed(self, collection: str, after: int, limit: int) -> list:
+        if collection == "employees":
+            sql = f"SELECT {EMPLOYEE_COLUMNS}, seq, updated_at FROM core_liteemployee WHERE seq > ? ORDER BY seq LIMIT ?"
+            document = employee_document
+        else:
+            sql = f"SELECT {ATTENDANCE_COLUMNS}, seq, updated_at FROM core_liteattendance WHERE seq > ? ORDER BY seq LIMIT ?"
+            document = attendance_document
+        return [
+            {**document(row), "seq": row[-2], "updatedAt": parse_timestamp(row[-1])}
+            for row in self.connection.execute(sql, (after, limit))
+        ]
+
+    def find_tombstones(self, after: int, limit: int) -> list:
+        rows = self.connection.execute(
+            "SELECT seq, collection, record_id, employee_id, deleted_at FROM sync_tombstones WHERE seq > ? ORDER BY seq LIMIT ?",
+            (after, limit)
+        )
+        return [
+            {"seq": seq, "collection": collection, "recordId": record_id, "employeeId": employee_id, "deletedAt": parse_timestamp(deleted_at)}
+            for seq, collection, record_id, employee_id, deleted_at in rows
+        ]
+
+    def backfill_sequence(self, batch_size: int = 1000) -> int:
+        stamped = 0
+        for table, key in (("core_liteemployee", "employee_id"), ("core_liteattendance", "id")):
+            while True:
+                with self.transaction() as connection:
+                    keys = [row[0] for row in connection.execute(
+                        f"SELECT {key} FROM {table} WHERE seq IS NULL ORDER BY created_at LIMIT ?", (batch_size,)
+                    )]
+                    if keys:
+                        first = self.next_sequence(connection, len(keys))
+                        connection.executemany(f"UPDATE {table} SET seq = ? WHERE {key} = ?", [(first + offset, value) for offset, value in enumerate(keys)])
+                if not keys:
+                    break
+                stamped += len(keys)
+        return stamped
+
+class LazyRepository:
+    # Stands in for the configured repository and builds it on first use in each process. Importing
+    # the app opens no connections, and workers forked after import never share their parent's
+    # client or SQLite connections, neither of which survive a fork
+    def __init__(self, factory):
+        self.factory = factory
+        self.lock = threading.Lock()
+        self.pid = None
+        self.repository = None
+
+    def connect(self):
+        pid = os.getpid()
+        if self.pid != pid:
+            with self.lock:
+                if self.pid != pid:
+                    self.repository = self.factory()
+                    self.pid = pid
+        return self.repository
+
+    def __getattr__(self, name):
+        return getattr(self.connect(), name)
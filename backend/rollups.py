@@ -0,0 +1,90 @@
+import argparse
+import sys
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+import application
+
+# Rollups count the attendance of current employees: rebuilds are partitioned by department so each
+# chunk's daily counts belong to exactly one department, and large departments are split further
+def rebuild_chunks(repository, chunk_size: int):
+    by_department = defaultdict(list)
+    for employee_id, department in repository.employee_departments():
+        by_department[department].append(employee_id)
+    for department, employee_ids in sorted(by_department.items()):
+        for start in range(0, len(employee_ids), chunk_size):
+            yield department, employee_ids[start:start + chunk_size]
+
+# Monthly counts keyed by (employeeId, month) and daily counts keyed by (department, date)
+def aggregate_chunk(repository, department: str, employee_ids: list) -> tuple:
+    monthly, daily = repository.rollup_chunk(employee_ids)
+    return monthly, {(department, date): counts for date, counts in daily.items()}
+
+def rebuild_rollups(repository, workers: int = 4, chunk_size: int = 500) -> dict:
+    # Chunks are written into scratch tables which then replace the live ones in one rename;
+    # attendance marked while a rebuild runs is only counted if it was read by its chunk
+    repository.begin_rollup_rebuild()
+
+    def rebuild_chunk(chunk):
+        # Chunks of the same department overlap on dates, so their daily counts are added up
+        repository.add_rebuilt_rollups(*aggregate_chunk(repository, *chunk))
+        return len(chunk[1])
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        employees = sum(pool.map(rebuild_chunk, rebuild_chunks(repository, chunk_size)))
+
+    repository.finish_rollup_rebuild()
+    monthly, daily = repository.rollup_counts()
+    return {"employees": employees, "monthly": len(monthly), "daily": len(daily)}
+
+def nonzero_counts(counts: dict) -> dict:
+    # Rows whose counts have dropped back to zero are equivalent to missing rows
+    return {key: value for key, value in counts.items() if any(value)}
+
+def diff_counts(kind: str, key_fields: tuple, expected: dict, actual: dict) -> list:
+    return [
+        {"rollup": kind, **dict(zip(key_fields, key)), "expected": expected.get(key, (0, 0)), "actual": actual.get(key, (0, 0))}
+        for key in sorted(set(expected) | set(actual))
+        if expected.get(key, (0, 0)) != actual.get(key, (0, 0))
+    ]
+
+def check_rollups(repository, workers: int = 4, chunk_size: int = 500) -> list:
+    expected_monthly = {}
+    expected_daily = defaultdict(lambda: (0, 0))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for monthly, daily in pool.map(lambda chunk: aggregate_chunk(repository, *chunk), rebuild_chunks(repository, chunk_size)):
+            for key, counts in monthly.items():
+                expected_monthly[key] = (counts["present"], counts["absent"])
+            for key, counts in daily.items():
+                present, absent = expected_daily[key]
+                expected_daily[key] = (present + counts["present"], absent + counts["absent"])
+
+    monthly, daily = repository.rollup_counts()
+    return (
+        diff_counts("monthly", ("employeeId", "month"), expected_monthly, nonzero_counts(monthly))
+        + diff_counts("daily", ("department", "date"), dict(expected_daily), nonzero_counts(daily))
+    )
+
+def main_rollups():
+    parser = argparse.ArgumentParser(description="Rebuild or verify the attendance rollup collections")
+    parser.add_argument("command", choices=["rebuild", "check"])
+    parser.add_argument("--workers", type=int, default=4, help="Chunks aggregated in parallel")
+    parser.add_argument("--chunk-size", type=int, default=500, help="Employees per chunk")
+    args = parser.parse_args()
+
+    if args.command == "rebuild":
+        counts = rebuild_rollups(application.repository, args.workers, args.chunk_size)
+        print(f"Rebuilt rollups for {counts['employees']} employees: "
+              f"{counts['monthly']} monthly rows, {counts['daily']} daily rows")
+        return
+
+    mismatches = check_rollups(application.repository, args.workers, args.chunk_size)
+    for mismatch in mismatches[:50]:
+        print(mismatch)
+    if mismatches:
+        print(f"{len(mismatches)} rollup rows differ from the raw attendance; run `python rollups.py rebuild`")
+        sys.exit(1)
+    print("Rollups match the raw attendance")
+
+if __name__ == "__main__":
+    main_rollups()
@@ -0,0 +1,209 @@
+from datetime import datetime
+from unittest import mock
+
+import mongomock
+import pytest
+from fastapi.testclient import TestClient
+
+import application
+import bucket_attendance
+from repositories import BucketChangeStream, BucketedMongoRepository, DuplicateRecordError, MongoRepository
+
+# The monthly layout is MongoDB-only, so these tests use the stand-in whatever STORAGE_BACKEND says
+def layout_client(make_app, layout: str) -> TestClient:
+    return TestClient(make_app(storage_backend="mongo", attendance_layout=layout))
+
+# Unpaged row listings come in insertion order, buckets in (employeeId, date) order
+def without_ids(rows: list) -> list:
+    return sorted(
+        ({key: value for key, value in row.items() if key not in ("id", "createdAt")} for row in rows),
+        key=lambda row: (row["employeeId"], row["date"])
+    )
+
+def run_scenario(client) -> dict:
+    for i, department in enumerate(["Payroll", "Payroll", "Legal"]):
+        client.post("/api/employees", json={
+            "employeeId": f"BKT{i:03d}", "fullName": f"Bucket Person {i}",
+            "email": f"bucket.person{i}@company.com", "department": department
+        })
+    for day in ("2024-09-30", "2024-10-01", "2024-10-02", "2024-11-04"):
+        for i in range(3):
+            client.post("/api/attendance", json={"employeeId": f"BKT{i:03d}", "date": day, "status": "Absent" if i == day.endswith("2") else "Present"})
+    results = {
+        "duplicate": client.post("/api/attendance", json={"employeeId": "BKT000", "date": "2024-10-01", "status": "Absent"}).status_code,
+        "bulk": client.post("/api/attendance/bulk", json=[
+            {"employeeId": "BKT000", "date": "2024-10-03", "status": "Present"},
+            {"employeeId": "BKT001", "date": "2024-10-01", "status": "Absent"},
+            {"employeeId": "BKT002", "date": "2024-10-03", "status": "Absent"},
+        ]).json()["duplicates"],
+        "all": without_ids(client.get("/api/attendance").json()),
+        "october": without_ids(client.get("/api/attendance", params={"date_from": "2024-10-01", "date_to": "2024-10-31"}).json()),
+        "absent": without_ids(client.get("/api/attendance", params={"department": "Payroll", "status": "Absent"}).json()),
+        "one": without_ids(client.get("/api/attendance", params={"employeeId": "BKT001", "date_from": "2024-10-02"}).json()),
+        "summary": client.get("/api/attendance/summary", params={"date_from": "2024-10-01", "source": "raw"}).json(),
+        "rollup": client.get("/api/attendance/summary", params={"date_from": "2024-10-01"}).json(),
+    }
+    pages, cursor = [], None
+    while True:
+        response = client.get("/api/attendance", params={"limit": 4, **({"cursor": cursor} if cursor else {})})
+        pages.extend(response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+    results["paged"] = without_ids(pages)
+    results["export"] = len(client.get("/api/attendance/export").text.splitlines())
+
+    employee = next(e for e in client.get("/api/employees").json() if e["employeeId"] == "BKT001")
+    client.delete(f"/api/employees/{employee['id']}")
+    results["after_delete"] = without_ids(client.get("/api/attendance").json())
+    return results
+
+def test_monthly_layout_serves_the_same_api(make_app):
+    rows = run_scenario(layout_client(make_app, "rows"))
+    client = layout_client(make_app, "monthly")
+    repository = client.app.state.hrms.repository.connect()
+    assert isinstance(repository, BucketedMongoRepository)
+    buckets = run_scenario(client)
+    # Ids name the employee and day
+    assert client.get("/api/attendance", params={"limit": 1}).json()[0]["id"] == "BKT000:2024-09-30"
+    # One document per employee and month, none left for the deleted employee
+    assert repository.attendance_buckets.count_documents({}) == 6
+    assert repository.attendance.count_documents({}) == 0
+    assert buckets == rows
+    assert buckets["duplicate"] == 400 and buckets["bulk"] == 1
+    assert buckets["paged"] == buckets["all"] and len(buckets["all"]) == 14
+    assert buckets["export"] == 14
+    print("✓ The monthly layout answers every attendance route like the row layout")
+
+def test_first_marks_of_a_month_do_not_collide():
+    db = mongomock.MongoClient()["hrms_lite_buckets"]
+    repository = BucketedMongoRepository(db)
+    repository.create_indexes()
+    repository.insert_employees([
+        {"employeeId": f"RACE{i}", "fullName": f"Racing {i}", "email": f"racing{i}@company.com", "department": "Legal"}
+        for i in range(2)
+    ])
+    mark = lambda employee_id, date: {"employeeId": employee_id, "date": date, "status": "Present", "createdAt": datetime(2024, 10, 1, 9)}
+    collection = repository.attendance_buckets
+
+    # Another request creates the bucket and marks its own day between this request's two writes
+    class Interleaved:
+        def __init__(self, interleave):
+            self.interleave, self.calls = interleave, 0
+
+        def __getattr__(self, name):
+            return getattr(collection, name)
+
+        def write(self, method, *args, **kwargs):
+            result = getattr(collection, method)(*args, **kwargs)
+            self.calls += 1
+            if self.calls == 1:
+                repository.attendance_buckets = collection
+                self.interleave()
+            return result
+
+        def update_one(self, *args, **kwargs):
+            return self.write("update_one", *args, **kwargs)
+
+        def bulk_write(self, *args, **kwargs):
+            return self.write("bulk_write", *args, **kwargs)
+
+    repository.attendance_buckets = Interleaved(lambda: repository.insert_attendance(mark("RACE0", "2024-10-02")))
+    repository.insert_attendance(mark("RACE0", "2024-10-01"))
+    repository.attendance_buckets = Interleaved(lambda: repository.insert_attendance_many([mark("RACE1", "2024-10-04")]))
+    assert repository.insert_attendance_many([mark("RACE1", "2024-10-03"), mark("RACE1", "2024-10-04"), mark("RACE1", "2024-10-05")]) == [1]
+    assert [(row["employeeId"], row["date"]) for row in repository.find_attendance({})] == [
+        ("RACE0", "2024-10-01"), ("RACE0", "2024-10-02"),
+        ("RACE1", "2024-10-03"), ("RACE1", "2024-10-04"), ("RACE1", "2024-10-05")
+    ]
+    assert collection.count_documents({}) == 2
+
+    # A day that is taken is still reported, singly and in bulk
+    with pytest.raises(DuplicateRecordError):
+        repository.insert_attendance(mark("RACE0", "2024-10-01"))
+    assert repository.insert_attendance_many([mark("RACE0", "2024-10-02"), mark("RACE0", "2024-10-06"), mark("RACE0", "2024-10-06")]) == [0, 2]
+    print("✓ Concurrent first marks in a month share its bucket; only days already taken are duplicates")
+
+def test_delta_sync_over_buckets(make_app):
+    client = layout_client(make_app, "monthly")
+    with mock.patch.object(client.app.state.hrms.settings, "sync_settle_seconds", 0):
+        run_scenario(client)
+        repository = client.app.state.hrms.repository.connect()
+        changed = repository.find_changed("attendance", 0, 1000)
+        assert [row["seq"] for row in changed] == sorted(row["seq"] for row in changed)
+        # The deleted employee's four days are gone
+        assert len(changed) == 10
+        # Small windows page through the same days in sequence order
+        paged, after = [], 0
+        while True:
+            page = repository.find_changed("attendance", after, 3)
+            if not page:
+                break
+            paged.extend(page)
+            after = page[-1]["seq"]
+        assert paged == changed
+
+        page = client.get("/api/sync").json()
+        assert len(page["attendance"]["upserted"]) == 10
+        assert sorted(page["attendance"]["deleted"]) == [f"BKT001:{day}" for day in ("2024-09-30", "2024-10-01", "2024-10-02", "2024-11-04")]
+    print("✓ Delta sync finds changed days through the buckets' sequence bounds")
+
+def test_migration_copies_rows_into_buckets():
+    db = mongomock.MongoClient()["hrms_lite_buckets"]
+    rows = MongoRepository(db)
+    rows.create_indexes()
+    rows.clear()
+    rows.insert_employees([
+        {"employeeId": f"MIG{i}", "fullName": f"Migrated {i}", "email": f"migrated{i}@company.com", "department": "Legal"}
+        for i in range(3)
+    ])
+    rows.insert_attendance_many([
+        {"employeeId": f"MIG{i}", "date": f"2024-{month:02d}-{day:02d}", "status": "Present" if day % 3 else "Absent",
+         "createdAt": datetime(2024, month, day, 9)}
+        for i in range(3) for month in (1, 2) for day in range(1, 11)
+    ])
+    # Written before delta sync existed
+    rows.attendance.update_many({"employeeId": "MIG2"}, {"$unset": {"seq": "", "updatedAt": ""}})
+    expected = [
+        {key: row[key] for key in ("employeeId", "date", "status", "createdAt")}
+        for row in rows.find_attendance({}, ordered=True)
+    ]
+
+    buckets = BucketedMongoRepository(db)
+    assert bucket_attendance.bucket_attendance(buckets, batch_size=7) == {"rows": 60, "days": 60}
+    copied = list(buckets.find_attendance({}))
+    assert [{key: row[key] for key in ("employeeId", "date", "status", "createdAt")} for row in copied] == expected
+    assert buckets.attendance_buckets.count_documents({}) == 6
+    assert {row["seq"] for row in copied} == {row["seq"] for row in rows.find_changed("attendance", 0, 100)}
+
+    # A second run changes nothing
+    assert bucket_attendance.bucket_attendance(buckets) == {"rows": 60, "days": 60}
+    assert list(buckets.find_attendance({})) == copied
+    print("✓ bucket_attendance.py copies rows into buckets with their sequence numbers, and can be rerun")
+
+def test_change_stream_reports_rows():
+    marked = {"s": "P", "c": datetime(2024, 10, 1, 9), "q": 5}
+    stream = mock.MagicMock()
+    stream.__iter__.return_value = iter([
+        {"operationType": "insert", "ns": {"coll": "employees"}, "fullDocument": {
+            "_id": "E1", "employeeId": "E1", "fullName": "Person One", "email": "one@company.com", "department": "Legal", "createdAt": marked["c"]
+        }},
+        {"operationType": "insert", "ns": {"coll": "attendance_buckets"}, "documentKey": {"_id": "E1:2024-10"},
+         "fullDocument": {"_id": "E1:2024-10", "employeeId": "E1", "month": "2024-10", "days": {"01": marked}}},
+        {"operationType": "update", "ns": {"coll": "attendance_buckets"}, "documentKey": {"_id": "E1:2024-10"},
+         "updateDescription": {"updatedFields": {"days.02": {**marked, "s": "A"}, "seq": 6}, "removedFields": []}},
+        {"operationType": "update", "ns": {"coll": "attendance_buckets"}, "documentKey": {"_id": "E1:2024-10"},
+         "updateDescription": {"updatedFields": {}, "removedFields": ["days.01", "days.02"]}},
+    ])
+    with BucketChangeStream(stream) as changes:
+        events = [application.change_event(change) for change in changes]
+    assert stream.close.called
+    assert [(kind, row.get("date"), row.get("status")) for kind, row in events[1:3]] == [
+        ("attendance.created", "2024-10-01", "Present"), ("attendance.created", "2024-10-02", "Absent")
+    ]
+    assert events[0][0] == "employee.created"
+    assert events[3:] == [("attendance.deleted", {"id": "E1:2024-10-01"}), ("attendance.deleted", {"id": "E1:2024-10-02"})]
+    print("✓ Bucket changes reach the live feed as attendance rows")
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, "-s"]))
@@ -0,0 +1,73 @@
+from unittest import mock
+
+import pytest
+
+def seed(client, employees):
+    for i in range(employees):
+        response = client.post("/api/employees", json={
+            "employeeId": f"BULK{i:04d}",
+            "fullName": f"Bulk Person {i}",
+            "email": f"bulk.person{i}@company.com",
+            "department": "Operations"
+        })
+        assert response.status_code == 200
+
+def test_bulk_attendance_reports_each_row(client):
+    seed(client, 2)
+    client.post("/api/attendance", json={"employeeId": "BULK0000", "date": "2024-03-01", "status": "Present"})
+
+    response = client.post("/api/attendance/bulk", json=[
+        {"employeeId": "BULK0000", "date": "2024-03-01", "status": "Present"},
+        {"employeeId": "BULK0000", "date": "2024-03-02", "status": "Absent"},
+        {"employeeId": "BULK0001", "date": "2024-03-02", "status": "Present"},
+        {"employeeId": "BULK0001", "date": "2024-03-02", "status": "Absent"},
+        {"employeeId": "NOBODY", "date": "2024-03-02", "status": "Present"}
+    ])
+    assert response.status_code == 200
+    data = response.json()
+    assert [row["result"] for row in data["results"]] == [
+        "duplicate", "created", "created", "duplicate", "employee_not_found"
+    ]
+    assert (data["created"], data["duplicates"], data["unknownEmployees"]) == (2, 2, 1)
+
+    attendance = client.get("/api/attendance", params={"date_from": "2024-03-02"}).json()
+    assert {(row["employeeId"], row["status"], row["employeeName"]) for row in attendance} == {
+        ("BULK0000", "Absent", "Bulk Person 0"),
+        ("BULK0001", "Present", "Bulk Person 1")
+    }
+    created_ids = {row["id"] for row in data["results"] if row["result"] == "created"}
+    assert created_ids == {row["id"] for row in attendance}
+    print("✓ Bulk attendance reports created, duplicate and unknown-employee rows")
+
+def test_dates_must_be_calendar_days(client):
+    seed(client, 1)
+    for day in ("not-a-date", "2024-3-1", "2024-02-30", "2024-03-01T09:00"):
+        marked = {"employeeId": "BULK0000", "date": day, "status": "Present"}
+        assert client.post("/api/attendance", json=marked).status_code == 422
+        assert client.post("/api/attendance/bulk", json=[marked]).status_code == 422
+    assert client.get("/api/attendance").json() == []
+    assert client.get("/api/attendance/summary").json()["employees"] == []
+    print("✓ Attendance dates other than real YYYY-MM-DD days are rejected")
+
+def test_bulk_attendance_round_trips(client, state):
+    seed(client, 100)
+    records = [
+        {"employeeId": f"BULK{i % 100:04d}", "date": f"2024-04-{i // 100 + 1:02d}", "status": "Present"}
+        for i in range(1000)
+    ]
+
+    with mock.patch.object(state.repository, "lookup_employees", wraps=state.repository.lookup_employees) as lookup, \
+         mock.patch.object(state.repository, "insert_attendance_many", wraps=state.repository.insert_attendance_many) as insert_many, \
+         mock.patch.object(state.repository, "insert_attendance", wraps=state.repository.insert_attendance) as insert_one:
+        response = client.post("/api/attendance/bulk", json=records)
+
+    assert response.status_code == 200
+    assert response.json()["created"] == 1000
+    assert (lookup.call_count, insert_many.call_count, insert_one.call_count) == (1, 1, 0)
+    print("✓ 1,000 records marked with one employee query and one insert_many")
+
+    response = client.post("/api/attendance/bulk", json=records * 6)
+    assert response.status_code == 400
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, "-s"]))
@@ -0,0 +1,101 @@
+from unittest import mock
+
+import pytest
+
+import rollups
+
+EMPLOYEES = [
+    ("ROLL001", "Engineering"),
+    ("ROLL002", "Engineering"),
+    ("ROLL003", "Sales"),
+]
+
+def seed(client):
+    for employee_id, department in EMPLOYEES:
+        client.post("/api/employees", json={
+            "employeeId": employee_id,
+            "fullName": f"Rollup {employee_id}",
+            "email": f"{employee_id.lower()}@company.com",
+            "department": department
+        })
+
+def mark_attendance(client):
+    # Spans three months so that date ranges can cut months in half
+    records = []
+    for i, day in enumerate(["2024-08-30", "2024-08-31", "2024-09-02", "2024-09-15", "2024-09-30", "2024-10-01", "2024-10-07"]):
+        for j, (employee_id, _) in enumerate(EMPLOYEES):
+            records.append({"employeeId": employee_id, "date": day, "status": "Present" if (i + j) % 3 else "Absent"})
+    client.post("/api/attendance", json=records[0])
+    client.post("/api/attendance/bulk", json=records[1:] + [records[0], {"employeeId": "NOBODY", "date": "2024-09-02", "status": "Present"}])
+
+def test_writes_maintain_rollups(client, state):
+    seed(client)
+    client.post("/api/attendance", json={"employeeId": "ROLL001", "date": "2024-09-02", "status": "Present"})
+    client.post("/api/attendance", json={"employeeId": "ROLL001", "date": "2024-09-02", "status": "Absent"})
+    client.post("/api/attendance/bulk", json=[
+        {"employeeId": "ROLL001", "date": "2024-09-03", "status": "Absent"},
+        {"employeeId": "ROLL002", "date": "2024-09-03", "status": "Present"},
+        {"employeeId": "ROLL002", "date": "2024-09-03", "status": "Absent"},
+        {"employeeId": "ROLL003", "date": "2024-10-01", "status": "Present"},
+    ])
+
+    monthly, daily = state.repository.rollup_counts()
+    assert monthly == {("ROLL001", "2024-09"): (1, 1), ("ROLL002", "2024-09"): (1, 0), ("ROLL003", "2024-10"): (1, 0)}
+    assert daily == {("Engineering", "2024-09-02"): (1, 0), ("Engineering", "2024-09-03"): (1, 1), ("Sales", "2024-10-01"): (1, 0)}
+    assert rollups.check_rollups(state.repository) == []
+    print("✓ Single and bulk writes update the rollups; duplicates are not counted")
+
+def test_rollup_summary_matches_raw(client, state):
+    seed(client)
+    mark_attendance(client)
+    ranges = [
+        {},
+        {"date_from": "2024-09-01", "date_to": "2024-09-30"},
+        {"date_from": "2024-08-31", "date_to": "2024-10-01"},
+        {"date_from": "2024-09-15"},
+        {"date_to": "2024-09-15"},
+        {"date_from": "2024-09-02", "date_to": "2024-09-15"},
+        {"department": "Engineering", "date_from": "2024-08-31"},
+        {"employeeId": "ROLL003", "date_to": "2024-10-01"},
+    ]
+    for params in ranges:
+        raw = client.get("/api/attendance/summary", params={**params, "source": "raw"}).json()
+        assert client.get("/api/attendance/summary", params=params).json() == raw, params
+    # Malformed bounds are rejected whichever source would have answered
+    for source in ("rollup", "raw"):
+        for params in ({"date_from": "15/09/2024"}, {"date_to": "garbage"}, {"date_from": "2024-02-30"}):
+            response = client.get("/api/attendance/summary", params={**params, "source": source})
+            assert response.status_code == 400, (source, params)
+            assert response.json()["detail"] == "Dates must be formatted as YYYY-MM-DD"
+
+    # Whole months are answered from the rollups without scanning raw rows
+    with mock.patch.object(state.repository, "count_attendance") as count_attendance, \
+         mock.patch.object(state.repository, "summarize_attendance") as summarize_attendance:
+        client.get("/api/attendance/summary", params={"date_from": "2024-09-01", "date_to": "2024-09-30"})
+    assert not count_attendance.called and not summarize_attendance.called
+    print(f"✓ Rollup summaries match fresh aggregations over {len(ranges)} filter combinations")
+
+def test_check_and_rebuild(client, state):
+    seed(client)
+    mark_attendance(client)
+    assert rollups.check_rollups(state.repository, workers=2, chunk_size=1) == []
+
+    # Drift: five phantom marks in one month, and one department's day zeroed out
+    _, daily = state.repository.rollup_counts()
+    present, absent = daily[("Sales", "2024-10-07")]
+    state.repository.apply_rollup_counts(
+        {("ROLL001", "2024-09"): {"present": 5, "absent": 0}},
+        {("Sales", "2024-10-07"): {"present": -present, "absent": -absent}}
+    )
+    mismatches = rollups.check_rollups(state.repository)
+    assert [(m["rollup"], m.get("employeeId"), m["date"] if "date" in m else m["month"]) for m in mismatches] == [
+        ("monthly", "ROLL001", "2024-09"), ("daily", None, "2024-10-07")
+    ]
+
+    counts = rollups.rebuild_rollups(state.repository, workers=2, chunk_size=1)
+    assert counts == {"employees": 3, "monthly": 9, "daily": 14}
+    assert rollups.check_rollups(state.repository) == []
+    print("✓ The consistency check finds drift and a parallel rebuild repairs it")
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, "-s"]))
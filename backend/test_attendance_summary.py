@@ -0,0 +1,57 @@
+import pytest
+
+EMPLOYEES = [
+    ("SUM001", "Ada Summary", "Engineering"),
+    ("SUM002", "Ben Summary", "Engineering"),
+    ("SUM003", "Cy Summary", "Sales"),
+]
+
+def seed(client):
+    for employee_id, name, department in EMPLOYEES:
+        client.post("/api/employees", json={
+            "employeeId": employee_id,
+            "fullName": name,
+            "email": f"{employee_id.lower()}@company.com",
+            "department": department
+        })
+    client.post("/api/attendance/bulk", json=[
+        {"employeeId": "SUM001", "date": "2024-09-02", "status": "Present"},
+        {"employeeId": "SUM001", "date": "2024-09-03", "status": "Present"},
+        {"employeeId": "SUM001", "date": "2024-09-04", "status": "Absent"},
+        {"employeeId": "SUM002", "date": "2024-09-02", "status": "Absent"},
+        {"employeeId": "SUM003", "date": "2024-09-02", "status": "Present"},
+        {"employeeId": "SUM003", "date": "2024-09-03", "status": "Present"},
+    ])
+
+def test_summary_counts(client):
+    seed(client)
+    summary = client.get("/api/attendance/summary").json()
+
+    employees = {row["employeeId"]: row for row in summary["employees"]}
+    assert (employees["SUM001"]["present"], employees["SUM001"]["absent"]) == (2, 1)
+    assert employees["SUM001"]["employeeName"] == "Ada Summary"
+    assert abs(employees["SUM001"]["attendanceRate"] - 2 / 3) < 1e-9
+    assert employees["SUM002"]["attendanceRate"] == 0.0
+
+    departments = {row["department"]: row for row in summary["departments"]}
+    assert (departments["Engineering"]["present"], departments["Engineering"]["absent"]) == (2, 2)
+    assert departments["Sales"]["total"] == 2
+
+    assert [(row["date"], row["present"], row["absent"]) for row in summary["days"]] == [
+        ("2024-09-02", 2, 1), ("2024-09-03", 2, 0), ("2024-09-04", 0, 1)
+    ]
+    print("✓ Summary reports per-employee, per-department and per-day counts")
+
+def test_summary_filters(client):
+    seed(client)
+    summary = client.get("/api/attendance/summary", params={"department": "Engineering", "date_from": "2024-09-03"}).json()
+    assert [row["employeeId"] for row in summary["employees"]] == ["SUM001"]
+    assert [row["department"] for row in summary["departments"]] == ["Engineering"]
+    assert [row["date"] for row in summary["days"]] == ["2024-09-03", "2024-09-04"]
+
+    summary = client.get("/api/attendance/summary", params={"date_from": "2025-01-01"}).json()
+    assert summary == {"employees": [], "departments": [], "days": []}
+    print("✓ Summary honours department and date range filters")
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, "-s"]))
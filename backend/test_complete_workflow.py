@@ -1,126 +0,0 @@
-import requests
-import json
-from datetime import datetime
-
-BASE_URL = "http://localhost:5000/api"
-
-def test_complete_hrms_workflow():
-    print("🚀 Testing Complete HRMS Lite Workflow...")
-    print("=" * 50)
-    
-    # Step 1: Create test employees
-    print("\n1️⃣ Creating test employees...")
-    employees = [
-        {
-            "employeeId": "EMP001",
-            "fullName": "John Doe",
-            "email": "john.doe@company.com",
-            "department": "Engineering"
-        },
-        {
-            "employeeId": "EMP002",
-            "fullName": "Jane Smith",
-            "email": "jane.smith@company.com",
-            "department": "Marketing"
-        }
-    ]
-    
-    created_employees = []
-    for emp in employees:
-        try:
-            response = requests.post(f"{BASE_URL}/employees", json=emp)
-            if response.status_code == 200:
-                created = response.json()
-                created_employees.append(created)
-                print(f"✅ Created: {created['fullName']} ({created['employeeId']})")
-            else:
-                print(f"❌ Failed to create {emp['fullName']}: {response.status_code}")
-        except Exception as e:
-            print(f"❌ Error creating {emp['fullName']}: {e}")
-    
-    # Step 2: List all employees
-    print("\n2️⃣ Listing all employees...")
-    try:
-        response = requests.get(f"{BASE_URL}/employees")
-        if response.status_code == 200:
-            all_employees = response.json()
-            print(f"✅ Found {len(all_employees)} employees:")
-            for emp in all_employees:
-                print(f"   • {emp['fullName']} - {emp['department']} ({emp['employeeId']})")
-        else:
-            print(f"❌ Failed to fetch employees: {response.status_code}")
-    except Exception as e:
-        print(f"❌ Error fetching employees: {e}")
-    
-    # Step 3: Mark attendance
-    print("\n3️⃣ Marking attendance...")
-    today = datetime.now().strftime("%Y-%m-%d")
-    attendance_records = [
-        {"employeeId": "EMP001", "date": today, "status": "Present"},
-        {"employeeId": "EMP002", "date": today, "status": "Present"}
-    ]
-    
-    for record in attendance_records:
-        try:
-            response = requests.post(f"{BASE_URL}/attendance", json=record)
-            if response.status_code == 200:
-                print(f"✅ Marked attendance: {record['employeeId']} - {record['status']}")
-            else:
-                print(f"❌ Failed to mark attendance for {record['employeeId']}: {response.status_code}")
-        except Exception as e:
-            print(f"❌ Error marking attendance for {record['employeeId']}: {e}")
-    
-    # Step 4: List attendance records
-    print("\n4️⃣ Listing attendance records...")
-    try:
-        response = requests.get(f"{BASE_URL}/attendance")
-        if response.status_code == 200:
-            attendance = response.json()
-            print(f"✅ Found {len(attendance)} attendance records:")
-            for record in attendance:
-                print(f"   • {record['employeeId']['fullName']}: {record['status']} on {record['date']}")
-        else:
-            print(f"❌ Failed to fetch attendance: {response.status_code}")
-    except Exception as e:
-        print(f"❌ Error fetching attendance: {e}")
-    
-    # Step 5: Test employee deletion with confirmation
-    print("\n5️⃣ Testing employee deletion with confirmation modal...")
-    if created_employees:
-        employee_to_delete = created_employees[0]
-        try:
-            response = requests.delete(f"{BASE_URL}/employees/{employee_to_delete['id']}")
-            if response.status_code == 200:
-                print(f"✅ Deleted employee: {employee_to_delete['fullName']}")
-                print("✅ Confirmation modal would have been shown in the UI")
-            else:
-                print(f"❌ Failed to delete employee: {response.status_code}")
-        except Exception as e:
-            print(f"❌ Error deleting employee: {e}")
-    
-    # Step 6: Verify final state
-    print("\n6️⃣ Verifying final state...")
-    try:
-        response = requests.get(f"{BASE_URL}/employees")
-        if response.status_code == 200:
-            final_employees = response.json()
-            print(f"✅ Final employee count: {len(final_employees)}")
-            
-        response = requests.get(f"{BASE_URL}/attendance")
-        if response.status_code == 200:
-            final_attendance = response.json()
-            print(f"✅ Final attendance count: {len(final_attendance)}")
-    except Exception as e:
-        print(f"❌ Error verifying final state: {e}")
-    
-    print("\n" + "=" * 50)
-    print("🎉 HRMS Lite Workflow Test Complete!")
-    print("✅ FastAPI backend is working correctly")
-    print("✅ MongoDB integration is functional")
-    print("✅ Employee CRUD operations work")
-    print("✅ Attendance tracking works")
-    print("✅ Confirmation modal backend is ready")
-    print("=" * 50)
-
-if __name__ == "__main__":
-    test_complete_hrms_workflow()
\ No newline at end of file
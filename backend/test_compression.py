@@ -0,0 +1,83 @@
+import asyncio
+import gzip
+import json
+import zlib
+from unittest import mock
+
+import pytest
+
+from compression import CompressionMiddleware, negotiate
+
+def seed(client, employees):
+    for i in range(employees):
+        client.post("/api/employees", json={
+            "employeeId": f"GZIP{i:04d}",
+            "fullName": f"Gzip Person {i}",
+            "email": f"gzip.person{i}@company.com",
+            "department": "Compression"
+        })
+
+def test_listings_are_compressed_above_threshold(client, state):
+    seed(client, 50)
+    plain = client.get("/api/employees", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in plain.headers
+
+    compressed = client.get("/api/employees", headers={"Accept-Encoding": "gzip"})
+    assert compressed.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in compressed.headers["vary"]
+    assert compressed.content == plain.content
+    wire = int(compressed.headers["content-length"])
+    assert wire * 5 < len(plain.content)
+
+    # Compressed bodies carry a weak ETag, which still revalidates (tags compared by write count alone)
+    with mock.patch.object(state.settings, "list_etag_max_stale_seconds", 0):
+        plain = client.get("/api/employees", headers={"Accept-Encoding": "identity"})
+        compressed = client.get("/api/employees", headers={"Accept-Encoding": "gzip"})
+        assert compressed.headers["etag"] == f"W/{plain.headers['etag']}"
+        revalidated = client.get("/api/employees", headers={"Accept-Encoding": "gzip", "If-None-Match": compressed.headers["etag"]})
+        assert revalidated.status_code == 304
+
+    small = client.get("/api/employees", params={"limit": 1}, headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in small.headers
+    print(f"✓ 50-employee listing: {len(plain.content)} bytes plain, {wire} gzipped; small responses sent as-is")
+
+def test_streamed_chunks_are_flushed():
+    chunks = [json.dumps({"row": i, "padding": "x" * 200}).encode() + b"\n" for i in range(5)]
+
+    async def streaming_app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200,
+                    "headers": [(b"content-type", b"application/x-ndjson")]})
+        for i, chunk in enumerate(chunks):
+            await send({"type": "http.response.body", "body": chunk, "more_body": i < len(chunks) - 1})
+
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    scope = {"type": "http", "method": "GET", "path": "/", "headers": [(b"accept-encoding", b"gzip")]}
+    middleware = CompressionMiddleware(streaming_app, encodings=["gzip"], minimum_size=10_000)
+    asyncio.run(middleware(scope, receive, send))
+
+    start, bodies = sent[0], sent[1:]
+    assert (b"content-encoding", b"gzip") in start["headers"]
+    # Each chunk decompresses on its own as it arrives
+    decompressor = zlib.decompressobj(31)
+    for chunk, message in zip(chunks, bodies):
+        assert decompressor.decompress(message["body"]) == chunk
+    assert gzip.decompress(b"".join(message["body"] for message in bodies)) == b"".join(chunks)
+    print("✓ Streaming responses are compressed chunk by chunk, whatever their size")
+
+def test_negotiation():
+    assert negotiate("gzip, deflate, br", ["zstd", "br", "gzip"]) == "br"
+    assert negotiate("br;q=0, gzip;q=0.5", ["br", "gzip"]) == "gzip"
+    assert negotiate("gzip;q=0", ["gzip"]) is None
+    assert negotiate("*", ["zstd", "gzip"]) == "zstd"
+    assert negotiate("", ["gzip"]) is None
+    print("✓ Accept-Encoding negotiation honours q-values and server preference")
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, "-s"]))
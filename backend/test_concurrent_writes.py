@@ -0,0 +1,98 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from functools import partial
+from unittest import mock
+
+import pytest
+from fastapi import HTTPException
+
+import application
+
+SUBMISSIONS = 20
+
+def atomic_insert(collection):
+    # mongomock checks unique indexes and inserts in separate steps; a real server does both atomically.
+    # SQLite needs no help and has no collections to patch
+    if collection is None:
+        return nullcontext()
+    lock = threading.Lock()
+    insert_one = collection.insert_one
+
+    def locked_insert_one(document, *args, **kwargs):
+        with lock:
+            return insert_one(document, *args, **kwargs)
+    return mock.patch.object(collection, "insert_one", locked_insert_one)
+
+def submit_concurrently(handler, payload):
+    barrier = threading.Barrier(SUBMISSIONS)
+
+    def submit(_):
+        barrier.wait()
+        try:
+            return handler(payload)
+        except HTTPException as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=SUBMISSIONS) as pool:
+        return list(pool.map(submit, range(SUBMISSIONS)))
+
+def test_concurrent_duplicate_employees(state):
+    create_employee = partial(application.create_employee, state=state)
+    payload = application.EmployeeCreate(
+        employeeId="RACE001",
+        fullName="Race Condition",
+        email="race.condition@company.com",
+        department="QA"
+    )
+    with atomic_insert(getattr(state.repository, "employees", None)):
+        outcomes = submit_concurrently(create_employee, payload)
+
+    created = [o for o in outcomes if not isinstance(o, HTTPException)]
+    rejected = [o for o in outcomes if isinstance(o, HTTPException)]
+    assert len(created) == 1
+    assert created[0]["employeeId"] == "RACE001" and created[0]["id"]
+    assert {(e.status_code, e.detail) for e in rejected} == {(400, "Employee ID already exists")}
+    assert [emp["employeeId"] for emp in state.repository.find_employees()] == ["RACE001"]
+    print(f"✓ {SUBMISSIONS} concurrent employee submissions: 1 created, {len(rejected)} rejected with 400")
+
+    duplicate_email = application.EmployeeCreate(
+        employeeId="RACE002",
+        fullName="Race Condition",
+        email="race.condition@company.com",
+        department="QA"
+    )
+    try:
+        create_employee(duplicate_email)
+        assert False, "duplicate email was accepted"
+    except HTTPException as e:
+        assert (e.status_code, e.detail) == (400, "Email already exists")
+
+def test_concurrent_duplicate_attendance(state):
+    create_attendance = partial(application.create_attendance, state=state)
+    application.create_employee(application.EmployeeCreate(
+        employeeId="RACE010",
+        fullName="Race Attendance",
+        email="race.attendance@company.com",
+        department="QA"
+    ), state)
+    payload = application.AttendanceCreate(employeeId="RACE010", date="2024-05-01", status="Present")
+    with atomic_insert(getattr(state.repository, "attendance", None)):
+        outcomes = submit_concurrently(create_attendance, payload)
+
+    created = [o for o in outcomes if not isinstance(o, HTTPException)]
+    rejected = [o for o in outcomes if isinstance(o, HTTPException)]
+    assert len(created) == 1
+    assert created[0]["employeeName"] == "Race Attendance"
+    assert {e.status_code for e in rejected} == {400}
+    assert len(list(state.repository.find_attendance({"employeeId": "RACE010"}))) == 1
+    print(f"✓ {SUBMISSIONS} concurrent attendance submissions: 1 created, {len(rejected)} rejected with 400")
+
+    try:
+        create_attendance(application.AttendanceCreate(employeeId="NOBODY", date="2024-05-01", status="Present"))
+        assert False, "attendance for an unknown employee was accepted"
+    except HTTPException as e:
+        assert e.status_code == 404
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, "-s"]))
@@ -0,0 +1,102 @@
+from unittest import mock
+
+import pytest
+
+import application
+
+def seed(client):
+    response = client.post("/api/employees", json={
+        "employeeId": "ETAG001",
+        "fullName": "Etag Person",
+        "email": "etag.person@company.com",
+        "department": "Support"
+    })
+    client.post("/api/attendance", json={"employeeId": "ETAG001", "date": "2024-08-01", "status": "Present"})
+    return response.json()
+
+# Tags that roll over with the clock could change mid-test; the tests below count writes only
+def versions_only(state):
+    return mock.patch.object(state.settings, "list_etag_max_stale_seconds", 0)
+
+def test_unchanged_poll_returns_304_without_querying(client, state):
+    seed(client)
+    with versions_only(state):
+        for path in ("/api/employees", "/api/attendance"):
+            first = client.get(path)
+            etag = first.headers["etag"]
+            assert first.status_code == 200
+            assert first.headers["cache-control"] == "no-cache"
+
+            with mock.patch.object(state.repository, "find_employees") as employees_find, \
+                 mock.patch.object(state.repository, "find_attendance") as attendance_find:
+                second = client.get(path, headers={"If-None-Match": etag})
+            assert second.status_code == 304
+            assert second.content == b""
+            assert second.headers["etag"] == etag
+            assert not employees_find.called and not attendance_find.called
+
+            assert client.get(path, headers={"If-None-Match": f"W/{etag}"}).status_code == 304
+            assert client.get(path, headers={"If-None-Match": '"stale"'}).status_code == 200
+    print("✓ Unchanged list polls are answered with 304 before touching the database")
+
+def test_writes_and_filters_change_the_etag(client, state):
+    employee = seed(client)
+    with versions_only(state):
+        employees_etag = client.get("/api/employees").headers["etag"]
+        attendance_etag = client.get("/api/attendance").headers["etag"]
+
+        assert client.get("/api/employees", params={"department": "Support"}).headers["etag"] != employees_etag
+        assert client.get("/api/attendance", params={"limit": 10}).headers["etag"] != attendance_etag
+
+        client.post("/api/attendance", json={"employeeId": "ETAG001", "date": "2024-08-02", "status": "Absent"})
+        assert client.get("/api/employees", headers={"If-None-Match": employees_etag}).status_code == 304
+        response = client.get("/api/attendance", headers={"If-None-Match": attendance_etag})
+        assert response.status_code == 200 and len(response.json()) == 2
+        attendance_etag = response.headers["etag"]
+
+        # Attendance listings embed employee names, so employee writes invalidate them too
+        client.delete(f"/api/employees/{employee['id']}")
+        assert client.get("/api/employees", headers={"If-None-Match": employees_etag}).status_code == 200
+        assert client.get("/api/attendance", headers={"If-None-Match": attendance_etag}).status_code == 200
+    print("✓ Writes and different query parameters produce new ETags")
+
+def test_other_workers_writes_are_not_hidden_for_long(client, state):
+    seed(client)
+    # Without a change stream, a write made by another worker is invisible here; tags expire instead
+    with mock.patch.object(application.time, "time", return_value=1000.0):
+        etag = client.get("/api/attendance").headers["etag"]
+        assert client.get("/api/attendance", headers={"If-None-Match": etag}).status_code == 304
+    with mock.patch.object(application.time, "time", return_value=1000.0 + state.settings.list_etag_max_stale_seconds):
+        assert client.get("/api/attendance", headers={"If-None-Match": etag}).status_code == 200
+
+    # With one, every worker's writes bump the versions, and tags only change on writes
+    with mock.patch.object(state.live_events, "change_stream", True):
+        with mock.patch.object(application.time, "time", return_value=1000.0):
+            etag = client.get("/api/attendance").headers["etag"]
+        with mock.patch.object(application.time, "time", return_value=2000.0):
+            assert client.get("/api/attendance", headers={"If-None-Match": etag}).status_code == 304
+    # SQLite has no change stream to feed them
+    if state.repository.supports_change_streams:
+        other_worker = {
+            "operationType": "insert", "ns": {"coll": "attendance"},
+            "fullDocument": {"_id": "elsewhere", "employeeId": "ETAG001", "employeeName": "Etag Person",
+                             "date": "2024-08-03", "status": "Present", "createdAt": application.datetime.utcnow()}
+        }
+        stream = mock.MagicMock()
+        stream.__enter__.return_value = [other_worker]
+        with versions_only(state), mock.patch.object(state.repository, "watch_changes", return_value=stream):
+            etag = client.get("/api/attendance").headers["etag"]
+            application.watch_live_events(state)
+            assert client.get("/api/attendance", headers={"If-None-Match": etag}).status_code == 200
+    print("✓ Another worker's writes reach list ETags through the change stream, or within the stale limit")
+
+def test_edge_cache_header(client, state):
+    seed(client)
+    with mock.patch.object(state.settings, "list_edge_cache_seconds", 5):
+        response = client.get("/api/employees")
+    assert response.headers["vercel-cdn-cache-control"] == "max-age=5"
+    assert "vercel-cdn-cache-control" not in client.get("/api/employees").headers
+    print("✓ LIST_EDGE_CACHE_SECONDS adds a Vercel edge cache header")
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, "-s"]))
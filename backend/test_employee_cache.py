@@ -0,0 +1,92 @@
+from unittest import mock
+
+import pytest
+from fastapi.testclient import TestClient
+
+import application
+
+def seed(client, employees):
+    created = []
+    for i in range(employees):
+        response = client.post("/api/employees", json={
+            "employeeId": f"CACHE{i:03d}",
+            "fullName": f"Cached Person {i}",
+            "email": f"cached.person{i}@company.com",
+            "department": "Finance"
+        })
+        created.append(response.json())
+    return created
+
+def test_attendance_writes_hit_the_cache(client, state):
+    seed(client, 1)
+    before = client.get("/api/cache/stats").json()["employees"]
+
+    with mock.patch.object(state.repository, "lookup_employees", wraps=state.repository.lookup_employees) as lookup:
+        for day in ("2024-07-01", "2024-07-02", "2024-07-03"):
+            response = client.post("/api/attendance", json={"employeeId": "CACHE000", "date": day, "status": "Present"})
+            assert response.json()["employeeName"] == "Cached Person 0"
+        client.get("/api/attendance")
+
+    stats = client.get("/api/cache/stats").json()["employees"]
+    assert lookup.call_count == 1
+    assert (stats["misses"] - before["misses"], stats["hits"] - before["hits"]) == (1, 3)
+    print(f"✓ Repeated attendance writes served from cache (hit rate {stats['hitRate']:.0%})")
+
+def test_delete_invalidates_entry(client, state):
+    created = seed(client, 1)
+    client.post("/api/attendance", json={"employeeId": "CACHE000", "date": "2024-07-01", "status": "Present"})
+    assert state.employee_cache.stats()["size"] == 1
+
+    client.delete(f"/api/employees/{created[0]['id']}")
+    assert state.employee_cache.stats()["size"] == 0
+    response = client.post("/api/attendance", json={"employeeId": "CACHE000", "date": "2024-07-02", "status": "Present"})
+    assert response.status_code == 404
+    print("✓ Deleting an employee invalidates the cached entry")
+
+def test_lru_eviction_and_ttl(client, state):
+    seed(client, 3)
+    cache = application.EmployeeCache(state.repository, max_size=2, ttl=60)
+    cache.get_many(["CACHE000", "CACHE001"])
+    cache.get("CACHE000")
+    cache.get("CACHE002")
+    assert list(cache.entries) == ["CACHE000", "CACHE002"]
+    assert cache.get("NOBODY") is None
+    assert "NOBODY" not in cache.entries
+
+    expired = application.EmployeeCache(state.repository, max_size=10, ttl=0)
+    expired.get("CACHE000")
+    expired.get("CACHE000")
+    assert (expired.hits, expired.misses) == (0, 2)
+    print("✓ Cache evicts least recently used entries and honours the TTL")
+
+def test_change_events_and_fallback(client, state):
+    created = seed(client, 2)
+    cache = application.EmployeeCache(state.repository, max_size=10, ttl=60)
+    cache.get_many(["CACHE000", "CACHE001"])
+
+    cache.apply_change({"operationType": "delete", "documentKey": {"_id": state.repository.parse_id(created[0]["id"])}})
+    assert list(cache.entries) == ["CACHE001"]
+    cache.apply_change({"operationType": "drop"})
+    assert not cache.entries
+
+    # The in-memory stand-in turns change streams down like a standalone server; the watcher must give up quietly
+    if state.repository.supports_change_streams:
+        state.employee_cache.get("CACHE001")
+        application.watch_employee_changes(state)
+        stats = state.employee_cache.stats()
+        assert stats["changeStream"] is False and stats["size"] == 0
+    print("✓ Change events invalidate entries; missing change stream support falls back to the TTL")
+
+@pytest.mark.parametrize("app_settings", [
+    {"storage_backend": "sqlite", "employee_cache_change_stream": True, "events_change_stream": True}
+])
+def test_no_watchers_without_change_streams(app):
+    assert app.state.hrms.repository.supports_change_streams is False
+    watchers = mock.patch.multiple(application, watch_employee_changes=mock.DEFAULT, watch_live_events=mock.DEFAULT)
+    with watchers as watch, TestClient(app) as client:
+        assert client.get("/api/cache/stats").json()["employees"]["changeStream"] is False
+    assert not watch["watch_employee_changes"].called and not watch["watch_live_events"].called
+    print("✓ SQLite starts no change stream watchers, whatever the settings ask for")
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, "-s"]))
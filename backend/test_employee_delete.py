@@ -0,0 +1,110 @@
+from datetime import date, datetime, timedelta
+from unittest import mock
+
+import pytest
+from fastapi import BackgroundTasks
+
+import application
+import reconcile_orphans
+import rollups
+
+def seed(client):
+    created = {}
+    for employee_id in ("DEL001", "DEL002"):
+        response = client.post("/api/employees", json={
+            "employeeId": employee_id,
+            "fullName": f"Delete {employee_id}",
+            "email": f"{employee_id.lower()}@company.com",
+            "department": "Operations"
+        })
+        created[employee_id] = response.json()["id"]
+    return created
+
+def mark_days(client, state, employee_id, days):
+    for start in range(0, days, application.MAX_BULK_ATTENDANCE):
+        client.post("/api/attendance/bulk", json=[
+            {"employeeId": employee_id, "date": str(date(2000, 1, 1) + timedelta(days=day)), "status": "Present"}
+            for day in range(start, min(days, start + application.MAX_BULK_ATTENDANCE))
+        ])
+    return attendance_rows(state, employee_id)
+
+def attendance_rows(state, employee_id):
+    return len(list(state.repository.find_attendance({"employeeId": employee_id})))
+
+def test_delete_returns_before_cleanup(client, state):
+    created = seed(client)
+    rows = mark_days(client, state, "DEL001", 250)
+
+    tasks = BackgroundTasks()
+    application.delete_employee(created["DEL001"], tasks, state)
+    assert attendance_rows(state, "DEL001") == rows
+    assert [task.func for task in tasks.tasks] == [application.purge_attendance]
+    print(f"✓ Delete responds with {rows} attendance rows still queued for cleanup")
+
+def test_delete_cascades_in_batches(client, state):
+    created = seed(client)
+    rows = mark_days(client, state, "DEL001", 250)
+    client.post("/api/attendance", json={"employeeId": "DEL002", "date": "2024-01-01", "status": "Present"})
+
+    batches = []
+    purge_batch = state.repository.purge_attendance_batch
+
+    def record_batch(*args):
+        batch = purge_batch(*args)
+        batches.append(len(batch))
+        return batch
+
+    with mock.patch.object(state.settings, "purge_batch_size", 100), \
+         mock.patch.object(state.repository, "purge_attendance_batch", record_batch):
+        assert client.delete(f"/api/employees/{created['DEL001']}").status_code == 200
+    assert batches == [100, 100, 50, 0]
+    assert (attendance_rows(state, "DEL001"), attendance_rows(state, "DEL002")) == (0, 1)
+    monthly, _ = state.repository.rollup_counts()
+    assert not [key for key in monthly if key[0] == "DEL001"]
+    assert rollups.check_rollups(state.repository) == []
+    print(f"✓ {rows} attendance rows removed in {len(batches) - 1} batches; rollups stay consistent")
+
+def test_recreated_employee_keeps_new_rows(client, state):
+    created = seed(client)
+    mark_days(client, state, "DEL001", 10)
+    deleted_at = datetime.utcnow()
+    state.repository.delete_employee(state.repository.parse_id(created["DEL001"]))
+    client.post("/api/employees", json={
+        "employeeId": "DEL001",
+        "fullName": "Delete Again",
+        "email": "del001.again@company.com",
+        "department": "Operations"
+    })
+    client.post("/api/attendance", json={"employeeId": "DEL001", "date": "2030-01-01", "status": "Present"})
+
+    assert application.purge_attendance(state, "DEL001", "Operations", deleted_at) == 10
+    assert [row["date"] for row in state.repository.find_attendance({"employeeId": "DEL001"})] == ["2030-01-01"]
+    print("✓ Cleanup leaves rows marked after the delete alone")
+
+def test_reconcile_orphans_in_bounded_batches(client, state):
+    created = seed(client)
+    mark_days(client, state, "DEL001", 25)
+    mark_days(client, state, "DEL002", 5)
+    # Orphans from before deletes cascaded
+    for employee_id in created.values():
+        state.repository.delete_employee(state.repository.parse_id(employee_id))
+    client.post("/api/employees", json={
+        "employeeId": "DEL003",
+        "fullName": "Delete Keep",
+        "email": "del003@company.com",
+        "department": "Operations"
+    })
+    client.post("/api/attendance", json={"employeeId": "DEL003", "date": "2024-01-01", "status": "Present"})
+
+    with mock.patch.object(state.settings, "purge_batch_size", 10):
+        first = reconcile_orphans.reconcile_orphans(state, max_batches=2)
+        assert first == {"employees": 1, "removed": 20, "remaining": 2}
+        second = reconcile_orphans.reconcile_orphans(state, max_batches=10)
+    assert second == {"employees": 2, "removed": 10, "remaining": 0}
+    assert state.repository.attendance_employee_ids() == ["DEL003"]
+    monthly, _ = state.repository.rollup_counts()
+    assert {employee_id for employee_id, _ in monthly} == {"DEL003"}
+    print("✓ Orphan reconciliation sweeps a bounded number of batches per run")
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, "-s"]))
@@ -0,0 +1,122 @@
+import asyncio
+import json
+import os
+import resource
+import sys
+from unittest import mock
+
+import httpx
+import pytest
+
+import application
+
+IMPORT_ROWS = int(os.getenv("IMPORT_ROWS", 100_000))
+MAX_RSS_GROWTH_MB = 64
+
+def peak_rss_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+def seed(client):
+    client.post("/api/employees", json={
+        "employeeId": "IMP000",
+        "fullName": "Existing Person",
+        "email": "existing@company.com",
+        "department": "Sales"
+    })
+
+def test_import_csv_reports_row_errors(client):
+    seed(client)
+    upload = "\n".join([
+        "employeeId,fullName,email,department",
+        "IMP001,Ann Lee,ann.lee@company.com,Sales",
+        "IMP000,Dup Id,dup.id@company.com,Sales",
+        "IMP002,Dup Email,existing@company.com,Sales",
+        "IMP003,Bad Email,not-an-email,Sales",
+        "IMP004,Too,Many,Columns,Here",
+        "IMP001,Repeat In File,repeat@company.com,Sales",
+        "\"IMP005\",\"Quoted, Name\",quoted@company.com,Sales",
+        # A quoted field may hold line breaks, blank lines included; the record is numbered by its first line
+        "IMP006,\"Two",
+        "",
+        "Lines\",two.lines@company.com,\"Sales\"",
+        "IMP007,Bad Email,also-not-an-email,Sales",
+    ])
+    response = client.post("/api/employees/import", params={"format": "csv"}, content=upload)
+    assert response.status_code == 200
+    data = response.json()
+    assert (data["created"], data["failed"]) == (3, 6)
+    # In line order, although duplicates are only found when their chunk is inserted
+    assert [(error["line"], error["detail"].split(":")[0]) for error in data["errors"]] == [
+        (3, "Employee ID already exists"),
+        (4, "Email already exists"),
+        (5, "email"),
+        (6, "Wrong number of columns"),
+        (7, "Employee ID already exists"),
+        (12, "email"),
+    ]
+
+    names = {emp["employeeId"]: emp["fullName"] for emp in client.get("/api/employees").json()}
+    assert names == {
+        "IMP000": "Existing Person", "IMP001": "Ann Lee", "IMP005": "Quoted, Name", "IMP006": "Two\n\nLines"
+    }
+
+    unclosed = "employeeId,fullName,email,department\nIMP008,\"Never Closed,x@company.com,Sales\nIMP009,Lost,lost@company.com,Sales"
+    data = client.post("/api/employees/import", params={"format": "csv"}, content=unclosed).json()
+    assert (data["created"], data["errors"]) == (0, [{"line": 2, "employeeId": None, "detail": "Unclosed quoted field"}])
+    print("✓ CSV import maps validation and unique-index errors to records, which may span lines")
+
+def test_import_ndjson(client):
+    seed(client)
+    lines = [
+        json.dumps({"employeeId": "IMP010", "fullName": "Jo Park", "email": "jo.park@company.com", "department": "HR"}),
+        "{not json",
+        json.dumps(["IMP011"]),
+        json.dumps({"employeeId": "IMP012", "fullName": "", "email": "x@company.com", "department": "HR"}),
+    ]
+    response = client.post("/api/employees/import", content="\n".join(lines) + "\n")
+    data = response.json()
+    assert (data["created"], data["failed"]) == (1, 3)
+    assert [error["detail"] for error in data["errors"]][:2] == ["Invalid JSON", "Expected a JSON object"]
+    assert data["errors"][2]["employeeId"] == "IMP012"
+    print("✓ NDJSON import validates each line")
+
+def test_import_memory_is_bounded(app, client, state):
+    seed(client)
+    inserted = {"rows": 0, "largest_chunk": 0}
+
+    def count_insert_employees(documents):
+        for document in documents:
+            document["_id"] = document["employeeId"]
+        inserted["rows"] += len(documents)
+        inserted["largest_chunk"] = max(inserted["largest_chunk"], len(documents))
+        return len(documents), []
+
+    async def upload():
+        for i in range(IMPORT_ROWS):
+            yield (json.dumps({
+                "employeeId": f"GEN{i:07d}",
+                "fullName": f"Generated Person {i}",
+                "email": f"generated{i}@company.com",
+                "department": f"Dept {i % 20}"
+            }) + "\n").encode()
+
+    # Unlike TestClient, httpx's ASGI transport hands the body to the app chunk by chunk
+    async def post_upload():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as http:
+            return await http.post("/api/employees/import", content=upload())
+
+    rss_before = peak_rss_mb()
+    with mock.patch.object(state.repository, "insert_employees", count_insert_employees):
+        response = asyncio.run(post_upload())
+    growth = peak_rss_mb() - rss_before
+
+    assert response.json()["created"] == IMPORT_ROWS
+    assert inserted == {"rows": IMPORT_ROWS, "largest_chunk": application.IMPORT_CHUNK_SIZE}
+    print(f"✓ Imported {IMPORT_ROWS} rows, peak RSS growth {growth:.1f} MB")
+    assert growth < MAX_RSS_GROWTH_MB
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, "-s"]))
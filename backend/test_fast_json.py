@@ -0,0 +1,39 @@
+from unittest import mock
+
+import pytest
+
+def seed(client):
+    for i in range(3):
+        client.post("/api/employees", json={
+            "employeeId": f"FAST{i:03d}",
+            "fullName": f"Fast Person {i}",
+            "email": f"fast.person{i}@company.com",
+            "department": "Platform"
+        })
+        client.post("/api/attendance", json={"employeeId": f"FAST{i:03d}", "date": "2024-05-06", "status": "Present"})
+
+def test_fast_path_matches_validated_responses(client, state):
+    seed(client)
+    # Tags are compared across requests, so they must not roll over with the clock in between
+    with mock.patch.object(state.settings, "list_etag_max_stale_seconds", 0):
+        for path, params in (
+            ("/api/employees", {}),
+            ("/api/employees", {"limit": 2}),
+            ("/api/attendance", {"date_from": "2024-05-01"}),
+            ("/api/attendance", {"limit": 2}),
+        ):
+            validated = client.get(path, params=params)
+            with mock.patch.object(state.settings, "fast_json_responses", True), \
+                 mock.patch("fastapi.routing.serialize_response", side_effect=AssertionError("validated")):
+                fast = client.get(path, params=params)
+            assert fast.status_code == 200
+            assert fast.content == validated.content, path
+            for header in ("content-type", "etag", "cache-control", "x-next-cursor"):
+                assert fast.headers.get(header) == validated.headers.get(header), header
+
+            with mock.patch.object(state.settings, "fast_json_responses", True):
+                assert client.get(path, params=params, headers={"If-None-Match": fast.headers["etag"]}).status_code == 304
+    print("✓ FAST_JSON_RESPONSES returns byte-identical listings and headers without re-validation")
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, "-s"]))
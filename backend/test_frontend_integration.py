@@ -1,91 +0,0 @@
-import requests
-import json
-from datetime import datetime
-
-BASE_URL = "http://localhost:5000/api"
-
-def test_frontend_integration():
-    print("🚀 Testing Frontend Integration with FastAPI Backend...")
-    print("=" * 60)
-    
-    # Step 1: Test employees endpoint
-    print("\n1️⃣ Testing GET /api/employees")
-    try:
-        response = requests.get(f"{BASE_URL}/employees")
-        print(f"Status: {response.status_code}")
-        if response.status_code == 200:
-            data = response.json()
-            print(f"✅ Found {len(data)} employees")
-            for emp in data:
-                print(f"   • {emp['fullName']} - {emp['department']} ({emp['employeeId']})")
-        else:
-            print(f"❌ Failed: {response.text}")
-    except Exception as e:
-        print(f"❌ Error: {e}")
-    
-    # Step 2: Test attendance endpoint
-    print("\n2️⃣ Testing GET /api/attendance")
-    try:
-        response = requests.get(f"{BASE_URL}/attendance")
-        print(f"Status: {response.status_code}")
-        if response.status_code == 200:
-            data = response.json()
-            print(f"✅ Found {len(data)} attendance records")
-            for record in data:
-                print(f"   • {record['employeeId']['fullName']}: {record['status']} on {record['date']}")
-        else:
-            print(f"❌ Failed: {response.text}")
-    except Exception as e:
-        print(f"❌ Error: {e}")
-    
-    # Step 3: Create a new employee
-    print("\n3️⃣ Testing POST /api/employees")
-    new_employee = {
-        "employeeId": f"TEST{datetime.now().strftime('%H%M%S')}",
-        "fullName": "Integration Test User",
-        "email": f"test{datetime.now().strftime('%H%M%S')}@company.com",
-        "department": "QA"
-    }
-    
-    try:
-        response = requests.post(f"{BASE_URL}/employees", json=new_employee)
-        print(f"Status: {response.status_code}")
-        if response.status_code == 200:
-            created = response.json()
-            print(f"✅ Created: {created['fullName']} ({created['employeeId']})")
-            employee_id = created['employeeId']
-        else:
-            print(f"❌ Failed: {response.text}")
-            employee_id = None
-    except Exception as e:
-        print(f"❌ Error: {e}")
-        employee_id = None
-    
-    # Step 4: Mark attendance for the new employee
-    if employee_id:
-        print("\n4️⃣ Testing POST /api/attendance")
-        attendance_data = {
-            "employeeId": employee_id,
-            "date": datetime.now().strftime("%Y-%m-%d"),
-            "status": "Present"
-        }
-        
-        try:
-            response = requests.post(f"{BASE_URL}/attendance", json=attendance_data)
-            print(f"Status: {response.status_code}")
-            if response.status_code == 200:
-                print(f"✅ Marked attendance: {employee_id} - Present")
-            else:
-                print(f"❌ Failed: {response.text}")
-        except Exception as e:
-            print(f"❌ Error: {e}")
-    
-    print("\n" + "=" * 60)
-    print("🎉 Frontend Integration Test Complete!")
-    print("✅ FastAPI backend is responding correctly")
-    print("✅ API endpoints are accessible at /api prefix")
-    print("✅ Frontend should now work without 404 errors")
-    print("=" * 60)
-
-if __name__ == "__main__":
-    test_frontend_integration()
\ No newline at end of file
@@ -0,0 +1,58 @@
+from datetime import date
+
+import pytest
+
+import application
+import generate_data
+import rollups
+
+# generate_data.py works through the state the command-line tools share; point that at this test's app
+@pytest.fixture(autouse=True)
+def default_state(state, monkeypatch):
+    monkeypatch.setattr(application, "default_state", state)
+    monkeypatch.setattr(application, "settings", state.settings)
+    monkeypatch.setattr(application, "repository", state.repository)
+
+def generated_rows() -> list:
+    return sorted((a["employeeId"], a["date"], a["status"]) for a in application.repository.find_attendance({}))
+
+# In-process (workers=1): an in-memory stand-in is not shared with worker processes
+def test_generation_is_deterministic():
+    application.repository.clear()
+    counts = generate_data.generate(20, rows=600, seed=7, block_size=20)
+    first = generated_rows()
+    assert counts == {"employees": 20, "attendance": len(first)}
+    assert 300 < len(first) < 900
+
+    # The same seed gives the same data however the employees are split into blocks
+    application.repository.clear()
+    generate_data.generate(20, rows=600, seed=7, block_size=7)
+    assert generated_rows() == first
+
+    # A second run over the same data adds nothing
+    assert generate_data.generate(20, rows=600, seed=7, block_size=7) == {"employees": 0, "attendance": 0}
+
+    application.repository.clear()
+    generate_data.generate(20, rows=600, seed=8, block_size=20)
+    assert generated_rows() != first
+    print("✓ The same seed generates the same employees and attendance")
+
+def test_generated_attendance_looks_real():
+    application.repository.clear()
+    generate_data.generate(6, years=1, end=date(2024, 12, 31), seed=1, block_size=4)
+    rows = generated_rows()
+    # Every employee on every working day of the year
+    assert len(rows) == 6 * len(generate_data.working_days(date(2024, 1, 1), date(2024, 12, 31)))
+    assert all(date.fromisoformat(day).weekday() < 5 for _, day, _ in rows)
+    absent = sum(status == "Absent" for _, _, status in rows) / len(rows)
+    # Vacations alone are about 4% of working days
+    assert 0.04 < absent < 0.2
+    departments = {department for _, department in application.repository.employee_departments()}
+    assert len(departments) > 1
+
+    assert rollups.rebuild_rollups(application.repository, workers=1)["employees"] == 6
+    assert rollups.check_rollups(application.repository, workers=1) == []
+    print(f"✓ Generated attendance is weekday-only with {absent:.1%} absences, and rollups match it")
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, "-s"]))
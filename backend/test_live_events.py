@@ -0,0 +1,135 @@
+import asyncio
+import json
+from datetime import datetime
+from unittest import mock
+
+import httpx
+import pytest
+
+import application
+from events import EventBroker, RESET
+
+# TestClient waits for a response to finish, so the feed is read straight off the ASGI interface
+async def open_feed(app, headers: list):
+    start, frames, closed = asyncio.Future(), asyncio.Queue(), asyncio.Event()
+    scope = {
+        "type": "http", "http_version": "1.1", "method": "GET", "scheme": "http", "path": "/api/events",
+        "raw_path": b"/api/events", "root_path": "", "query_string": b"", "headers": headers,
+        "server": ("test", 80), "client": ("test", 1)
+    }
+
+    async def receive():
+        await closed.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            start.set_result(message)
+        elif message.get("body"):
+            await frames.put(message["body"])
+
+    task = asyncio.create_task(app(scope, receive, send))
+    return await start, frames, closed, task
+
+async def next_event(frames) -> tuple:
+    while True:
+        frame = (await asyncio.wait_for(frames.get(), 5)).decode()
+        fields = dict(line.split(": ", 1) for line in frame.strip().split("\n") if not line.startswith(":"))
+        if "event" in fields:
+            return fields["event"], json.loads(fields["data"])
+
+def test_writes_are_pushed_to_listeners(app, state):
+    async def scenario():
+        start, frames, closed, task = await open_feed(app, [(b"accept-encoding", b"gzip")])
+        headers = dict(start["headers"])
+        assert headers[b"content-type"].startswith(b"text/event-stream")
+        assert b"content-encoding" not in headers
+        assert (await frames.get()).startswith(b"retry:")
+
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as http:
+            employee = (await http.post("/api/employees", json={
+                "employeeId": "LIVE001",
+                "fullName": "Live Person",
+                "email": "live.person@company.com",
+                "department": "Operations"
+            })).json()
+            assert await next_event(frames) == ("employee.created", [employee])
+
+            marked = (await http.post("/api/attendance", json={"employeeId": "LIVE001", "date": "2024-09-02", "status": "Present"})).json()
+            assert await next_event(frames) == ("attendance.created", [marked])
+
+            bulk = (await http.post("/api/attendance/bulk", json=[
+                {"employeeId": "LIVE001", "date": "2024-09-02", "status": "Present"},
+                {"employeeId": "LIVE001", "date": "2024-09-03", "status": "Absent"},
+                {"employeeId": "NOBODY", "date": "2024-09-03", "status": "Absent"},
+            ])).json()
+            kind, rows = await next_event(frames)
+            assert kind == "attendance.created" and [row["id"] for row in rows] == [bulk["results"][1]["id"]]
+
+            await http.delete(f"/api/employees/{employee['id']}")
+            assert await next_event(frames) == ("employee.deleted", [{"id": employee["id"], "employeeId": "LIVE001"}])
+
+        assert state.live_events.stats()["subscribers"] == 1
+        closed.set()
+        await asyncio.wait_for(task, 5)
+        assert state.live_events.stats()["subscribers"] == 0
+
+    asyncio.run(scenario())
+    print("✓ Employee and attendance writes reach connected clients as events")
+
+def test_resume_and_slow_clients():
+    broker = EventBroker(queue_size=2, history_size=3)
+    for i in range(5):
+        broker.publish("employee.created", [{"id": str(i)}])
+    # A reconnect replays what the client missed, or tells it to re-fetch when that is gone
+    assert [frame.split(b"\n")[0] for frame in broker.backlog(f"{broker.instance}-3")] == [
+        f"id: {broker.instance}-4".encode(), f"id: {broker.instance}-5".encode()
+    ]
+    assert broker.backlog(f"{broker.instance}-5") == []
+    assert broker.backlog(f"{broker.instance}-1") == [RESET]
+    # Ids another worker, or this one before a restart, handed out are no position in this history
+    for last_event_id in ("3", "5", f"{EventBroker().instance}-3", f"{broker.instance}-6", f"{broker.instance}-x"):
+        assert broker.backlog(last_event_id) == [RESET], last_event_id
+
+    async def slow_client():
+        stream = broker.stream(f"{broker.instance}-5")
+        assert await stream.__anext__() == b"retry: 3000\n\n"
+        for i in range(3):
+            broker.publish("employee.created", [{"id": f"late {i}"}])
+        await asyncio.sleep(0)
+        received = [frame async for frame in stream]
+        assert len(received) == 3 and received[-1] == RESET
+        assert broker.stats()["subscribers"] == 0
+
+    asyncio.run(slow_client())
+    print("✓ Reconnects resume from Last-Event-ID; clients that fall behind are reset")
+
+def test_change_stream_events(client, state):
+    created_at = datetime(2024, 9, 2, 9, 0)
+    insert = {"operationType": "insert", "ns": {"db": "hrms_lite", "coll": "attendance"}, "fullDocument": {
+        "_id": "a1", "employeeId": "LIVE001", "employeeName": "Live Person", "date": "2024-09-02",
+        "status": "Present", "createdAt": created_at
+    }}
+    assert application.change_event(insert) == ("attendance.created", {
+        "id": "a1", "employeeId": "LIVE001", "employeeName": "Live Person", "date": "2024-09-02",
+        "status": "Present", "createdAt": created_at
+    })
+    delete = {"operationType": "delete", "ns": {"db": "hrms_lite", "coll": "attendance"}, "documentKey": {"_id": "a1"}}
+    assert application.change_event(delete) == ("attendance.deleted", {"id": "a1"})
+
+    # An employee delete reaches the feed as the tombstone it leaves, with the same row the handler publishes
+    created = client.post("/api/employees", json={
+        "employeeId": "LIVE002", "fullName": "Gone Person", "email": "gone.person@company.com", "department": "Legal"
+    }).json()
+    with mock.patch.object(state.live_events, "publish") as publish:
+        client.delete(f"/api/employees/{created['id']}")
+    published = publish.call_args.args
+    tombstone = next(t for t in state.repository.find_tombstones(0, 100) if t["collection"] == "employees")
+    insert = {"operationType": "insert", "ns": {"db": "hrms_lite", "coll": "tombstones"}, "fullDocument": tombstone}
+    assert application.change_event(insert) == (published[0], published[1][0]) == (
+        "employee.deleted", {"id": created["id"], "employeeId": "LIVE002"}
+    )
+    print("✓ Change stream inserts and deletes map onto the same events")
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, "-s"]))
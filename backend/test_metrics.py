@@ -0,0 +1,77 @@
+from types import SimpleNamespace
+
+import pytest
+
+from metrics import Metrics
+
+def samples(text: str) -> dict:
+    values = {}
+    for line in text.splitlines():
+        if line and not line.startswith("#"):
+            name, _, value = line.rpartition(" ")
+            values[name] = float(value)
+    return values
+
+@pytest.mark.parametrize("app_settings", [{"metrics_enabled": True}])
+def test_requests_are_counted_per_route(client):
+    client.post("/api/employees", json={
+        "employeeId": "METRIC001",
+        "fullName": "Metric Person",
+        "email": "metric.person@company.com",
+        "department": "Observability"
+    })
+    employee_id = client.get("/api/employees").json()[0]["id"]
+    client.delete(f"/api/employees/{employee_id}")
+    client.delete(f"/api/employees/{employee_id}")
+    client.get("/api/nowhere")
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    values = samples(response.text)
+    assert values['http_requests_total{method="POST",route="/api/employees",status="200"}'] == 1
+    # Labelled by route template, so ids do not create new series
+    assert values['http_requests_total{method="DELETE",route="/api/employees/{employee_id}",status="200"}'] == 1
+    assert values['http_requests_total{method="DELETE",route="/api/employees/{employee_id}",status="404"}'] == 1
+    assert values['http_requests_total{method="GET",route="other",status="404"}'] == 1
+    assert values['http_request_duration_seconds_count{method="DELETE",route="/api/employees/{employee_id}"}'] == 2
+    assert values['http_request_duration_seconds_bucket{method="GET",route="/api/employees",le="+Inf"}'] == 1
+    # Only the scrape itself is in flight
+    assert values["http_requests_in_flight"] == 1
+    print("✓ /metrics counts requests and latencies per route template")
+
+def test_database_listeners():
+    metrics = Metrics()
+    commands, pool = metrics.event_listeners()
+    for request_id, (name, command, micros) in enumerate((
+        ("find", {"find": "attendance", "filter": {}}, 1200),
+        ("find", {"find": "attendance", "filter": {}}, 30000),
+        ("getMore", {"getMore": 12345, "collection": "attendance"}, 400),
+        ("insert", {"insert": "employees", "documents": []}, 800),
+    )):
+        commands.started(SimpleNamespace(command_name=name, command=command, connection_id=("db", 27017), request_id=request_id))
+        outcome = commands.failed if name == "insert" else commands.succeeded
+        outcome(SimpleNamespace(command_name=name, duration_micros=micros, connection_id=("db", 27017), request_id=request_id))
+    pool.connection_check_out_started(SimpleNamespace(address=("db", 27017)))
+    pool.connection_checked_out(SimpleNamespace(address=("db", 27017), connection_id=1))
+    pool.connection_check_out_started(SimpleNamespace(address=("db", 27017)))
+    pool.connection_check_out_failed(SimpleNamespace(address=("db", 27017), reason="timeout"))
+
+    values = samples(metrics.render())
+    assert values['mongodb_command_duration_seconds_count{command="find",collection="attendance"}'] == 2
+    assert values['mongodb_command_duration_seconds_bucket{command="find",collection="attendance",le="0.0025"}'] == 1
+    assert abs(values['mongodb_command_duration_seconds_sum{command="find",collection="attendance"}'] - 0.0312) < 1e-9
+    assert values['mongodb_command_duration_seconds_count{command="getMore",collection="attendance"}'] == 1
+    assert values['mongodb_command_failures_total{command="insert",collection="employees"}'] == 1
+    assert values["mongodb_pool_checkout_wait_seconds_count"] == 1
+    assert values['mongodb_pool_checkout_failures_total{reason="timeout"}'] == 1
+    assert not commands.collections
+    print("✓ MongoDB command and pool checkout events become histograms")
+
+@pytest.mark.parametrize("app_settings", [{"metrics_enabled": False}])
+def test_disabled_by_default(client):
+    assert client.get("/metrics").status_code == 404
+    print("✓ /metrics is off unless METRICS_ENABLED is set")
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, "-s"]))
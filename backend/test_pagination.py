@@ -0,0 +1,94 @@
+import random
+
+import pytest
+
+from application import encode_cursor
+
+DAYS = ["2024-09-02", "2024-09-03", "2024-09-04", "2024-09-05", "2024-09-06"]
+
+def seed(client):
+    for i in range(7):
+        client.post("/api/employees", json={
+            "employeeId": f"PAGE{i:03d}",
+            "fullName": f"Paged Person {i}",
+            "email": f"paged.person{i}@company.com",
+            "department": "Support" if i % 3 else "Legal"
+        })
+    records = [
+        {"employeeId": f"PAGE{i:03d}", "date": day, "status": "Absent" if (i + d) % 4 == 0 else "Present"}
+        for i in range(7) for d, day in enumerate(DAYS)
+    ]
+    # Stored out of key order, so pages cannot simply follow insertion order
+    random.Random(2).shuffle(records)
+    assert client.post("/api/attendance/bulk", json=records).json()["created"] == 35
+
+def pages(client, path, params, limit) -> list:
+    result, cursor = [], None
+    while True:
+        response = client.get(path, params={**params, "limit": limit, **({"cursor": cursor} if cursor else {})})
+        assert response.status_code == 200
+        page = response.json()
+        assert 0 < len(page) <= limit
+        result.append(page)
+        cursor = response.headers.get("x-next-cursor")
+        if not cursor:
+            return result
+
+def by_key(rows: list) -> list:
+    return sorted(rows, key=lambda row: (row["employeeId"], row["date"]))
+
+def test_employee_pages_add_up_to_the_listing(client):
+    seed(client)
+    for params in ({}, {"department": "Support"}, {"department": "Legal"}):
+        unpaged = client.get("/api/employees", params=params).json()
+        assert unpaged and all(e["department"] == params.get("department", e["department"]) for e in unpaged)
+        for limit in (1, 2, 7, 100):
+            paged = pages(client, "/api/employees", params, limit)
+            assert [e for page in paged for e in page] == unpaged, (params, limit)
+            # The last page is not followed by an empty one
+            assert len(paged) == max(1, -(-len(unpaged) // limit))
+    assert client.get("/api/employees", params={"department": "Nowhere", "limit": 3}).json() == []
+    print("✓ Employee pages concatenate to the unpaged listing, with and without a department")
+
+def test_attendance_pages_add_up_to_the_listing(client):
+    seed(client)
+    everything = client.get("/api/attendance").json()
+    departments = {e["employeeId"]: e["department"] for e in client.get("/api/employees").json()}
+    filters = [
+        ({}, lambda row: True),
+        ({"employeeId": "PAGE003"}, lambda row: row["employeeId"] == "PAGE003"),
+        ({"department": "Legal"}, lambda row: departments[row["employeeId"]] == "Legal"),
+        ({"status": "Absent"}, lambda row: row["status"] == "Absent"),
+        ({"date_from": "2024-09-03", "date_to": "2024-09-05"}, lambda row: "2024-09-03" <= row["date"] <= "2024-09-05"),
+        ({"date_from": "2024-09-05"}, lambda row: row["date"] >= "2024-09-05"),
+        ({"date_to": "2024-09-02"}, lambda row: row["date"] <= "2024-09-02"),
+        ({"department": "Support", "status": "Present", "date_from": "2024-09-04"},
+         lambda row: departments[row["employeeId"]] == "Support" and row["status"] == "Present" and row["date"] >= "2024-09-04"),
+    ]
+    for params, matches in filters:
+        unpaged = client.get("/api/attendance", params=params).json()
+        expected = by_key(row for row in everything if matches(row))
+        assert expected and by_key(unpaged) == expected, params
+        for limit in (1, 4, 5, 1000):
+            paged = pages(client, "/api/attendance", params, limit)
+            # Pages follow (employeeId, date) and hold each matching row exactly once
+            assert [row for page in paged for row in page] == expected, (params, limit)
+    print(f"✓ Attendance pages concatenate to the unpaged listing under {len(filters)} filter combinations")
+
+def test_invalid_cursors_are_rejected(client):
+    seed(client)
+    for path, cursor in (
+        ("/api/employees", "not a cursor"),
+        ("/api/employees", encode_cursor([""])),
+        ("/api/employees", encode_cursor(["a", "b"])),
+        ("/api/attendance", "not a cursor"),
+        ("/api/attendance", encode_cursor(["PAGE001"])),
+        ("/api/attendance", encode_cursor({"employeeId": "PAGE001"})),
+    ):
+        response = client.get(path, params={"cursor": cursor, "limit": 2})
+        assert response.status_code == 400, (path, cursor)
+        assert response.json()["detail"] == "Invalid cursor"
+    print("✓ Malformed cursors get a 400 on both listings")
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, "-s"]))
@@ -0,0 +1,73 @@
+import os
+import pstats
+import tempfile
+from unittest import mock
+
+import pytest
+
+from profiling import ProfilingMiddleware
+
+PROFILE_DIR = tempfile.mkdtemp()
+PROFILE_TOKEN = "profile-secret"
+
+@pytest.fixture
+def app_settings():
+    return {"profiling_enabled": True, "profile_dir": PROFILE_DIR, "profile_token": PROFILE_TOKEN}
+
+def seed(client):
+    for i in range(3):
+        client.post("/api/employees", json={
+            "employeeId": f"PROF{i:03d}",
+            "fullName": f"Profiled Person {i}",
+            "email": f"profiled.person{i}@company.com",
+            "department": "Performance"
+        })
+        client.post("/api/attendance", json={"employeeId": f"PROF{i:03d}", "date": "2024-08-01", "status": "Present"})
+
+def server_timing(header: str) -> dict:
+    timings = {}
+    for entry in header.split(","):
+        name, *params = entry.strip().split(";")
+        timings[name] = dict(param.split("=", 1) for param in params)
+    return timings
+
+def test_profiled_request_gets_timings_and_trace(client, state):
+    seed(client)
+    plain = client.get("/api/attendance")
+    assert "server-timing" not in plain.headers and "x-profile" not in plain.headers
+
+    # Without the shared secret the header is ignored
+    assert "server-timing" not in client.get("/api/attendance", headers={"X-Profile": "1"}).headers
+
+    state.employee_cache.clear()
+    profiled = client.get("/api/attendance", headers={"X-Profile": PROFILE_TOKEN})
+    assert profiled.json() == plain.json()
+    timings = server_timing(profiled.headers["server-timing"])
+    assert set(timings) == {"db", "handler", "serialize", "total"}
+    # The attendance read and the employee-name lookup
+    assert timings["db"]["desc"] == '"2 calls"'
+    parts = sum(float(timings[name]["dur"]) for name in ("db", "handler", "serialize"))
+    assert 0 < parts <= float(timings["total"]["dur"]) + 0.05
+
+    stats = pstats.Stats(os.path.join(PROFILE_DIR, profiled.headers["x-profile"]))
+    functions = {name for _, _, name in stats.stats}
+    assert {"get_attendance", "find_attendance"} <= functions
+    print(f"✓ X-Profile request: Server-Timing {profiled.headers['server-timing']}")
+
+def test_sampling():
+    middleware = ProfilingMiddleware(None, sample_rate=0.25)
+    scope = {"type": "http", "headers": []}
+    with mock.patch("random.random", return_value=0.1):
+        assert middleware.wanted(scope)
+    with mock.patch("random.random", return_value=0.5):
+        assert not middleware.wanted(scope)
+    assert not ProfilingMiddleware(None).wanted(scope)
+    requested = {"type": "http", "headers": [(b"x-profile", b"secret")]}
+    assert ProfilingMiddleware(None, token="secret").wanted(requested)
+    assert not ProfilingMiddleware(None, token="other").wanted(requested)
+    # No token configured: only sampling applies
+    assert not ProfilingMiddleware(None).wanted(requested)
+    print("✓ Requests are profiled on X-Profile with the token, or by sampling")
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, "-s"]))
@@ -0,0 +1,69 @@
+from unittest import mock
+
+import pytest
+
+def seed(client):
+    for i in range(5):
+        client.post("/api/employees", json={
+            "employeeId": f"SPARSE{i:03d}",
+            "fullName": f"Sparse Person {i}",
+            "email": f"sparse.person{i}@company.com",
+            "department": "Design"
+        })
+        for day in ("2024-07-01", "2024-07-02"):
+            client.post("/api/attendance", json={"employeeId": f"SPARSE{i:03d}", "date": day, "status": "Present"})
+
+def pages(client, path, params):
+    rows, cursor = [], None
+    while True:
+        response = client.get(path, params={**params, **({"cursor": cursor} if cursor else {})})
+        assert response.status_code == 200
+        rows += response.json()
+        cursor = response.headers.get("x-next-cursor")
+        if not cursor:
+            return rows
+
+def test_fields_select_keys_and_page(client):
+    seed(client)
+    for path, fields in (
+        ("/api/employees", ["employeeId", "fullName"]),
+        ("/api/employees", ["fullName", "id"]),
+        ("/api/attendance", ["date", "status"]),
+        ("/api/attendance", ["employeeName", "id"]),
+    ):
+        full = client.get(path).json()
+        expected = [{name: row[name] for name in fields} for row in full]
+        sparse = client.get(path, params={"fields": ",".join(fields)}).json()
+        assert sparse == expected
+        assert pages(client, path, {"fields": ",".join(fields), "limit": 3}) == [
+            {name: row[name] for name in fields} for row in pages(client, path, {"limit": 3})
+        ]
+
+    assert client.get("/api/employees", params={"fields": "employeeId,salary"}).status_code == 400
+    assert client.get("/api/attendance", params={"fields": ","}).status_code == 400
+    print("✓ fields= returns only the requested keys, with and without paging")
+
+def test_fields_are_projected_in_storage(client, state):
+    seed(client)
+    find_employees = state.repository.find_employees
+    seen = []
+
+    def record(*args, **kwargs):
+        documents = find_employees(*args, **kwargs)
+        seen.extend(documents)
+        return documents
+
+    with mock.patch.object(state.repository, "find_employees", record):
+        client.get("/api/employees", params={"fields": "employeeId,fullName"})
+    assert seen and all(set(doc) == {"employeeId", "fullName"} for doc in seen)
+
+    # Narrowed listings are separate representations for conditional GET
+    with mock.patch.object(state.settings, "list_etag_max_stale_seconds", 0):
+        full = client.get("/api/employees")
+        sparse = client.get("/api/employees", params={"fields": "fullName"})
+        assert full.headers["etag"] != sparse.headers["etag"]
+        assert client.get("/api/employees", params={"fields": "fullName"}, headers={"If-None-Match": sparse.headers["etag"]}).status_code == 304
+    print("✓ Only the requested fields are read from storage")
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, "-s"]))
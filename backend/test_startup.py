@@ -0,0 +1,65 @@
+import os
+import sys
+import tempfile
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from repositories import LazyRepository
+
+API_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "api")
+
+def test_import_opens_no_connections():
+    connect = mock.Mock(side_effect=AssertionError("connected at import time"))
+    sys.path.insert(0, API_DIR)
+    try:
+        with mock.patch("application.connect_repository", connect):
+            import index
+    finally:
+        sys.path.remove(API_DIR)
+    assert isinstance(index.app, FastAPI) and isinstance(index.app.state.hrms.repository, LazyRepository)
+    assert not connect.called
+    print("✓ Importing api/index.py neither connects nor creates indexes")
+
+def test_repository_per_process():
+    created = []
+
+    def factory():
+        created.append(SimpleNamespace(name=f"repository {len(created)}"))
+        return created[-1]
+
+    repository = LazyRepository(factory)
+    assert not created
+    assert repository.name == "repository 0"
+    assert repository.connect() is created[0] and len(created) == 1
+
+    # A forked worker sees a new PID and builds its own client instead of sharing its parent's
+    with mock.patch("os.getpid", return_value=os.getpid() + 1):
+        assert repository.name == "repository 1"
+    assert len(created) == 2
+    print("✓ The repository is built on first use, once per process")
+
+def test_entry_points_share_one_app():
+    import application
+    api = TestClient(application.create_app(application.Settings.from_env(environment="test")))
+    assert api.get("/").json()["message"] == "HRMS Lite API is running"
+    assert api.get("/api/health").json() == {"status": "healthy", "environment": "test"}
+
+    # main_prod.py serves the React build from "/" next to the same API routes
+    build = tempfile.mkdtemp()
+    with open(os.path.join(build, "index.html"), "w") as f:
+        f.write("<div id=root></div>")
+    site = TestClient(application.create_app(application.Settings.from_env(frontend_build_path=build)))
+    assert site.get("/").text == "<div id=root></div>"
+    assert site.get("/api/health").status_code == 200
+    assert {route.path for route in api.app.routes} - {"/"} <= {route.path for route in site.app.routes}
+    # Each app has its own settings, repository and caches
+    assert site.get("/api/health").json()["environment"] != "test"
+    assert site.app.state.hrms.repository is not api.app.state.hrms.repository
+    print("✓ create_app builds the API and the frontend-serving variant from the same routes")
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, "-s"]))
@@ -0,0 +1,101 @@
+from unittest import mock
+
+import pytest
+
+import application
+
+def seed(client):
+    for i in range(3):
+        client.post("/api/employees", json={
+            "employeeId": f"SYNC{i:03d}",
+            "fullName": f"Sync Person {i}",
+            "email": f"sync.person{i}@company.com",
+            "department": "Payroll"
+        })
+        client.post("/api/attendance", json={"employeeId": f"SYNC{i:03d}", "date": "2024-10-01", "status": "Present"})
+
+def sync_all(client, since=None, limit=1000) -> tuple:
+    pages = []
+    while True:
+        response = client.get("/api/sync", params={"limit": limit, **({"since": since} if since else {})})
+        assert response.status_code == 200
+        page = response.json()
+        pages.append(page)
+        since = page["next"]
+        if not page["hasMore"]:
+            return pages, since
+
+def test_changes_since_a_watermark(client, state):
+    seed(client)
+    with mock.patch.object(state.settings, "sync_settle_seconds", 0):
+        first, since = sync_all(client)
+        assert [e["employeeId"] for e in first[0]["employees"]["upserted"]] == ["SYNC000", "SYNC001", "SYNC002"]
+        assert first[0]["attendance"]["upserted"] == client.get("/api/attendance").json()
+
+        # Nothing new: an empty page and the same watermark
+        unchanged = client.get("/api/sync", params={"since": since}).json()
+        assert unchanged["next"] == since and not unchanged["employees"]["upserted"] and not unchanged["attendance"]["upserted"]
+
+        client.post("/api/attendance", json={"employeeId": "SYNC001", "date": "2024-10-02", "status": "Absent"})
+        employee = next(e for e in client.get("/api/employees").json() if e["employeeId"] == "SYNC002")
+        removed = [a["id"] for a in client.get("/api/attendance", params={"employeeId": "SYNC002"}).json()]
+        client.delete(f"/api/employees/{employee['id']}")
+
+        changes, _ = sync_all(client, since)
+        delta = changes[0]
+        assert [(a["employeeId"], a["date"]) for a in delta["attendance"]["upserted"]] == [("SYNC001", "2024-10-02")]
+        assert delta["employees"] == {"upserted": [], "deleted": [employee["id"]]}
+        # The deleted employee's attendance is purged after the response, leaving tombstones too
+        assert delta["attendance"]["deleted"] == removed
+
+        # Small pages add up to the same changes
+        paged, _ = sync_all(client, limit=2)
+        assert len(paged) > 2
+        assert sorted(e["employeeId"] for page in paged for e in page["employees"]["upserted"]) == ["SYNC000", "SYNC001"]
+        assert sum(len(page["attendance"]["upserted"]) for page in paged) == 3
+
+    assert client.get("/api/sync", params={"since": "not-a-token"}).status_code == 400
+    print("✓ /api/sync returns rows and tombstones after the watermark, page by page")
+
+def test_recent_changes_are_held_back(client, state):
+    seed(client)
+    with mock.patch.object(state.settings, "sync_settle_seconds", 3600):
+        page = client.get("/api/sync").json()
+    assert not page["employees"]["upserted"] and not page["attendance"]["upserted"] and not page["hasMore"]
+    assert page["next"] == client.get("/api/sync", params={"since": page["next"]}).json()["next"]
+    print("✓ Changes younger than SYNC_SETTLE_SECONDS wait for the next call")
+
+def test_backfill_numbers_existing_rows(client, state):
+    seed(client)
+    repository = state.repository.connect()
+    if isinstance(repository, application.MongoRepository):
+        repository.employees.update_many({}, {"$unset": {"seq": ""}})
+    else:
+        repository.connection.execute("UPDATE core_liteemployee SET seq = NULL")
+    assert repository.find_changed("employees", 0, 10) == []
+    assert repository.backfill_sequence() == 3
+    assert repository.backfill_sequence() == 0
+    numbered = repository.find_changed("employees", 0, 10)
+    assert [e["employeeId"] for e in numbered] == ["SYNC000", "SYNC001", "SYNC002"]
+    assert numbered[0]["seq"] > max(a["seq"] for a in repository.find_changed("attendance", 0, 10))
+    print("✓ migrate.py numbers rows written before sync existed")
+
+def test_batches_take_one_block_of_sequence_values(client, state):
+    seed(client)
+    repository = state.repository.connect()
+    before = max(row["seq"] for row in repository.find_changed("attendance", 0, 10))
+    response = client.post("/api/attendance/bulk", json=[
+        {"employeeId": "SYNC000", "date": "2024-10-02", "status": "Present"},
+        {"employeeId": "SYNC000", "date": "2024-10-01", "status": "Absent"},
+        {"employeeId": "SYNC001", "date": "2024-10-02", "status": "Present"},
+    ])
+    assert response.json()["duplicates"] == 1
+    batch = [row["seq"] for row in repository.find_changed("attendance", before, 10)]
+    # The rejected duplicate leaves a gap in the block
+    assert batch == [before + 1, before + 3]
+    client.post("/api/attendance", json={"employeeId": "SYNC002", "date": "2024-10-02", "status": "Present"})
+    assert repository.find_changed("attendance", before + 3, 10)[0]["seq"] > before + 3
+    print("✓ A batch insert numbers its rows from one block, in order")
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, "-s"]))
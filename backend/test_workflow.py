@@ -0,0 +1,40 @@
+import pytest
+
+EMPLOYEES = [
+    {"employeeId": "EMP001", "fullName": "John Doe", "email": "john.doe@company.com", "department": "Engineering"},
+    {"employeeId": "EMP002", "fullName": "Jane Smith", "email": "jane.smith@company.com", "department": "Marketing"},
+]
+
+# The day-to-day flow the frontend drives: add employees, mark attendance, list both, delete an employee
+def test_complete_workflow(client):
+    assert client.get("/api/health").json()["status"] == "healthy"
+
+    created = []
+    for employee in EMPLOYEES:
+        response = client.post("/api/employees", json=employee)
+        assert response.status_code == 200
+        created.append(response.json())
+    assert set(created[0]) == {"id", "employeeId", "fullName", "email", "department", "createdAt"}
+    assert client.post("/api/employees", json=EMPLOYEES[0]).status_code == 400
+    assert client.post("/api/employees", json={**EMPLOYEES[0], "employeeId": "EMP003", "email": "not-an-email"}).status_code == 422
+    assert [e["id"] for e in client.get("/api/employees").json()] == [e["id"] for e in created]
+
+    for employee in EMPLOYEES:
+        response = client.post("/api/attendance", json={"employeeId": employee["employeeId"], "date": "2024-10-01", "status": "Present"})
+        assert response.status_code == 200
+    assert client.post("/api/attendance", json={"employeeId": "EMP001", "date": "2024-10-01", "status": "Absent"}).status_code == 400
+    assert client.post("/api/attendance", json={"employeeId": "EMP999", "date": "2024-10-01", "status": "Present"}).status_code == 404
+    attendance = client.get("/api/attendance").json()
+    assert [(a["employeeId"], a["employeeName"], a["status"]) for a in attendance] == [
+        ("EMP001", "John Doe", "Present"), ("EMP002", "Jane Smith", "Present")
+    ]
+    assert set(attendance[0]) == {"id", "employeeId", "employeeName", "date", "status", "createdAt"}
+
+    assert client.delete(f"/api/employees/{created[0]['id']}").status_code == 200
+    assert client.delete(f"/api/employees/{created[0]['id']}").status_code == 404
+    assert [e["employeeId"] for e in client.get("/api/employees").json()] == ["EMP002"]
+    assert [a["employeeId"] for a in client.get("/api/attendance").json()] == ["EMP002"]
+    print("✓ Employees and attendance can be created, listed and deleted end to end")
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, "-s"]))
@@ -6,6 +6,28 @@ const API_BASE_URL = (
   process.env.REACT_APP_API_URL || "https://hrms-lite-9cb9.vercel.app"
 ).replace(/\/$/, "");
 
+const PAGE_SIZE = 500;
+
+// Follow the API's X-Next-Cursor header, handing each page over as it arrives
+const fetchPages = async (path, onPage) => {
+  let cursor = null;
+  let rows = [];
+  do {
+    const params = { limit: PAGE_SIZE };
+    if (cursor) params.cursor = cursor;
+    const response = await axios.get(`${API_BASE_URL}${path}`, { params });
+    rows = rows.concat(response.data);
+    onPage(rows);
+    cursor = response.headers["x-next-cursor"];
+  } while (cursor);
+};
+
+// Merge pushed rows into a listing, skipping any it already holds
+const addRows = (rows) => (current) => {
+  const known = new Set(current.map((row) => row.id));
+  return current.concat(rows.filter((row) => !known.has(row.id)));
+};
+
 function App() {
   const [activeTab, setActiveTab] = useState("employees");
   const [employees, setEmployees] = useState([]);
@@ -32,17 +54,46 @@ function App() {
     status: "Present",
   });
 
+  // Our own writes are applied from their responses; everyone else's arrive as live
+  // events. addRows skips rows already present, so a write seen both ways is added once
   useEffect(() => {
     fetchEmployees();
     fetchAttendance();
+
+    const events = new EventSource(`${API_BASE_URL}/api/events`);
+    const rows = (event) => JSON.parse(event.data);
+    events.addEventListener("employee.created", (event) =>
+      setEmployees(addRows(rows(event))),
+    );
+    events.addEventListener("attendance.created", (event) =>
+      setAttendance(addRows(rows(event))),
+    );
+    events.addEventListener("employee.deleted", (event) => {
+      const deleted = rows(event);
+      const ids = new Set(deleted.map((row) => row.id));
+      const employeeIds = new Set(deleted.map((row) => row.employeeId));
+      setEmployees((current) => current.filter((row) => !ids.has(row.id)));
+      setAttendance((current) =>
+        current.filter((row) => !employeeIds.has(row.employeeId)),
+      );
+    });
+    events.addEventListener("attendance.deleted", (event) => {
+      const ids = new Set(rows(event).map((row) => row.id));
+      setAttendance((current) => current.filter((row) => !ids.has(row.id)));
+    });
+    // Missed too many events to catch up from: start over
+    events.addEventListener("reset", () => {
+      fetchEmployees();
+      fetchAttendance();
+    });
+    return () => events.close();
   }, []);
 
   const fetchEmployees = async () => {
     setLoading(true);
     setError("");
     try {
-      const response = await axios.get(`${API_BASE_URL}/api/employees`);
-      setEmployees(response.data);
+      await fetchPages("/api/employees", setEmployees);
     } catch (err) {
       setError("Failed to fetch employees");
       console.error("Error fetching employees:", err);
@@ -53,8 +104,7 @@ function App() {
 
   const fetchAttendance = async () => {
     try {
-      const response = await axios.get(`${API_BASE_URL}/api/attendance`);
-      setAttendance(response.data);
+      await fetchPages("/api/attendance", setAttendance);
     } catch (err) {
       console.error("Error fetching attendance:", err);
     }
@@ -66,14 +116,17 @@ function App() {
     setError("");
 
     try {
-      await axios.post(`${API_BASE_URL}/api/employees`, employeeForm);
+      const response = await axios.post(
+        `${API_BASE_URL}/api/employees`,
+        employeeForm,
+      );
+      setEmployees(addRows([response.data]));
       setEmployeeForm({
         employeeId: "",
         fullName: "",
         email: "",
         department: "",
       });
-      fetchEmployees();
     } catch (err) {
       setError(err.response?.data?.message || "Failed to create employee");
       console.error("Error creating employee:", err);
@@ -90,10 +143,13 @@ function App() {
     if (!deleteModal.employee) return;
 
     try {
-      await axios.delete(
-        `${API_BASE_URL}/api/employees/${deleteModal.employee.id}`,
+      const { id, employeeId } = deleteModal.employee;
+      await axios.delete(`${API_BASE_URL}/api/employees/${id}`);
+      // The server removes the employee's attendance as well
+      setEmployees((current) => current.filter((row) => row.id !== id));
+      setAttendance((current) =>
+        current.filter((row) => row.employeeId !== employeeId),
       );
-      fetchEmployees();
       setDeleteModal({ isOpen: false, employee: null });
     } catch (err) {
       setError("Failed to delete employee");
@@ -127,12 +183,15 @@ function App() {
     }
 
     try {
-      await axios.post(`${API_BASE_URL}/api/attendance`, attendanceForm);
+      const response = await axios.post(
+        `${API_BASE_URL}/api/attendance`,
+        attendanceForm,
+      );
+      setAttendance(addRows([response.data]));
       setAttendanceForm({
         ...attendanceForm,
         date: new Date().toISOString().split("T")[0],
       });
-      fetchAttendance();
     } catch (err) {
       setError(err.response?.data?.message || "Failed to mark attendance");
       console.error("Error marking attendance:", err);